@@ -5,6 +5,7 @@ import time
 import logging
 import anchor.system as system
 import anchor.compile as compile
+import anchor.check as check
 import anchor.builtins as builtins
 
 
@@ -34,6 +35,72 @@ def readcommand(argv: typing.List[str]) -> typing.Dict[str, typing.Any]:
         help=default('debug yacc'), default=False
     )
     
+    parser.add_option(
+        '--no-optimize', action='store_false', dest='optimize',
+        help=default('disable optimization'), default=True
+    )
+
+    parser.add_option(
+        '--stats', action='store_true', dest='stats',
+        help=default('print runtime statistics'), default=False
+    )
+
+    parser.add_option(
+        '--stream', action='store_true', dest='stream',
+        help=default('evaluate statements as they are parsed'),
+        default=False
+    )
+
+    parser.add_option(
+        '--lazy', action='store_true', dest='lazy',
+        help=default('parse function bodies on first call'), default=False
+    )
+
+    parser.add_option(
+        '--hashcons', action='store_true', dest='hashcons',
+        help=default('share structurally identical expressions'),
+        default=False
+    )
+
+    parser.add_option(
+        '--flat', action='store_true', dest='flat',
+        help=default('load the program through its flat encoding'),
+        default=False
+    )
+
+    parser.add_option(
+        '--backend', type='choice', choices=['lalr', 'pratt'],
+        dest='backend', help=default('parser backend, lalr or pratt'),
+        default='lalr'
+    )
+
+    parser.add_option(
+        '--jobs', type='int', dest='jobs',
+        help=default('lex large sources in this many worker processes'),
+        default=0
+    )
+
+    parser.add_option(
+        '--profile-out', dest='profileout',
+        help=default(
+            'record a runtime profile of this run to a file, '
+            'function bodies deferred by --lazy are not profiled'
+        ),
+        default=None
+    )
+
+    parser.add_option(
+        '--profile-in', dest='profilein',
+        help=default('optimize with a profile an earlier run recorded'),
+        default=None
+    )
+
+    parser.add_option(
+        '--check', action='store_true', dest='check',
+        help=default('check names, arities and types, then run unchecked'),
+        default=False
+    )
+
     parser.add_option(
         '--input-stream', dest='inputstream',
         help=default('input stream'), default='stdin'
@@ -65,6 +132,12 @@ def readcommand(argv: typing.List[str]) -> typing.Dict[str, typing.Any]:
         parser.error('no input file')
     if (len(other) > 1):
         parser.error('Command line input not understood: ' + str(other[1:]))
+    if (options.profileout and options.profilein):
+        parser.error('--profile-out and --profile-in are separate runs')
+    if (options.stream and (options.profileout or options.profilein)):
+        parser.error('profiles need the whole program, not --stream')
+    if (options.stream and options.check):
+        parser.error('--check needs the whole program, not --stream')
 
     args = dict()
     args['file'] = other[0]
@@ -78,6 +151,19 @@ def readcommand(argv: typing.List[str]) -> typing.Dict[str, typing.Any]:
             system.GLOBAL.debuglex = options.debuglex
             system.GLOBAL.debugyacc = options.debugyacc
 
+    # Optimization, statistics and parsing flags
+    system.GLOBAL.optimize = options.optimize
+    system.GLOBAL.stats = options.stats
+    system.GLOBAL.stream = options.stream
+    system.GLOBAL.lazy = options.lazy
+    system.GLOBAL.hashcons = options.hashcons
+    system.GLOBAL.flat = options.flat
+    system.GLOBAL.backend = options.backend
+    system.GLOBAL.jobs = options.jobs
+    system.GLOBAL.profilein = options.profilein
+    system.GLOBAL.profileout = options.profileout
+    system.GLOBAL.check = options.check
+
     # Log stream
     logstream = None
     if (options.logfile):
@@ -135,6 +221,16 @@ def readfile(file) -> str:
 def main() -> typing.Any:
     args = readcommand(sys.argv)
     data = readfile(**args)
-    return compile.execute(data)
-
-main()
+    try:
+        result = compile.execute(data)
+    except check.CheckError as error:
+        # Nothing has run, report every error at once
+        for message in error.errors:
+            system.GLOBAL.errorstream.write(f'Check: {message}\n')
+        sys.exit(1)
+    if (system.GLOBAL.stats):
+        compile.report(system.GLOBAL.errorstream)
+    return result
+
+if (__name__ == '__main__'):
+    main()
@@ -1,8 +1,10 @@
 import abc
 import typing
+import operator
 import anchor.builtins as builtins
 import anchor.symtable as symtable
 import anchor.factory as factory
+import anchor.token as token
 
 
 __all__: typing.List[str] = list()
@@ -28,9 +30,6 @@ class Iterable(abc.ABC):
     @abc.abstractmethod
     def __iter__(self): pass
 
-    @abc.abstractmethod
-    def __next__(self): pass
-
     @abc.abstractmethod
     def __getitem__(self, key): pass
 
@@ -41,6 +40,52 @@ class Callable(abc.ABC):
     def call(self, arguments, st): pass
 
 
+class Adaptive(abc.ABC):
+
+    # Evaluations with one operand type before a node quickens itself
+    threshold: int = 8
+
+    # Guard failures after which a node stays generic
+    limit: int = 4
+
+    __operandtype: typing.Type = None
+    __count: int = 0
+    __failures: int = 0
+
+    def observe(self, left: Atom, right: Atom) -> None:
+        if (self.__failures >= self.limit):
+            return
+        operandtype: typing.Type = type(left.value)
+        if (operandtype is not type(right.value)):
+            self.__count = 0
+            return
+        elif (operandtype is not self.__operandtype):
+            self.__operandtype = operandtype
+            self.__count = 0
+        self.__count += 1
+        if (self.__count < self.threshold):
+            return
+        self.quicken(operandtype)
+
+    def quicken(self, operandtype: typing.Type) -> None:
+        specialized: typing.Type = \
+            SPECIALIZED.get(tuple((type(self), operandtype,)))
+        if (specialized is None):
+            # Nothing to quicken into, stop observing
+            self.__failures = self.limit
+            return
+        self.__class__ = specialized
+        count(STATISTICS['specialized'], specialized.__name__)
+
+    def despecialize(self) -> None:
+        specialized: typing.Type = type(self)
+        self.__class__ = specialized.__bases__[-1]
+        self.__operandtype = None
+        self.__count = 0
+        self.__failures += 1
+        count(STATISTICS['despecialized'], specialized.__name__)
+
+
 class Expression(ASTNode):
 
     @abc.abstractmethod
@@ -74,6 +119,35 @@ class Block(ASTNode):
         return None
 
 
+class LazyBlock(Block):
+
+    def __init__(
+        self, source: str, lineno: int,
+        loader: typing.Callable[[str, int], Block]
+    ) -> None:
+        super().__init__(list())
+        self.__source: str = source
+        self.__lineno: int = lineno
+        self.__loader: typing.Callable[[str, int], Block] = loader
+        self.__block: Block = None
+
+    @property
+    def source(self) -> str:
+        return self.__source
+
+    @property
+    def lineno(self) -> int:
+        return self.__lineno
+
+    @property
+    def statements(self) -> typing.List[Statement]:
+        # Parse the body the first time it runs
+        if (self.__block is None):
+            self.__block = self.__loader(self.__source, self.__lineno)
+            self.__source = None
+        return self.__block.statements
+
+
 class Program(ASTNode):
 
     def __init__(self, block: Block) -> None:
@@ -98,8 +172,7 @@ class Name(Expression):
         return self.__identifier
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        symbol: symtable.Symbol = st.lookup(self.identifier)
-        astnode: ASTNode = symbol.astnode
+        astnode: ASTNode = st.resolve(self.identifier)
         return astnode
 
 
@@ -119,13 +192,33 @@ class Assignment(Statement):
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
         identifier: str = self.name.identifier
-        astnode = self.expression.evaluate(st)
-        astnodes: typing.List[ASTNode] = list([astnode])
-        symbol = st.lookup(identifier)
-        if (symbol and symbol.kwargs.get('isproperty', False)):
-            symbol.symtable.insert(identifier, astnodes)
+        astnode: ASTNode = self.expression.evaluate(st)
+        st.assign(identifier, astnode)
+        return None
+
+
+class DotAssignment(Statement):
+
+    def __init__(self, dotname: 'DotName', expression: Expression) -> None:
+        self.__dotname: DotName = dotname
+        self.__expression: Expression = expression
+
+    @property
+    def dotname(self) -> 'DotName':
+        return self.__dotname
+
+    @property
+    def expression(self) -> Expression:
+        return self.__expression
+
+    def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
+        astnode: ASTNode = self.expression.evaluate(st)
+        instance: Instance = self.dotname.expression.evaluate(st)
+        index: int = self.dotname.offset(instance)
+        if (index is None):
+            instance.assign(self.dotname.name.identifier, astnode)
         else:
-            st.insert(identifier, astnodes)
+            instance.values[index] = astnode
         return None
 
 
@@ -160,30 +253,36 @@ class Continue(Statement):
 class Return(Statement, Atom):
 
     __expression: Expression = None
-    __value: builtins.Type = None
+    __astnode: ASTNode = None
 
     def __init__(
-        self, expression: Expression = None, value: builtins.Type = None
+        self, expression: Expression = None, astnode: ASTNode = None
     ) -> None:
         self.__expression = expression
-        self.__value = value
+        self.__astnode = astnode
 
     @property
     def expression(self) -> Expression:
         return self.__expression
 
+    @property
+    def astnode(self) -> ASTNode:
+        return self.__astnode
+
     @property
     def value(self) -> builtins.Type:
-        return self.__value
+        if (self.astnode is None):
+            return None
+        return self.astnode.value
 
     def copy(self) -> ASTNode:
-        return Return(value=self.value)
+        return Return(astnode=self.astnode)
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        if (self.expression is not None):
-            atom: Atom = self.expression.evaluate(st)
-            self.__value = atom.value
-        return self.copy()
+        if (self.expression is None):
+            return self
+        astnode: ASTNode = self.expression.evaluate(st)
+        return Return(astnode=astnode)
 
 
 class Elif(Statement):
@@ -260,14 +359,55 @@ class If(Statement):
             return None
 
 
+class Switch(Statement):
+
+    def __init__(
+        self, name: Name, cases: typing.Dict[builtins.Type, Block],
+        elseblock: Block = None
+    ) -> None:
+        self.__name: Name = name
+        self.__cases: typing.Dict[builtins.Type, Block] = cases
+        self.__elseblock: Block = elseblock
+
+    @property
+    def name(self) -> Name:
+        return self.__name
+
+    @property
+    def cases(self) -> typing.Dict[builtins.Type, Block]:
+        return self.__cases
+
+    @property
+    def elseblock(self) -> Block:
+        return self.__elseblock
+
+    def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
+        value: builtins.Type = self.name.evaluate(st).value
+        try:
+            block: Block = self.cases.get(value, self.elseblock)
+        except TypeError:
+            # Unhashable value, compare against each case in order
+            block: Block = self.elseblock
+            for case, caseblock in self.cases.items():
+                if (value == case):
+                    block = caseblock
+                    break
+        if (block is None):
+            return None
+        astnode: ASTNode = block.evaluate(st)
+        return astnode
+
+
 class Iterate(Statement):
 
     def __init__(
-        self, iterable: Expression, variable: Name, block: Block
+        self, iterable: Expression, variable: Name, block: Block,
+        preheader: Block = None
     ) -> None:
         self.__iterable: Expression = iterable
         self.__variable: Name = variable
         self.__block: Block = block
+        self.__preheader: Block = preheader
 
     @property
     def iterable(self) -> Expression:
@@ -281,13 +421,22 @@ class Iterate(Statement):
     def block(self) -> Block:
         return self.__block
 
+    @property
+    def preheader(self) -> Block:
+        return self.__preheader
+
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
         identifier: str = self.variable.identifier
+        preheader: Block = self.preheader
         for item in self.iterable.evaluate(st):
             itemnode: ASTNode = item
             astnode: ASTNode = itemnode.evaluate(st)
             astnodes: typing.List[ASTNode] = list([astnode])
             st.insert(identifier, astnodes)
+            if (preheader):
+                # Hoisted invariants, only once the loop is entered
+                preheader.evaluate(st)
+                preheader = None
             astnode: ASTNode = self.block.evaluate(st)
             if (isinstance(astnode, Return)):
                 return astnode
@@ -300,9 +449,12 @@ class Iterate(Statement):
 
 class Loop(Statement):
 
-    def __init__(self, expression: Expression, block: Block) -> None:
+    def __init__(
+        self, expression: Expression, block: Block, preheader: Block = None
+    ) -> None:
         self.__expression: Expression = expression
         self.__block: Block = block
+        self.__preheader: Block = preheader
 
     @property
     def expression(self) -> Expression:
@@ -312,8 +464,15 @@ class Loop(Statement):
     def block(self) -> Block:
         return self.__block
 
+    @property
+    def preheader(self) -> Block:
+        return self.__preheader
+
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
         condition: Atom = self.expression.evaluate(st)
+        if (condition.value and self.preheader):
+            # Hoisted invariants, only once the loop is entered
+            self.preheader.evaluate(st)
         while (condition.value):
             astnode: ASTNode = self.block.evaluate(st)
             condition = self.expression.evaluate(st)
@@ -341,15 +500,12 @@ class Parameter(Statement):
         return self.__typename
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        symbol: symtable.Symbol = st.lookup(self.name.identifier)
-        astnode: ASTNode = symbol.astnode
+        astnode: ASTNode = st.resolve(self.name.identifier)
         return astnode
 
 
 class FunctionDef(Statement, Atom, Callable):
 
-    __value: builtins.Function = None
-
     def __init__(
         self, name: Name, parameters: typing.List[Parameter], block: Block,
         **kwargs
@@ -358,6 +514,13 @@ class FunctionDef(Statement, Atom, Callable):
         self.__parameters: typing.List[Parameter] = parameters
         self.__block: Block = block
         self.__kwargs: typing.Dict[str, typing.Any] = kwargs
+        self.__value: builtins.Function = builtins.Function()
+
+        # Frame slot of each parameter
+        self.__layout: typing.Dict[str, int] = dict({
+            parameter.name.identifier: index
+            for index, parameter in enumerate(parameters)
+        })
 
     @property
     def name(self) -> Name:
@@ -381,63 +544,99 @@ class FunctionDef(Statement, Atom, Callable):
 
     def call(
             self,
-            arguments: typing.List[Expression],
+            arguments: typing.List[ASTNode],
             parentst: symtable.SymbolTable) -> ASTNode:
-        parameters: typing.List[Parameter] = self.parameters
         block: Block = self.block
-        functionst: symtable.Function = factory.SYMTABLE.new(
-            symtable.Type.FUNCTION,
-            identifier=self.name.identifier, parent=parentst,
-        )
 
-        # Insert symbols for arguments
-        for index in range(len(parameters)):
-            parameter: Parameter = parameters[index]
-            identifier: str = parameter.name.identifier
-            argument: Expression = arguments[index]
-            astnode: ASTNode = argument.evaluate(parentst)
-            astnodes: typing.List[ASTNode] = list([astnode])
-            functionst.insert(identifier, astnodes, isparameter=True)
+        # Arguments are the frame slots of the parameters
+        functionst: symtable.Frame = symtable.Frame.new(
+            self.name.identifier, self.__layout, arguments, parent=parentst,
+        )
 
         # Evaluate function block
-        isbuiltin = self.kwargs.get('isbuiltin', False)
-        if (isbuiltin):
-            functionpointer: typing.Callable = self.kwargs.get('pointer')
-            args: typing.Dict[str, builtins.Type] = dict()
-            for parameter in parameters:
-                value: builtins.Type = parameter.evaluate(functionst).value
-                args[parameter.name.identifier] = value
-            returnvalue: typing.Any = functionpointer(**args)
-            return factory.AST.new(value=returnvalue)
-        else:
-            astnode: ASTNode = block.evaluate(functionst)
-            return astnode
+        astnode: ASTNode = block.evaluate(functionst)
+        functionst.release()
+        if (isinstance(astnode, Return)):
+            return astnode.astnode
+        return NULL
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        self.__value = builtins.Function()
         identifier: str = self.name.identifier
         astnodes: typing.List[ASTNode] = list([self])
         st.insert(identifier, astnodes)
         return self
 
 
-class Property(Statement, Atom):
+class NativeFunction(Expression, Atom, Callable):
+
+    def __init__(self, name: Name, pointer: typing.Callable) -> None:
+        self.__name: Name = name
+        self.__pointer: typing.Callable = pointer
+        self.__arity: int = pointer.__code__.co_argcount
+        self.__value: builtins.Function = builtins.Function(isbuiltin=True)
 
-    __value: builtins.Property = None
+    @property
+    def name(self) -> Name:
+        return self.__name
+
+    @property
+    def pointer(self) -> typing.Callable:
+        return self.__pointer
+
+    @property
+    def arity(self) -> int:
+        return self.__arity
+
+    @property
+    def value(self) -> builtins.Function:
+        return self.__value
+
+    def invoke(self, values: typing.List[builtins.Type]) -> ASTNode:
+        if (len(values) != self.__arity):
+            raise TypeError(
+                f'{self.name.identifier}() takes {self.__arity} '
+                f'argument(s) but {len(values)} were given'
+            )
+        returnvalue: typing.Any = self.__pointer(*values)
+        if (returnvalue is None):
+            return NONE
+        return factory.AST.new(value=returnvalue)
+
+    def call(
+            self,
+            arguments: typing.List[ASTNode],
+            parentst: symtable.SymbolTable) -> ASTNode:
+        parentst
+        values: typing.List[builtins.Type] = list([
+            argument.value for argument in arguments
+        ])
+        return self.invoke(values)
+
+    def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
+        st
+        return self
+
+
+class Property(Statement, Atom):
 
-    def __init__(self, name: Name) -> None:
+    def __init__(self, name: Name, typename: Name = None) -> None:
         self.__name: Name = name
+        self.__typename: Name = typename
+        self.__value: builtins.Property = builtins.Property()
 
     @property
     def name(self) -> Name:
         return self.__name
 
+    @property
+    def typename(self) -> Name:
+        return self.__typename
+
     @property
     def value(self) -> builtins.Property:
         return self.__value
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        self.__value = "DEBUG!!!"
         identifier: str = self.name.identifier
         astnodes: typing.List[ASTNode] = list([self])
         st.insert(identifier, astnodes, isproperty=True)
@@ -446,8 +645,6 @@ class Property(Statement, Atom):
 
 class MethodDef(Statement, Atom, Callable):
 
-    __value: builtins.Method = None
-
     def __init__(
         self, name: Name,
         parameters: typing.List[Parameter],
@@ -458,6 +655,13 @@ class MethodDef(Statement, Atom, Callable):
         self.__parameters: typing.List[Parameter] = parameters
         self.__block: Block = block
         self.__kwargs: typing.Dict[str, typing.Any] = kwargs
+        self.__value: builtins.Method = builtins.Method()
+
+        # Frame slot of each parameter
+        self.__layout: typing.Dict[str, int] = dict({
+            parameter.name.identifier: index
+            for index, parameter in enumerate(parameters)
+        })
 
     @property
     def name(self) -> Name:
@@ -481,44 +685,36 @@ class MethodDef(Statement, Atom, Callable):
 
     def call(
             self,
-            arguments: typing.List[Expression],
+            arguments: typing.List[ASTNode],
             parentst: symtable.SymbolTable) -> ASTNode:
-        parameters: typing.List[Parameter] = self.parameters
         block: Block = self.block
-        methodst: symtable.Function = factory.SYMTABLE.new(
-            symtable.Type.FUNCTION,
-            identifier=self.name.identifier, parent=parentst,
-        )
 
-        # Insert symbols for arguments
-        for index in range(len(parameters)):
-            parameter: Parameter = parameters[index]
-            identifier: str = parameter.name.identifier
-            argument: Expression = arguments[index]
-            astnode: ASTNode = argument.evaluate(parentst)
-            astnodes: typing.List[ASTNode] = list([astnode])
-            methodst.insert(identifier, astnodes, isparameter=True)
+        # Arguments are the frame slots of the parameters
+        methodst: symtable.Frame = symtable.Frame.new(
+            self.name.identifier, self.__layout, arguments, parent=parentst,
+        )
 
         # Evaluate method block
         astnode: ASTNode = block.evaluate(methodst)
-        return astnode
+        methodst.release()
+        if (isinstance(astnode, Return)):
+            return astnode.astnode
+        return NULL
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        self.__value = builtins.Method()
         identifier: str = self.name.identifier
         astnodes: typing.List[ASTNode] = list([self])
         st.insert(identifier, astnodes, ismethod=True)
         return self
 
 
-class ClassDef(Statement, Atom, Callable):
-
-    __value: builtins.Class = None
+class ClassDef(Statement, Atom):
 
     def __init__(self, name: Name, block: Block, **kwargs) -> None:
         self.__name: Name = name
         self.__block: Block = block
         self.__kwargs: typing.Dict[str, typing.Any] = kwargs
+        self.__value: builtins.Class = builtins.Class()
 
         self.__properties: typing.Dict[str, Property] = dict()
         self.__methods: typing.Dict[str, MethodDef] = dict()
@@ -530,12 +726,18 @@ class ClassDef(Statement, Atom, Callable):
                 identifier = statement.name.identifier
                 self.__methods[identifier] = statement
 
+        # Instance slot of each property
+        self.__layout: typing.Dict[str, int] = dict({
+            identifier: index
+            for index, identifier in enumerate(self.__properties)
+        })
+
         # default factory
         if (name.identifier not in self.__methods):
             parameters = list()
             block = Block(list())
             self.__methods[name.identifier] = \
-                MethodDef(name, parameters, block, list())
+                MethodDef(name, parameters, block)
 
     @property
     def name(self) -> Name:
@@ -557,67 +759,110 @@ class ClassDef(Statement, Atom, Callable):
     def methods(self) -> typing.Dict[str, MethodDef]:
         return self.__methods
 
+    @property
+    def layout(self) -> typing.Dict[str, int]:
+        return self.__layout
+
     @property
     def value(self) -> builtins.Class:
         return self.__value
 
+    def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
+        identifier: str = self.name.identifier
+        methodst: symtable.Class = factory.SYMTABLE.new(
+            symtable.Type.CLASS, identifier=identifier, parent=st,
+        )
+
+        # Insert symbols for methods, shared by every instance
+        for _, method in self.methods.items():
+            method.evaluate(methodst)
+
+        # The method table outlives this scope
+        st.retain()
+        astnodes: typing.List[ASTNode] = list([Class(self, methodst)])
+        st.insert(identifier, astnodes)
+        return self
+
+
+class Class(Statement, Atom, Callable):
+
+    def __init__(self, classdef: ClassDef, methodst: symtable.Class) -> None:
+        self.__classdef: ClassDef = classdef
+        self.__methodst: symtable.Class = methodst
+        self.__constructor: MethodDef = \
+            methodst.resolve(classdef.name.identifier)
+
+    @property
+    def classdef(self) -> ClassDef:
+        return self.__classdef
+
+    @property
+    def methodst(self) -> symtable.Class:
+        return self.__methodst
+
+    @property
+    def constructor(self) -> MethodDef:
+        return self.__constructor
+
+    @property
+    def value(self) -> builtins.Class:
+        return self.__classdef.value
+
     def call(
             self,
-            arguments: typing.List[Expression],
+            arguments: typing.List[ASTNode],
             parentst: symtable.SymbolTable) -> ASTNode:
-        properties: typing.Dict[str, Property] = self.properties
-        methods: typing.Dict[str, MethodDef] = self.methods
-        instancest: symtable.Class = factory.SYMTABLE.new(
-            symtable.Type.CLASS,
-            identifier=self.name.identifier, parent=parentst,
-        )
+        parentst
+        classdef: ClassDef = self.__classdef
 
-        # Insert symbols for properties
-        for _, prop in properties.items():
-            prop.evaluate(instancest)
-
-        # Insert symbols for methods
-        for _, method in methods.items():
-            method.evaluate(instancest)
+        # Properties start as Null in their slots
+        values: typing.List[ASTNode] = list([NULL]) * len(classdef.layout)
+        instance: Instance = Instance(
+            classdef, classdef.layout, values, parent=self.__methodst,
+        )
 
         # Evaluate constructor
-        call: Call = Call(Name(self.name.identifier), arguments)
-        call.evaluate(instancest)
+        self.__constructor.call(arguments, instance)
 
         # Return class instance
-        return Instance(self, instancest)
+        return instance
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        self.__value = builtins.Class()
-        identifier: str = self.name.identifier
-        astnodes: typing.List[ASTNode] = list([self])
-        st.insert(identifier, astnodes)
+        st
         return self
 
 
-class Instance(Statement, Atom):
+class Instance(symtable.Instance, Statement, Atom):
 
     __value: builtins.Instance = None
 
-    def __init__(self, classdef: ClassDef, instancest: symtable.Class) -> None:
+    def __init__(
+        self, classdef: ClassDef, layout: typing.Dict[str, int],
+        values: typing.List[ASTNode], parent: symtable.Class = None
+    ) -> None:
+        super().__init__(
+            classdef.name.identifier, layout, values, parent=parent
+        )
         self.__classdef: ClassDef = classdef
-        self.__instancest = instancest
 
     @property
     def classdef(self) -> ClassDef:
         return self.__classdef
 
     @property
-    def instancest(self) -> symtable.Class:
-        return self.__instancest
+    def instancest(self) -> symtable.Instance:
+        # An instance is the symbol table of its own properties
+        return self
 
     @property
     def value(self) -> builtins.Instance:
+        # Runtime object, safe to fill in on first use
+        if (self.__value is None):
+            self.__value = builtins.Instance(self.classdef.value)
         return self.__value
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
         st
-        self.__value = builtins.Instance(self.classdef.value)
         return self
 
 
@@ -681,7 +926,7 @@ class Not(Expression):
         return astnode
 
 
-class EqEqual(Expression):
+class EqEqual(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -699,11 +944,12 @@ class EqEqual(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value == right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class NotEqual(Expression):
+class NotEqual(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -721,11 +967,12 @@ class NotEqual(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value != right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class Less(Expression):
+class Less(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -743,11 +990,12 @@ class Less(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value < right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class LessEqual(Expression):
+class LessEqual(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -765,11 +1013,12 @@ class LessEqual(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value <= right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class Greater(Expression):
+class Greater(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -787,11 +1036,12 @@ class Greater(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value > right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class GreaterEqual(Expression):
+class GreaterEqual(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -809,11 +1059,12 @@ class GreaterEqual(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value >= right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class Plus(Expression):
+class Plus(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -831,11 +1082,12 @@ class Plus(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value + right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class Minus(Expression):
+class Minus(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -853,11 +1105,12 @@ class Minus(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value - right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class Star(Expression):
+class Star(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -875,6 +1128,7 @@ class Star(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value * right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
@@ -901,7 +1155,7 @@ class DoubleStar(Expression):
         return astnode
 
 
-class Slash(Expression):
+class Slash(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -919,11 +1173,12 @@ class Slash(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value / right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class DoubleSlash(Expression):
+class DoubleSlash(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -941,11 +1196,12 @@ class DoubleSlash(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value // right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
 
-class Percent(Expression):
+class Percent(Expression, Adaptive):
 
     def __init__(self, left: Expression, right: Expression) -> None:
         self.__left: Expression = left
@@ -963,6 +1219,7 @@ class Percent(Expression):
         left: Atom = self.left.evaluate(st)
         right: Atom = self.right.evaluate(st)
         value: typing.Any = left.value % right.value
+        self.observe(left, right)
         astnode: Expression = factory.AST.new(value=value)
         return astnode
 
@@ -1066,12 +1323,8 @@ class String(Expression, Atom, Iterable):
         return self.__value
 
     def __iter__(self):
-        self.iter = self.value.__iter__()
-        return self
-
-    def __next__(self):
-        item = self.iter.__next__()
-        return factory.AST.new(value=item)
+        for item in self.value:
+            yield factory.AST.new(value=item)
 
     def __getitem__(self, key):
         item = self.value.__getitem__(key)
@@ -1183,29 +1436,20 @@ class Tuple(Expression, Atom, Iterable):
         return self.__value
 
     def __iter__(self):
-        self.iter = self.value.__iter__()
-        return self
-
-    def __next__(self):
-        item = self.iter.__next__()
-        return factory.AST.new(value=item)
+        for item in self.value:
+            yield factory.AST.new(value=item)
 
     def __getitem__(self, key):
         item = self.value.__getitem__(key)
         return factory.AST.new(value=item)
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        if (self.expressions is not None):
-            atoms: typing.List[Atom] = list([
-                expression.evaluate(st)
-                for expression in self.expressions
-            ])
-            self.__value = builtins.Tuple(tuple(map(
-                lambda x: x.value, atoms
-            )))
-        elif (self.value is not None):
-            pass
-        return self
+        if (self.expressions is None):
+            return self
+        values: typing.Tuple = tuple(
+            expression.evaluate(st).value for expression in self.expressions
+        )
+        return Tuple(value=values)
 
 
 class List(Expression, Atom, Iterable):
@@ -1231,29 +1475,20 @@ class List(Expression, Atom, Iterable):
         return self.__value
 
     def __iter__(self):
-        self.iter = self.value.__iter__()
-        return self
-
-    def __next__(self):
-        item = self.iter.__next__()
-        return factory.AST.new(value=item)
+        for item in self.value:
+            yield factory.AST.new(value=item)
 
     def __getitem__(self, key):
         item = self.value.__getitem__(key)
         return factory.AST.new(value=item)
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        if (self.expressions is not None):
-            atoms: typing.List[Atom] = list([
-                expression.evaluate(st)
-                for expression in self.expressions
-            ])
-            self.__value = builtins.List(list(map(
-                lambda x: x.value, atoms
-            )))
-        elif (self.value is not None):
-            pass
-        return self
+        if (self.expressions is None):
+            return self
+        values: typing.List = list([
+            expression.evaluate(st).value for expression in self.expressions
+        ])
+        return List(value=values)
 
 
 class Dict(Expression, Atom, Iterable):
@@ -1280,29 +1515,21 @@ class Dict(Expression, Atom, Iterable):
         return self.__value
 
     def __iter__(self):
-        self.iter = self.value.__iter__()
-        return self
-
-    def __next__(self):
-        item = self.iter.__next__()
-        return factory.AST.new(value=item)
+        for item in self.value:
+            yield factory.AST.new(value=item)
 
     def __getitem__(self, key):
         item = self.value.__getitem__(key)
         return factory.AST.new(value=item)
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        if (self.kvpairs is not None):
-            atoms: typing.Dict[Atom, Atom] = dict({
-                k.evaluate(st): v.evaluate(st)
-                for k, v in self.kvpairs
-            })
-            self.__value = builtins.Dict(dict(map(
-                lambda item: (item[0].value, item[1].value), atoms.items()
-            )))
-        elif (self.value is not None):
-            pass
-        return self
+        if (self.kvpairs is None):
+            return self
+        values: typing.Dict = dict({
+            k.evaluate(st).value: v.evaluate(st).value
+            for k, v in self.kvpairs
+        })
+        return Dict(value=values)
 
 
 class DotName(Expression):
@@ -1311,6 +1538,10 @@ class DotName(Expression):
         self.__expression: Expression = expression
         self.__name: Name = name
 
+        # Inline cache of the last seen property layout and its slot
+        self.__cache: typing.Tuple[typing.Dict[str, int], int] = \
+            tuple((None, None,))
+
     @property
     def expression(self) -> Expression:
         return self.__expression
@@ -1319,9 +1550,22 @@ class DotName(Expression):
     def name(self) -> Name:
         return self.__name
 
+    def offset(self, instance: Instance) -> int:
+        layout: typing.Dict[str, int] = instance.layout
+        cache: typing.Tuple[typing.Dict[str, int], int] = self.__cache
+        if (cache[0] is layout):
+            return cache[1]
+        index: int = layout.get(self.name.identifier)
+        if (index is not None):
+            self.__cache = tuple((layout, index,))
+        return index
+
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
-        st
-        return self
+        instance: Instance = self.expression.evaluate(st)
+        index: int = self.offset(instance)
+        if (index is None):
+            return instance.resolve(self.name.identifier)
+        return instance.values[index]
 
 
 class Call(Expression):
@@ -1342,23 +1586,313 @@ class Call(Expression):
 
     def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
         astnode: ASTNode = None
+        callst: symtable.SymbolTable = st
         if (isinstance(self.expression, Name)):
             name: Name = self.expression
             identifier: str = name.identifier
-            astnode = st.lookup(identifier).astnode
+            astnode = st.resolve(identifier)
+            if (type(astnode) is NativeFunction):
+                # Builtins take plain values, no frame is needed
+                values: typing.List[builtins.Type] = list([
+                    argument.evaluate(st).value
+                    for argument in self.arguments
+                ])
+                return astnode.invoke(values)
         elif (isinstance(self.expression, DotName)):
             dotname: DotName = self.expression
-            instancename: Name = dotname.expression
-            instance: Instance = st.lookup(instancename.identifier).astnode
-            st = instance.instancest
+            instance: Instance = dotname.expression.evaluate(st)
+            callst = instance.instancest
             name: Name = dotname.name
             identifier: str = name.identifier
-            astnode = st.lookup(identifier).astnode
+            astnode = callst.resolve(identifier)
         else:
             astnode = self.expression.evaluate(st)
 
         if (isinstance(astnode, Callable)):
-            return astnode.call(self.arguments, st)
+            arguments: typing.List[ASTNode] = list([
+                argument.evaluate(st) for argument in self.arguments
+            ])
+            return astnode.call(arguments, callst)
+
+
+class Let(Expression):
+
+    def __init__(
+        self, bindings: typing.List[typing.Tuple[Name, Expression]],
+        expression: Expression
+    ) -> None:
+        self.__bindings: typing.List[typing.Tuple[Name, Expression]] = \
+            bindings
+        self.__expression: Expression = expression
+
+    @property
+    def bindings(self) -> typing.List[typing.Tuple[Name, Expression]]:
+        return self.__bindings
+
+    @property
+    def expression(self) -> Expression:
+        return self.__expression
+
+    def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
+        # Bind in order, like the arguments of the call it replaces
+        for name, expression in self.bindings:
+            astnode: ASTNode = expression.evaluate(st)
+            astnodes: typing.List[ASTNode] = list([astnode])
+            st.insert(name.identifier, astnodes)
+        astnode: ASTNode = self.expression.evaluate(st)
+        return astnode
+
+
+class Specialized(abc.ABC):
+
+    # Operand type an operator is specialized for, checked on every evaluation
+    operandtype: typing.Type[builtins.Type] = None
+    resulttype: typing.Type[Atom] = None
+    operation: typing.Callable = None
+
+    def evaluate(self, st: symtable.SymbolTable) -> ASTNode:
+        left: Atom = self.left.evaluate(st)
+        right: Atom = self.right.evaluate(st)
+        leftvalue: builtins.Type = left.value
+        rightvalue: builtins.Type = right.value
+        value: typing.Any = self.operation(leftvalue, rightvalue)
+        if (type(leftvalue) is self.operandtype
+                and type(rightvalue) is self.operandtype):
+            return self.resulttype(value=value)
+        # Guard failed, go back to the generic node
+        self.despecialize()
+        astnode: Expression = factory.AST.new(value=value)
+        return astnode
+
+
+class IntegerPlus(Specialized, Plus):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Integer
+    operation: typing.Callable = operator.add
+
+
+class IntegerMinus(Specialized, Minus):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Integer
+    operation: typing.Callable = operator.sub
+
+
+class IntegerStar(Specialized, Star):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Integer
+    operation: typing.Callable = operator.mul
+
+
+class IntegerSlash(Specialized, Slash):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Float
+    operation: typing.Callable = operator.truediv
+
+
+class IntegerDoubleSlash(Specialized, DoubleSlash):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Integer
+    operation: typing.Callable = operator.floordiv
+
+
+class IntegerPercent(Specialized, Percent):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Integer
+    operation: typing.Callable = operator.mod
+
+
+class IntegerEqEqual(Specialized, EqEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.eq
+
+
+class IntegerNotEqual(Specialized, NotEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.ne
+
+
+class IntegerLess(Specialized, Less):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.lt
+
+
+class IntegerLessEqual(Specialized, LessEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.le
+
+
+class IntegerGreater(Specialized, Greater):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.gt
+
+
+class IntegerGreaterEqual(Specialized, GreaterEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Integer
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.ge
+
+
+class FloatPlus(Specialized, Plus):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Float
+    operation: typing.Callable = operator.add
+
+
+class FloatMinus(Specialized, Minus):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Float
+    operation: typing.Callable = operator.sub
+
+
+class FloatStar(Specialized, Star):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Float
+    operation: typing.Callable = operator.mul
+
+
+class FloatSlash(Specialized, Slash):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Float
+    operation: typing.Callable = operator.truediv
+
+
+class FloatEqEqual(Specialized, EqEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.eq
+
+
+class FloatNotEqual(Specialized, NotEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.ne
+
+
+class FloatLess(Specialized, Less):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.lt
+
+
+class FloatLessEqual(Specialized, LessEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.le
+
+
+class FloatGreater(Specialized, Greater):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.gt
+
+
+class FloatGreaterEqual(Specialized, GreaterEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.Float
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.ge
+
+
+class StringPlus(Specialized, Plus):
+
+    operandtype: typing.Type[builtins.Type] = builtins.String
+    resulttype: typing.Type[Atom] = String
+    operation: typing.Callable = operator.add
+
+
+class StringEqEqual(Specialized, EqEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.String
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.eq
+
+
+class StringNotEqual(Specialized, NotEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.String
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.ne
+
+
+class StringLess(Specialized, Less):
+
+    operandtype: typing.Type[builtins.Type] = builtins.String
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.lt
+
+
+class StringLessEqual(Specialized, LessEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.String
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.le
+
+
+class StringGreater(Specialized, Greater):
+
+    operandtype: typing.Type[builtins.Type] = builtins.String
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.gt
+
+
+class StringGreaterEqual(Specialized, GreaterEqual):
+
+    operandtype: typing.Type[builtins.Type] = builtins.String
+    resulttype: typing.Type[Atom] = Boolean
+    operation: typing.Callable = operator.ge
+
+
+# Generic operator and operand type to its specialized node
+SPECIALIZED: typing.Dict[typing.Tuple[typing.Type, typing.Type], typing.Type] \
+    = dict({
+        tuple((specialized.__bases__[-1], specialized.operandtype,)):
+            specialized
+        for specialized in Specialized.__subclasses__()
+    })
+
+# Quickening events, by event and specialized node name
+STATISTICS: typing.Dict[str, typing.Dict[str, int]] = dict({
+    'specialized': dict(),
+    'despecialized': dict(),
+    'shared': dict(),
+})
+
+
+def count(counter: typing.Dict[str, int], key: str) -> None:
+    counter[key] = counter.get(key, 0) + 1
+
+
+# Result of a call that falls off the end of its block
+NULL: Null = Null(literal=token.kwdict[token.NULL])
+
+# Result of a builtin function that returns None
+NONE: Null = Null(value=None)
 
 
 factory.AST = factory.ASTNodeFactory(declarations=list([
@@ -0,0 +1,427 @@
+import typing
+import anchor.ast as ast
+import anchor.builtins as builtins
+import anchor.factory as factory
+import anchor.symtable as symtable
+import anchor.visitor as visitor
+
+
+__all__: typing.List[str] = list([
+    'CheckError', 'Checker', 'check', 'unchecked',
+])
+
+
+# Children read as names in use, a name in a binding position is skipped
+USES: typing.Dict[typing.Type, visitor.Children] = dict({
+    ast.LazyBlock: lambda node: list(node.statements),
+    ast.Assignment: lambda node: list([node.expression]),
+    ast.Iterate: lambda node: list([
+        node.iterable, node.block, node.preheader,
+    ]),
+    ast.Parameter: lambda node: list(),
+    ast.Property: lambda node: list(),
+    ast.DotName: lambda node: list([node.expression]),
+    ast.Let: lambda node: list([
+        expression for _, expression in node.bindings
+    ]) + list([node.expression]),
+})
+
+# Literal operand types a declared type also accepts
+WIDENING: typing.Dict[str, typing.FrozenSet[str]] = dict({
+    'Float': frozenset(('Integer',)),
+})
+
+
+class CheckError(Exception):
+
+    def __init__(self, errors: typing.List[str]) -> None:
+        super().__init__('\n'.join(errors))
+        self.errors: typing.List[str] = errors
+
+
+class Scope(object):
+
+    def __init__(
+        self, identifier: str, names: typing.Set[str],
+        definition: ast.Statement = None, parent: 'Scope' = None
+    ) -> None:
+        self.identifier: str = identifier
+        self.names: typing.Set[str] = names
+        self.definition: ast.Statement = definition
+        self.parent: Scope = parent
+
+    def resolver(self, identifier: str) -> 'Scope':
+        scope: Scope = self
+        while (scope is not None and identifier not in scope.names):
+            scope = scope.parent
+        return scope
+
+
+class Bindings(visitor.Visitor):
+
+    # Names one scope binds, a nested definition binds only its own name
+
+    def __init__(self) -> None:
+        self.result: typing.Set[str] = set()
+
+    def children(self, node: ast.ASTNode) -> typing.List[ast.ASTNode]:
+        if (type(node) is ast.LazyBlock):
+            return list(node.statements)
+        return visitor.children(node)
+
+    def visitassignment(self, node: ast.Assignment) -> None:
+        self.result.add(node.name.identifier)
+
+    def visititerate(self, node: ast.Iterate) -> None:
+        self.result.add(node.variable.identifier)
+
+    def visitlet(self, node: ast.Let) -> None:
+        self.result.update(set([name.identifier for name, _ in node.bindings]))
+
+    def visitfunctiondef(self, node: ast.FunctionDef) -> bool:
+        self.result.add(node.name.identifier)
+        return False
+
+    def visitclassdef(self, node: ast.ClassDef) -> bool:
+        self.result.add(node.name.identifier)
+        return False
+
+
+class Definitions(Bindings):
+
+    # Every binding in the program by name, None for one that is not a
+    # definition, so a name bound only by definitions is always callable
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.definitions: typing.Dict[str, typing.List[ast.Statement]] = \
+            dict()
+        self.members: typing.Set[str] = set()
+
+    def define(self, name: ast.Name, definition: ast.Statement) -> None:
+        self.definitions.setdefault(name.identifier, list()).append(
+            definition
+        )
+
+    def visitassignment(self, node: ast.Assignment) -> None:
+        self.define(node.name, None)
+
+    def visititerate(self, node: ast.Iterate) -> None:
+        self.define(node.variable, None)
+
+    def visitlet(self, node: ast.Let) -> None:
+        for name, _ in node.bindings:
+            self.define(name, None)
+
+    def visitparameter(self, node: ast.Parameter) -> None:
+        self.define(node.name, None)
+
+    def visitdotassignment(self, node: ast.DotAssignment) -> None:
+        # A name that is not a property lands in the instance's own table
+        self.define(node.dotname.name, None)
+        self.members.add(node.dotname.name.identifier)
+
+    def visitfunctiondef(self, node: ast.FunctionDef) -> None:
+        self.define(node.name, node)
+
+    def visitclassdef(self, node: ast.ClassDef) -> None:
+        # The default constructor is a method too, though not in the body
+        self.define(node.name, node)
+        for method in node.methods.values():
+            self.define(method.name, method)
+            self.members.add(method.name.identifier)
+        for property in node.properties.values():
+            self.define(property.name, None)
+            self.members.add(property.name.identifier)
+
+
+class Checker(visitor.Visitor):
+
+    def __init__(
+        self, natives: typing.Dict[str, ast.NativeFunction]
+    ) -> None:
+        self.natives: typing.Dict[str, ast.NativeFunction] = natives
+        self.errors: typing.List[str] = list()
+        self.scope: Scope = None
+        self.pending: typing.List[typing.Tuple[ast.Block, Scope]] = list()
+        self.definitions: typing.Dict[str, typing.List[ast.Statement]] = \
+            dict()
+        self.members: typing.Set[str] = set()
+
+        # Call sites proven safe, with the builtin a site always reaches
+        self.sites: typing.List[
+            typing.Tuple[ast.Call, ast.NativeFunction]
+        ] = list()
+
+    def check(self, program: ast.Program) -> typing.List[str]:
+        definitions: Definitions = Definitions()
+        definitions.traverse(program)
+        self.definitions = definitions.definitions
+        self.members = definitions.members
+
+        # Scopes are checked one at a time, a definition queues its body
+        self.pending.append(tuple((program.block, Scope(
+            'Main', set(self.natives) | self.bindings(program.block),
+        ),)))
+        while (self.pending):
+            block, self.scope = self.pending.pop()
+            self.traverse(block)
+        return list(dict.fromkeys(self.errors))
+
+    def error(self, message: str) -> None:
+        self.errors.append(f'{self.scope.identifier}: {message}')
+
+    def bindings(self, block: ast.Block) -> typing.Set[str]:
+        bindings: Bindings = Bindings()
+        bindings.traverse(block)
+        return bindings.result
+
+    def children(self, node: ast.ASTNode) -> typing.List[ast.ASTNode]:
+        uses: visitor.Children = USES.get(type(node))
+        if (uses is None):
+            return visitor.children(node)
+        return uses(node)
+
+    def declared(self, annotation: ast.Expression) -> str:
+        if (isinstance(annotation, ast.Name)):
+            return annotation.identifier
+        elif (isinstance(annotation, ast.Null)):
+            return 'Null'
+        return None
+
+    def typename(self, annotation: ast.Expression) -> None:
+        # Reported once, where the annotation is written
+        typename: str = self.declared(annotation)
+        if (annotation is not None and typename is None):
+            self.error('type annotation is not a type name')
+        elif (typename is not None and typename != 'Null'
+                and typename not in builtins.CLASS
+                and not self.classes(typename)):
+            self.error(f"type '{typename}' is not defined")
+
+    def classes(self, identifier: str) -> bool:
+        return any(
+            isinstance(definition, ast.ClassDef)
+            for definition in self.definitions.get(identifier, list())
+        )
+
+    def infer(self, expression: ast.Expression) -> str:
+        # Type of an expression whose type is known without running it
+        if (isinstance(expression, visitor.LITERAL)):
+            return type(expression).__name__
+        elif (isinstance(expression, (ast.Tuple, ast.List, ast.Dict))):
+            return type(expression).__name__
+        elif (isinstance(expression, ast.Call)
+                and isinstance(expression.expression, ast.Name)):
+            identifier: str = expression.expression.identifier
+            definitions: typing.List[ast.Statement] = \
+                self.definitions.get(identifier, list())
+            if (definitions and all(
+                isinstance(definition, ast.ClassDef)
+                for definition in definitions
+            )):
+                return identifier
+        return None
+
+    def conforms(
+        self, expression: ast.Expression, typename: str, message: str
+    ) -> None:
+        actual: str = self.infer(expression)
+        if (typename is None or actual is None or actual == typename
+                or actual == 'Null'
+                or actual in WIDENING.get(typename, frozenset())):
+            return
+        self.error(f'{message} is {actual}, declared {typename}')
+
+    def define(
+        self, definition: ast.Statement, parent: Scope, identifier: str
+    ) -> None:
+        for parameter in definition.parameters:
+            self.typename(parameter.typename)
+        self.typename(definition.kwargs.get('returntype'))
+        names: typing.Set[str] = set([
+            parameter.name.identifier for parameter in definition.parameters
+        ]) | self.bindings(definition.block)
+        self.pending.append(tuple((definition.block, Scope(
+            identifier, names, definition=definition, parent=parent,
+        ),)))
+
+    def visitfunctiondef(self, node: ast.FunctionDef) -> bool:
+        self.define(node, self.scope, node.name.identifier)
+        return False
+
+    def visitclassdef(self, node: ast.ClassDef) -> bool:
+        identifier: str = node.name.identifier
+        for property in node.properties.values():
+            self.typename(property.typename)
+
+        # Methods see the instance, then the scope the class is defined in
+        classscope: Scope = Scope(
+            identifier,
+            set(node.properties) | set(node.methods) | set([symtable.THIS]),
+            definition=node, parent=self.scope,
+        )
+        for methodidentifier, method in node.methods.items():
+            self.define(
+                method, classscope, f'{identifier}.{methodidentifier}'
+            )
+        return False
+
+    def visitname(self, node: ast.Name) -> None:
+        # A body also sees the locals of whichever call it runs under
+        if (self.scope.resolver(node.identifier) is None
+                and (self.scope.definition is None
+                     or node.identifier not in self.definitions)):
+            self.error(f"name '{node.identifier}' is not defined")
+
+    def visitdotname(self, node: ast.DotName) -> None:
+        if (node.name.identifier not in self.members):
+            self.error(
+                f"no class has a member '{node.name.identifier}'"
+            )
+
+    def visitreturn(self, node: ast.Return) -> None:
+        definition: ast.Statement = self.scope.definition
+        if (definition is None or node.expression is None):
+            return
+        self.conforms(
+            node.expression,
+            self.declared(definition.kwargs.get('returntype')),
+            'return value',
+        )
+
+    def rebound(
+        self, identifier: str, definitions: typing.List[ast.Statement]
+    ) -> bool:
+        # Bound more than once in the program, a builtin counting too; a
+        # class and its own constructor take the same arguments
+        constructors: typing.List[ast.Statement] = list([
+            definition.methods[identifier] for definition in definitions
+            if (isinstance(definition, ast.ClassDef))
+        ])
+        bindings: typing.List[ast.Statement] = list([
+            definition for definition in definitions
+            if (not any(
+                definition is constructor for constructor in constructors
+            ))
+        ])
+        return len(bindings) > 1 or identifier in self.natives
+
+    def visitcall(self, node: ast.Call) -> None:
+        if (not isinstance(node.expression, ast.Name)):
+            return
+        identifier: str = node.expression.identifier
+        count: int = len(node.arguments)
+        definitions: typing.List[ast.Statement] = \
+            self.definitions.get(identifier)
+
+        # A builtin never rebound in the program is always the builtin
+        if (definitions is None):
+            native: ast.NativeFunction = self.natives.get(identifier)
+            if (native is None):
+                return
+            elif (native.arity != count):
+                self.error(
+                    f'{identifier}() takes {native.arity} argument(s) '
+                    f'but {count} were given'
+                )
+                return
+            self.sites.append(tuple((node, native,)))
+            return
+        elif (None in definitions or self.rebound(identifier, definitions)):
+            # A call reaches whichever binding its callers made last, it
+            # stays a plain call and is checked when it runs
+            return
+
+        # Bound only by definitions, a call always reaches a callable, a
+        # method called by bare name runs on the current instance instead
+        scope: Scope = self.scope.resolver(identifier)
+        ismethod: bool = bool(
+            scope is not None and isinstance(scope.definition, ast.ClassDef)
+        )
+        if (not ismethod and self.scope.definition is not None and any(
+            isinstance(definition, ast.MethodDef)
+            for definition in definitions
+        )):
+            # Called from a method, a body may reach its namesake method
+            return
+        methods: typing.List[ast.Statement] = list([
+            definition.methods[identifier]
+            if (isinstance(definition, ast.ClassDef)) else definition
+            for definition in definitions
+            if (isinstance(definition, ast.MethodDef) == ismethod)
+        ])
+        arities: typing.List[int] = sorted(set([
+            len(method.parameters) for method in methods
+        ]))
+        if (not arities):
+            return
+        elif (count not in arities):
+            self.error(
+                f'{identifier}() takes '
+                f'{" or ".join(str(arity) for arity in arities)} '
+                f'argument(s) but {count} were given'
+            )
+            return
+        elif (len(methods) == 1):
+            for parameter, argument in zip(
+                methods[0].parameters, node.arguments
+            ):
+                self.conforms(
+                    argument,
+                    self.declared(parameter.typename),
+                    f"{identifier}() argument '{parameter.name.identifier}'",
+                )
+        if (not ismethod and arities == list([count])):
+            self.sites.append(tuple((node, None,)))
+
+
+class NativeCall(ast.Call):
+
+    # Builtin the checker bound this site to, its arity already checked
+    native: ast.NativeFunction = None
+
+    def evaluate(self, st: symtable.SymbolTable) -> ast.ASTNode:
+        values: typing.List[builtins.Type] = list([
+            argument.evaluate(st).value for argument in self.arguments
+        ])
+        returnvalue: typing.Any = self.native.pointer(*values)
+        if (returnvalue is None):
+            return ast.NONE
+        return factory.AST.new(value=returnvalue)
+
+
+class DefinitionCall(ast.Call):
+
+    # Reaches a function or a class, with as many arguments as it takes
+
+    def evaluate(self, st: symtable.SymbolTable) -> ast.ASTNode:
+        astnode: ast.ASTNode = st.resolve(self.expression.identifier)
+        arguments: typing.List[ast.ASTNode] = list([
+            argument.evaluate(st) for argument in self.arguments
+        ])
+        return astnode.call(arguments, st)
+
+
+def check(
+    program: ast.Program, natives: typing.Dict[str, ast.NativeFunction]
+) -> None:
+    errors: typing.List[str] = Checker(natives).check(program)
+    if (errors):
+        raise CheckError(errors)
+
+
+def unchecked(
+    program: ast.Program, natives: typing.Dict[str, ast.NativeFunction]
+) -> ast.Program:
+    # Checked again after the passes, they move and rename call sites
+    checker: Checker = Checker(natives)
+    if (checker.check(program)):
+        return program
+    for call, native in checker.sites:
+        if (native is None):
+            call.__class__ = DefinitionCall
+        else:
+            call.__class__ = NativeCall
+            call.native = native
+    return program
@@ -1,40 +1,150 @@
 import typing
-import inspect
 import anchor.system as system
 import anchor.parse as parse
 import anchor.ast as ast
+import anchor.optimize as optimize
 import anchor.symtable as symtable
 import anchor.builtins as builtins
 import anchor.factory as factory
+import anchor.flatast as flatast
+import anchor.profile as profile
+import anchor.check as check
 
 
-__all__: typing.List[str] = list(['execute', ])
+__all__: typing.List[str] = list([
+    'load', 'run', 'stream', 'execute', 'report',
+])
 
 
-def execute(data: str) -> typing.Any:
-    # Define main symbol table
+# Builtin function descriptors, shared by every execution
+NATIVE: typing.Dict[str, ast.NativeFunction] = dict({
+    identifier: ast.NativeFunction(ast.Name(identifier), functionpointer)
+    for identifier, functionpointer in builtins.FUNCTION.items()
+})
+
+
+def transform(abstractsyntaxtree: ast.ASTNode) -> ast.ASTNode:
+    abstractsyntaxtree = optimize.inline(abstractsyntaxtree)
+    abstractsyntaxtree = optimize.optimize(abstractsyntaxtree)
+    abstractsyntaxtree = optimize.specialize(abstractsyntaxtree)
+    return abstractsyntaxtree
+
+
+def fingerprint(data: str) -> str:
+    return profile.fingerprint(
+        data, system.GLOBAL.optimize, system.GLOBAL.lazy,
+        system.GLOBAL.hashcons,
+    )
+
+
+def replay(abstractsyntaxtree: ast.ASTNode, data: str) -> ast.ASTNode:
+    # A stale or unreadable profile only costs the warm start
+    try:
+        with open(system.GLOBAL.profilein, 'r') as file:
+            replayer: profile.Replayer = profile.Replayer(
+                profile.load(file, fingerprint(data))
+            )
+    except (OSError, ValueError) as error:
+        system.GLOBAL.errorstream.write(f'Profile ignored: {error}\n')
+        return abstractsyntaxtree
+    return replayer.transform(abstractsyntaxtree)
+
+
+def load(data: str) -> ast.ASTNode:
+    # Parse abstract syntax tree, read-only once built
+    parser: parse.AnchorParser = parse.AnchorParser(
+        debuglex=system.GLOBAL.debuglex,
+        debugyacc=system.GLOBAL.debugyacc,
+        debuglog=system.GLOBAL.logger,
+        lazy=system.GLOBAL.lazy,
+        hashcons=system.GLOBAL.hashcons,
+        backend=system.GLOBAL.backend,
+        jobs=system.GLOBAL.jobs
+    )
+    abstractsyntaxtree: ast.ASTNode = parser.parse(data)
+    if (system.GLOBAL.check):
+        # Errors are reported against the program as written
+        check.check(abstractsyntaxtree, NATIVE)
+    if (system.GLOBAL.optimize):
+        abstractsyntaxtree = transform(abstractsyntaxtree)
+    if (system.GLOBAL.flat):
+        # Rebuild the tree from the buffers it would be shipped as
+        flat: flatast.FlatAST = flatast.encode(abstractsyntaxtree)
+        flat = flatast.FlatAST.frombuffers(*flat.buffers())
+        abstractsyntaxtree = flatast.decode(flat)
+    if (system.GLOBAL.check):
+        abstractsyntaxtree = check.unchecked(abstractsyntaxtree, NATIVE)
+    if (system.GLOBAL.profilein):
+        abstractsyntaxtree = replay(abstractsyntaxtree, data)
+    return abstractsyntaxtree
+
+
+def main() -> symtable.SymbolTable:
+    # Define main symbol table, one per execution
     mainidentifier: typing.Literal = 'Main'
     symboltable: symtable.SymbolTable = factory.SYMTABLE.new(
         symtable.Type.MAIN, identifier=mainidentifier
     )
 
     # Include builtin functions
-    for identifier, functionpointer in builtins.FUNCTION.items():
-        name = ast.Name(identifier)
-        parameters: typing.List[ast.Parameter] = list([
-            ast.Parameter(ast.Name(argument))
-            for argument in inspect.getfullargspec(functionpointer)[0]
-        ])
-        functiondef: ast.FunctionDef = ast.FunctionDef(
-            name, parameters, None, pointer=functionpointer, isbuiltin=True
-        )
-        functiondef.evaluate(symboltable)
-
-    # Parse and evaluate abstract syntax tree
-    parser: parse.AnchorParser = parse.AnchorParser(
+    for identifier, native in NATIVE.items():
+        astnodes: typing.List[ast.ASTNode] = list([native])
+        symboltable.insert(identifier, astnodes)
+    return symboltable
+
+
+def run(abstractsyntaxtree: ast.ASTNode) -> typing.Any:
+    # Evaluate abstract syntax tree
+    symboltable: symtable.SymbolTable = main()
+    return abstractsyntaxtree.evaluate(symboltable)
+
+
+def stream(data: str) -> typing.Any:
+    symboltable: symtable.SymbolTable = main()
+    result: ast.ASTNode = None
+
+    def consume(statement: ast.Statement) -> None:
+        # Skip the rest once a statement leaves the main block
+        nonlocal result
+        if (result is not None):
+            return
+        program: ast.Program = ast.Program(ast.Block(list([statement])))
+        if (system.GLOBAL.optimize):
+            program = transform(program)
+        result = program.evaluate(symboltable)
+
+    # Evaluate each top-level statement as soon as it is parsed
+    parser: parse.StreamParser = parse.StreamParser(
+        consume,
         debuglex=system.GLOBAL.debuglex,
         debugyacc=system.GLOBAL.debugyacc,
-        debuglog=system.GLOBAL.logger
+        debuglog=system.GLOBAL.logger,
+        lazy=system.GLOBAL.lazy,
+        hashcons=system.GLOBAL.hashcons,
+        backend=system.GLOBAL.backend,
+        jobs=system.GLOBAL.jobs
     )
-    abstractsyntaxtree: ast.ASTNode = parser.parse(data)
-    return abstractsyntaxtree.evaluate(symboltable)
+    parser.parse(data)
+    return result
+
+
+def execute(data: str) -> typing.Any:
+    if (system.GLOBAL.stream):
+        return stream(data)
+    abstractsyntaxtree: ast.ASTNode = load(data)
+    if (system.GLOBAL.profileout):
+        # Count on the very nodes that run, then write what they saw
+        recorder: profile.Recorder = profile.Recorder(fingerprint(data))
+        abstractsyntaxtree = recorder.transform(abstractsyntaxtree)
+        result: typing.Any = run(abstractsyntaxtree)
+        with open(system.GLOBAL.profileout, 'w') as file:
+            recorder.dump(file)
+        return result
+    return run(abstractsyntaxtree)
+
+
+def report(stream: typing.TextIO) -> None:
+    # Quickening counts of the operator nodes
+    for event, counter in ast.STATISTICS.items():
+        for name, count in sorted(counter.items()):
+            stream.write(f'{event} {name} {count}\n')
@@ -0,0 +1,283 @@
+import sys
+import typing
+import array
+import anchor.ast as ast
+import anchor.builtins as builtins
+import anchor.visitor as visitor
+
+
+__all__: typing.List[str] = list([
+    'FlatAST', 'Encoder', 'encode', 'decode',
+])
+
+
+# Node kind code of every class a program tree can hold
+KINDS: typing.Tuple[typing.Type] = tuple((
+    ast.Program, ast.Block, ast.Name, ast.Assignment, ast.DotAssignment,
+    ast.Break, ast.Continue, ast.Return, ast.Elif, ast.If, ast.Switch,
+    ast.Iterate, ast.Loop, ast.Parameter, ast.FunctionDef, ast.Property,
+    ast.MethodDef, ast.ClassDef, ast.Tuple, ast.List, ast.Dict,
+    ast.DotName, ast.Call, ast.Let,
+)) + visitor.BINARY + visitor.UNARY + visitor.LITERAL + tuple(sorted(
+    ast.SPECIALIZED.values(), key=lambda specialized: specialized.__name__
+))
+
+KIND: typing.Dict[typing.Type, int] = dict({
+    kind: code for code, kind in enumerate(KINDS)
+})
+
+# A deferred body is parsed and flattened as a plain block
+KIND[ast.LazyBlock] = KIND[ast.Block]
+
+# Node shapes by exact class, abstract base checks are too slow here
+CONTAINERS: typing.FrozenSet[typing.Type] = frozenset((
+    ast.Tuple, ast.List,
+))
+
+BINARIES: typing.FrozenSet[typing.Type] = frozenset(
+    visitor.BINARY + visitor.SPECIALIZED
+)
+
+UNARIES: typing.FrozenSet[typing.Type] = frozenset(visitor.UNARY)
+
+LITERALS: typing.FrozenSet[typing.Type] = frozenset(visitor.LITERAL)
+
+# Child or operand index of an absent optional field
+ABSENT: int = -1
+
+
+class FlatAST(object):
+
+    def __init__(
+        self, kinds: array.array, operands: array.array,
+        offsets: array.array, children: array.array,
+        constants: typing.Tuple
+    ) -> None:
+        self.__kinds: array.array = kinds
+        self.__operands: array.array = operands
+        self.__offsets: array.array = offsets
+        self.__children: array.array = children
+        self.__constants: typing.Tuple = constants
+
+    @property
+    def kinds(self) -> array.array:
+        return self.__kinds
+
+    @property
+    def operands(self) -> array.array:
+        return self.__operands
+
+    @property
+    def offsets(self) -> array.array:
+        return self.__offsets
+
+    @property
+    def children(self) -> array.array:
+        return self.__children
+
+    @property
+    def constants(self) -> typing.Tuple:
+        return self.__constants
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def buffers(self) -> typing.Tuple:
+        return tuple((
+            self.kinds.tobytes(), self.operands.tobytes(),
+            self.offsets.tobytes(), self.children.tobytes(), self.constants,
+        ))
+
+    @classmethod
+    def frombuffers(
+        cls, kinds: bytes, operands: bytes, offsets: bytes,
+        children: bytes, constants: typing.Tuple
+    ) -> 'FlatAST':
+        arrays: typing.List[array.array] = list([
+            array.array('B'), array.array('i'),
+            array.array('I'), array.array('i'),
+        ])
+        buffers: typing.Tuple[bytes] = tuple((
+            kinds, operands, offsets, children,
+        ))
+        for target, buffer in zip(arrays, buffers):
+            target.frombytes(buffer)
+        return cls(*arrays, tuple(constants))
+
+    def decode(self) -> ast.ASTNode:
+        # Children precede their parent, the root is the last node
+        nodes: typing.List[ast.ASTNode] = list()
+        for index, code in enumerate(self.kinds):
+            children: typing.List[ast.ASTNode] = list([
+                nodes[child] if (child != ABSENT) else None
+                for child in self.children[
+                    self.offsets[index]:self.offsets[index + 1]
+                ]
+            ])
+            operand: typing.Any = None
+            if (self.operands[index] != ABSENT):
+                operand = self.constants[self.operands[index]]
+            nodes.append(build(KINDS[code], operand, children))
+        if (not nodes):
+            return None
+        return nodes[-1]
+
+
+class Encoder(object):
+
+    def __init__(self) -> None:
+        self.__kinds: array.array = array.array('B')
+        self.__operands: array.array = array.array('i')
+        self.__offsets: array.array = array.array('I', [0])
+        self.__children: array.array = array.array('i')
+        self.__constants: typing.List[typing.Any] = list()
+        self.__pool: typing.Dict[typing.Tuple, int] = dict()
+        self.__indices: typing.Dict[int, int] = dict()
+
+    def encode(self, root: ast.ASTNode) -> FlatAST:
+        # Post-order without recursion, a shared node is written once
+        indices: typing.Dict[int, int] = self.__indices
+        pending: typing.List[typing.Tuple] = list()
+        if (root is not None):
+            pending.append(tuple((root, None,)))
+        while (pending):
+            node, children = pending.pop()
+            if (children is not None):
+                self.append(node, children)
+                continue
+            if (id(node) in indices):
+                continue
+            children = fields(node)
+            pending.append(tuple((node, children,)))
+            for child in reversed(children):
+                if (child is not None and id(child) not in indices):
+                    pending.append(tuple((child, None,)))
+        return FlatAST(
+            self.__kinds, self.__operands, self.__offsets, self.__children,
+            tuple(self.__constants),
+        )
+
+    def append(
+        self, node: ast.ASTNode, children: typing.List[ast.ASTNode]
+    ) -> None:
+        code: int = KIND[type(node)]
+        indices: typing.Dict[int, int] = self.__indices
+        indices[id(node)] = len(self.__kinds)
+        self.__kinds.append(code)
+        self.__operands.append(self.constant(operand(node)))
+        self.__children.extend(list([
+            indices[id(child)] if (child is not None) else ABSENT
+            for child in children
+        ]))
+        self.__offsets.append(len(self.__children))
+
+    def constant(self, value: typing.Any) -> int:
+        if (value is None):
+            return ABSENT
+        # Equal constants of different types, like 1 and True, stay apart
+        key: typing.Tuple = tuple((type(value), value,))
+        if (key not in self.__pool):
+            self.__pool[key] = len(self.__constants)
+            self.__constants.append(value)
+        return self.__pool[key]
+
+
+def fields(node: ast.ASTNode) -> typing.List[ast.ASTNode]:
+    kind: typing.Type = type(node)
+    if (kind is ast.LazyBlock):
+        return list(node.statements)
+    elif (kind in CONTAINERS and node.expressions is None):
+        # Runtime values have no source form
+        raise TypeError(kind.__name__)
+    elif (kind is ast.Dict and node.kvpairs is None):
+        raise TypeError(kind.__name__)
+    return visitor.children(node)
+
+
+def operand(node: ast.ASTNode) -> typing.Any:
+    kind: typing.Type = type(node)
+    if (kind is ast.Name):
+        return node.identifier
+    elif (kind is ast.Boolean):
+        return bool(node.value)
+    elif (kind in LITERALS or kind in (ast.Break, ast.Continue)):
+        return node.literal
+    elif (kind is ast.Switch):
+        # Case values by type name, rebuilt as the same builtins
+        return tuple([
+            tuple((case.typename, case.value,)) for case in node.cases
+        ])
+    return None
+
+
+def build(
+    kind: typing.Type, operand: typing.Any,
+    children: typing.List[ast.ASTNode]
+) -> ast.ASTNode:
+    if (kind in BINARIES):
+        return kind(children[0], children[1])
+    elif (kind in UNARIES):
+        return kind(children[0])
+    elif (kind is ast.Name):
+        return ast.Name(sys.intern(operand))
+    elif (kind is ast.Boolean):
+        return ast.Boolean(value=operand)
+    elif (kind in LITERALS):
+        return kind(literal=operand)
+    elif (kind is ast.Block):
+        return ast.Block(children)
+    elif (kind is ast.Program):
+        return ast.Program(children[0])
+    elif (kind in (ast.Assignment, ast.DotAssignment, ast.DotName)):
+        return kind(children[0], children[1])
+    elif (kind in (ast.Break, ast.Continue)):
+        return kind(literal=operand)
+    elif (kind is ast.Return):
+        return ast.Return(expression=children[0])
+    elif (kind is ast.Elif):
+        return ast.Elif(children[0], children[1], elseblock=children[2])
+    elif (kind is ast.If):
+        return ast.If(
+            children[0], children[1],
+            elifs=children[3:], elseblock=children[2],
+        )
+    elif (kind is ast.Switch):
+        cases: typing.Dict[builtins.Type, ast.Block] = dict({
+            getattr(builtins, typename)(value): block
+            for (typename, value), block in zip(operand, children[2:])
+        })
+        return ast.Switch(children[0], cases, elseblock=children[1])
+    elif (kind is ast.Iterate):
+        return ast.Iterate(
+            children[0], children[1], children[2], preheader=children[3],
+        )
+    elif (kind is ast.Loop):
+        return ast.Loop(children[0], children[1], preheader=children[2])
+    elif (kind in (ast.Parameter, ast.Property)):
+        return kind(children[0], children[1])
+    elif (kind in (ast.FunctionDef, ast.MethodDef)):
+        return kind(
+            children[0], children[3:], children[1], returntype=children[2]
+        )
+    elif (kind is ast.ClassDef):
+        return ast.ClassDef(children[0], children[1])
+    elif (kind in (ast.Tuple, ast.List)):
+        return kind(expressions=children)
+    elif (kind is ast.Dict):
+        return ast.Dict(kvpairs=list(zip(children[0::2], children[1::2])))
+    elif (kind is ast.Call):
+        return ast.Call(children[0], children[1:])
+    elif (kind is ast.Let):
+        return ast.Let(
+            list(zip(children[1::2], children[2::2])), children[0]
+        )
+    raise TypeError(kind.__name__)
+
+
+def encode(program: ast.ASTNode) -> FlatAST:
+    encoder: Encoder = Encoder()
+    return encoder.encode(program)
+
+
+def decode(flat: FlatAST) -> ast.ASTNode:
+    return flat.decode()
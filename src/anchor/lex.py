@@ -1,11 +1,16 @@
+import sys
 import typing
+import array
+import concurrent.futures
 import anchor.system as system
 import anchor.token as token
 import anchor.keyword as keyword
 import anchor.ply.lex as lex
 
 
-__all__: typing.List[str] = list(['AnchorLexer', ])
+__all__: typing.List[str] = list([
+    'AnchorLexer', 'LazyLexer', 'ChunkedLexer',
+])
 
 
 # Regular expression utility functions
@@ -45,7 +50,7 @@ class AnchorLexer(object):
 
     # List of token names
     tokens = tuple(token.NAME.values()) + tuple((
-        'NAME', 'INTEGER', 'FLOAT', 'COMPLEX', 'STRING',
+        'NAME', 'INTEGER', 'FLOAT', 'COMPLEX', 'STRING', 'LAZYBODY',
     ))
 
     # Regular expression rules for tokens
@@ -86,6 +91,8 @@ class AnchorLexer(object):
         r'[a-zA-Z_][a-zA-Z0-9_]*'
         if (keyword.iskeyword(t.value)):
             t.type = token.NAME[t.value]
+        else:
+            t.value = sys.intern(t.value)
         return t
 
     # Define a rule for newline so we can track line numbers
@@ -97,9 +104,9 @@ class AnchorLexer(object):
     def t_error(self, t: lex.LexToken) -> lex.LexToken:
         t.lexer.skip(1)
 
-    # Build the lexer
+    # Build the lexer, reusing the validated rules of an earlier build
     def build(self, **kwargs) -> None:
-        self.lexer = lex.lex(module=self, **kwargs)
+        self.lexer = lex.lex(module=self, cache=True, **kwargs)
 
     # Test
     def debug(self, data: str) -> None:
@@ -109,3 +116,158 @@ class AnchorLexer(object):
             if (not t):
                 break
             system.GLOBAL.logger.debug(t)
+
+
+class LazyLexer(object):
+
+    # Tokens that are closed by an end
+    openers: typing.FrozenSet[str] = frozenset((token.BEGIN, token.IF,))
+
+    def __init__(self, lexer: lex.Lexer) -> None:
+        self.lexer: lex.Lexer = lexer
+        self.data: str = str()
+        self.pending: typing.List[lex.LexToken] = list()
+        self.header: bool = False
+
+    def input(self, data: str) -> None:
+        self.lexer.input(data)
+        self.data = data
+        self.pending = list()
+        self.header = False
+
+    def fragment(self, data: str, lineno: int) -> None:
+        # A deferred body parses from a marker instead of a program
+        self.input(data)
+        self.lexer.lineno = lineno
+        self.pending.append(self.lazybody(None, lineno, 0))
+
+    def token(self) -> lex.LexToken:
+        if (self.pending):
+            return self.pending.pop(0)
+        t: lex.LexToken = self.lexer.token()
+        if (t is None):
+            return t
+        if (t.type in (token.FUNCTION, token.METHOD)):
+            self.header = True
+        elif (t.type == token.BEGIN and self.header):
+            self.header = False
+            self.skip()
+        return t
+
+    def skip(self) -> None:
+        # Scan for the matching end, keep only the span of the body
+        first: lex.LexToken = None
+        depth: int = 1
+        while (True):
+            t: lex.LexToken = self.lexer.token()
+            if (t is None):
+                return
+            if (t.type in self.openers):
+                depth += 1
+            elif (t.type == token.END):
+                depth -= 1
+                if (depth == 0):
+                    break
+            if (first is None):
+                first = t
+        if (first is not None):
+            source: str = self.data[first.lexpos:t.lexpos]
+            self.pending.append(
+                self.lazybody(source, first.lineno, first.lexpos)
+            )
+        self.pending.append(t)
+
+    def lazybody(
+        self, source: str, lineno: int, lexpos: int
+    ) -> lex.LexToken:
+        t: lex.LexToken = lex.LexToken()
+        t.type = 'LAZYBODY'
+        t.value = tuple((source, lineno,))
+        t.lineno = lineno
+        t.lexpos = lexpos
+        return t
+
+
+class ChunkedLexer(object):
+
+    # Sources smaller than this are tokenized in process
+    threshold: int = 1 << 20
+
+    def __init__(self, lexer: lex.Lexer, jobs: int) -> None:
+        self.lexer: lex.Lexer = lexer
+        self.jobs: int = jobs
+        self.tokens: typing.Iterator[lex.LexToken] = None
+
+    def input(self, data: str) -> None:
+        if (len(data) < self.threshold):
+            self.lexer.input(data)
+            self.tokens = None
+            return
+        bounds: typing.List[int] = split(data, self.jobs + 1)
+        self.tokens = self.merge(data, bounds)
+
+    def token(self) -> lex.LexToken:
+        if (self.tokens is None):
+            return self.lexer.token()
+        return next(self.tokens, None)
+
+    def merge(
+        self, data: str, bounds: typing.List[int]
+    ) -> typing.Iterator[lex.LexToken]:
+        pool: concurrent.futures.Executor = \
+            concurrent.futures.ProcessPoolExecutor(self.jobs)
+        try:
+            futures: typing.List[concurrent.futures.Future] = list([
+                pool.submit(tokenize, data[start:end])
+                for start, end in zip(bounds[1:], bounds[2:])
+            ])
+            # The first chunk is lexed here while the workers run
+            lineno: int = self.lexer.lineno
+            self.lexer.input(data[:bounds[1]])
+            yield from iter(self.lexer.token, None)
+            for start, future in zip(bounds[1:], futures):
+                # Worker lines count from one, offsets from the chunk start
+                offset: int = lineno + data.count('\n', 0, start) - 1
+                types, values, linenos, positions = future.result()
+                for index in range(len(types)):
+                    t: lex.LexToken = lex.LexToken()
+                    t.type = types[index]
+                    t.value = values[index]
+                    if (t.type == 'NAME'):
+                        # Unpickled names are new strings, share them again
+                        t.value = sys.intern(t.value)
+                    t.lineno = linenos[index] + offset
+                    t.lexpos = positions[index] + start
+                    yield t
+            self.lexer.lineno = lineno + data.count('\n')
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+
+def split(data: str, count: int) -> typing.List[int]:
+    # Cut just after a newline, no string or comment spans one
+    bounds: typing.List[int] = list([0])
+    for index in range(1, count):
+        cut: int = data.find('\n', max(len(data) * index // count, bounds[-1]))
+        if (cut < 0):
+            break
+        bounds.append(cut + 1)
+    bounds.append(len(data))
+    return bounds
+
+
+def tokenize(data: str) -> typing.Tuple:
+    # Runs in a worker, columns pickle far smaller than tokens
+    lexer: AnchorLexer = AnchorLexer()
+    lexer.build()
+    lexer.lexer.input(data)
+    types: typing.List[str] = list()
+    values: typing.List[str] = list()
+    linenos: array.array = array.array('i')
+    positions: array.array = array.array('i')
+    for t in iter(lexer.lexer.token, None):
+        types.append(t.type)
+        values.append(t.value)
+        linenos.append(t.lineno)
+        positions.append(t.lexpos)
+    return tuple((types, values, linenos, positions,))
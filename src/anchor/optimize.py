@@ -0,0 +1,1383 @@
+import typing
+import anchor.ast as ast
+import anchor.builtins as builtins
+import anchor.visitor as visitor
+
+
+__all__: typing.List[str] = list([
+    'Inliner', 'Optimizer', 'Specializer', 'inline', 'optimize', 'specialize',
+])
+
+
+# Operators that always evaluate every operand and have no side effects
+BINARY: typing.Tuple[typing.Type] = visitor.BINARY
+
+UNARY: typing.Tuple[typing.Type] = visitor.UNARY
+
+LITERAL: typing.Tuple[typing.Type] = visitor.LITERAL
+
+# Exact classes of the above, a specialized operator with its generic one,
+# looked up by type since an isinstance check on an abstract base is slow
+BINARYTYPES: typing.FrozenSet[typing.Type] = \
+    frozenset(BINARY + visitor.SPECIALIZED)
+
+UNARYTYPES: typing.FrozenSet[typing.Type] = frozenset(UNARY)
+
+LITERALTYPES: typing.FrozenSet[typing.Type] = frozenset(LITERAL)
+
+# Statements that bind a name and open a scope of their own
+DEFINITION: typing.Tuple[typing.Type] = tuple((
+    ast.FunctionDef, ast.MethodDef, ast.ClassDef,
+))
+
+# Operator and annotated operand type to its guarded specialized node
+SPECIALIZED: typing.Dict[typing.Tuple[typing.Type, str], typing.Type] = dict({
+    tuple((generic, operandtype.__name__,)): specialized
+    for (generic, operandtype), specialized in ast.SPECIALIZED.items()
+})
+
+# Mixed Integer and Float operands still yield a Float
+ARITHMETIC: typing.Tuple[typing.Type] = tuple((
+    ast.Plus, ast.Minus, ast.Star, ast.Slash,
+))
+
+COMPARISON: typing.Tuple[typing.Type] = tuple((
+    ast.EqEqual, ast.NotEqual, ast.Less, ast.LessEqual,
+    ast.Greater, ast.GreaterEqual,
+))
+
+NUMBER: typing.Tuple[str] = tuple(('Integer', 'Float',))
+
+# Inferred type lattice, a type name sits between the two
+UNKNOWN: typing.Literal = '?'
+UNASSIGNED: typing.Literal = ''
+
+# Statements evaluated in order, without branching
+STRAIGHT: typing.Tuple[typing.Type] = tuple((
+    ast.Assignment, ast.DotAssignment, ast.Return, ast.Expression,
+))
+
+# Expression operands a pass rewrites, in evaluation order, a property
+# name or a let binding name is not one
+OPERANDS: typing.Dict[typing.Type, visitor.Children] = dict({
+    ast.DotName: lambda expression: list([expression.expression]),
+    ast.Call: lambda expression: list([
+        expression.expression,
+    ]) + list(expression.arguments),
+    ast.Tuple: lambda expression: list(expression.expressions or list()),
+    ast.List: lambda expression: list(expression.expressions or list()),
+    ast.Dict: lambda expression: list([
+        operand for kvpair in expression.kvpairs or list()
+        for operand in kvpair
+    ]),
+    ast.Let: lambda expression: list([
+        value for _, value in expression.bindings
+    ]) + list([expression.expression]),
+})
+OPERANDS.update(dict({
+    kind: lambda expression: list([expression.left, expression.right])
+    for kind in BINARY + visitor.SPECIALIZED
+}))
+OPERANDS.update(dict({
+    kind: lambda expression: list([expression.right]) for kind in UNARY
+}))
+
+# Expression of the same class from an old one and its new operands
+REBUILD: typing.Dict[typing.Type, visitor.Rebuild] = dict({
+    ast.DotName: lambda expression, operands: ast.DotName(
+        operands[0], expression.name,
+    ),
+    ast.Call: lambda expression, operands: ast.Call(
+        operands[0], operands[1:],
+    ),
+    ast.Tuple: lambda expression, operands: ast.Tuple(expressions=operands),
+    ast.List: lambda expression, operands: ast.List(expressions=operands),
+    ast.Dict: lambda expression, operands: ast.Dict(
+        kvpairs=list(zip(operands[0::2], operands[1::2])),
+    ),
+    ast.Let: lambda expression, operands: ast.Let(
+        list(zip([name for name, _ in expression.bindings], operands)),
+        operands[-1],
+    ),
+})
+REBUILD.update(dict({
+    kind: lambda expression, operands: type(expression)(*operands)
+    for kind in BINARY + visitor.SPECIALIZED + UNARY
+}))
+
+
+def transform(
+    statement: ast.Statement,
+    function: typing.Callable[[ast.Expression], ast.Expression]
+) -> ast.Statement:
+    if (isinstance(statement, ast.Assignment)):
+        return ast.Assignment(
+            statement.name, function(statement.expression)
+        )
+    elif (isinstance(statement, ast.DotAssignment)):
+        dotname: ast.DotName = statement.dotname
+        return ast.DotAssignment(
+            ast.DotName(function(dotname.expression), dotname.name),
+            function(statement.expression),
+        )
+    elif (isinstance(statement, ast.Return)):
+        if (statement.expression is None):
+            return statement
+        return ast.Return(expression=function(statement.expression))
+    return function(statement)
+
+
+def rebuild(
+    expression: ast.Expression,
+    function: typing.Callable[[ast.Expression], ast.Expression]
+) -> ast.Expression:
+    operands: visitor.Children = OPERANDS.get(type(expression))
+    if (operands is None):
+        return expression
+    nodes: typing.List[ast.Expression] = operands(expression)
+    if (not nodes):
+        # A runtime value or an empty literal, nothing to rewrite
+        return expression
+    rewritten: typing.List[ast.Expression] = \
+        list([function(node) for node in nodes])
+    if (all(list([new is old for new, old in zip(rewritten, nodes)]))):
+        # An unchanged expression is kept, so sharing survives a pass
+        return expression
+    return REBUILD[type(expression)](expression, rewritten)
+
+
+def shallow(
+    expression: ast.Expression,
+    function: typing.Callable[[ast.Expression], ast.Expression]
+) -> ast.Expression:
+    # A let body reads names bound inside it, leave it as it is
+    if (isinstance(expression, ast.Let)):
+        return ast.Let(
+            list([
+                tuple((name, function(value),))
+                for name, value in expression.bindings
+            ]),
+            expression.expression,
+        )
+    return rebuild(expression, function)
+
+
+def pure(expression: ast.Expression) -> bool:
+    if (isinstance(expression, ast.Name) or type(expression) in LITERALTYPES):
+        return True
+    elif (type(expression) in BINARYTYPES):
+        return pure(expression.left) and pure(expression.right)
+    elif (type(expression) in UNARYTYPES):
+        return pure(expression.right)
+    return False
+
+
+def assignments(
+    statements: typing.List[ast.Statement]
+) -> typing.List[typing.Tuple[str, ast.Expression]]:
+    # Every binding in this scope, an unknown value has no expression
+    result: typing.List[typing.Tuple[str, ast.Expression]] = list()
+    for statement in statements:
+        if (isinstance(statement, ast.Assignment)):
+            result.append(tuple((
+                statement.name.identifier, statement.expression,
+            )))
+        elif (isinstance(statement, ast.Iterate)):
+            result.append(tuple((statement.variable.identifier, None,)))
+        elif (isinstance(statement, DEFINITION)):
+            result.append(tuple((statement.name.identifier, None,)))
+            continue
+        for block in blocks(statement):
+            result.extend(assignments(block.statements))
+    return result
+
+
+def bindings(statements: typing.List[ast.Statement]) -> typing.Dict[str, int]:
+    # Bindings of each name in every scope, the bodies of definitions too,
+    # since a callee sees the names of all its callers; a body not parsed
+    # yet may bind anything and counts under None
+    result: typing.Dict[str, int] = dict()
+
+    def bind(identifier: str) -> None:
+        result[identifier] = result.get(identifier, 0) + 1
+
+    def walk(statements: typing.List[ast.Statement]) -> None:
+        for statement in statements:
+            if (isinstance(statement, ast.Assignment)):
+                bind(statement.name.identifier)
+            elif (isinstance(statement, ast.Iterate)):
+                bind(statement.variable.identifier)
+            elif (isinstance(statement, ast.Property)):
+                bind(statement.name.identifier)
+            elif (isinstance(statement, DEFINITION)):
+                bind(statement.name.identifier)
+                if (not isinstance(statement, ast.ClassDef)):
+                    for parameter in statement.parameters:
+                        bind(parameter.name.identifier)
+                if (deferred(statement)):
+                    bind(None)
+            for block in blocks(statement):
+                walk(block.statements)
+
+    walk(statements)
+    return result
+
+
+def deferred(definition: ast.Statement) -> bool:
+    # A body parsed on its first call stays opaque to every pass
+    return isinstance(definition.block, ast.LazyBlock)
+
+
+def blocks(statement: ast.Statement) -> typing.List[ast.Block]:
+    result: typing.List[ast.Block] = list()
+    if (isinstance(statement, ast.If)):
+        result.append(statement.block)
+        for elifstatement in statement.elifs:
+            result.append(elifstatement.block)
+            result.append(elifstatement.elseblock)
+        result.append(statement.elseblock)
+    elif (isinstance(statement, ast.Switch)):
+        result.extend(statement.cases.values())
+        result.append(statement.elseblock)
+    elif (isinstance(statement, (ast.Loop, ast.Iterate))):
+        result.append(statement.preheader)
+        result.append(statement.block)
+    elif (isinstance(statement, DEFINITION) and not deferred(statement)):
+        result.append(statement.block)
+    return list([block for block in result if (block is not None)])
+
+
+class OperandVisitor(visitor.Visitor):
+
+    # Walks the operands rebuild rewrites, nothing a pass leaves alone
+
+    def children(self, node: ast.ASTNode) -> typing.List[ast.ASTNode]:
+        operands: visitor.Children = OPERANDS.get(type(node))
+        if (operands is None):
+            return list()
+        return operands(node)
+
+
+class UseCounter(OperandVisitor):
+
+    def __init__(self) -> None:
+        self.result: typing.Dict[str, int] = dict()
+
+    def visitname(self, name: ast.Name) -> None:
+        self.result[name.identifier] = self.result.get(name.identifier, 0) + 1
+
+
+class CallCollector(OperandVisitor):
+
+    def __init__(self) -> None:
+        self.result: typing.List[str] = list()
+
+    def visitcall(self, call: ast.Call) -> None:
+        target: ast.Expression = call.expression
+        self.result.append(
+            target.identifier if (isinstance(target, ast.Name)) else None
+        )
+
+    def visitlet(self, let: ast.Let) -> None:
+        self.result.append(None)
+
+
+class NameCollector(visitor.Visitor):
+
+    # Every name a statement reads or binds, nested bodies too
+
+    def __init__(self) -> None:
+        self.result: typing.Set[str] = set()
+
+    def visitname(self, name: ast.Name) -> None:
+        self.result.add(name.identifier)
+
+
+class EffectFinder(visitor.Visitor):
+
+    # A call, an inlined body or a property write anywhere in a statement
+
+    def __init__(self) -> None:
+        self.result: bool = False
+
+    def visitcall(self, call: ast.Call) -> bool:
+        self.result = True
+        return False
+
+    def visitlet(self, let: ast.Let) -> bool:
+        self.result = True
+        return False
+
+    def visitdotassignment(self, statement: ast.DotAssignment) -> bool:
+        self.result = True
+        return False
+
+
+class SizeCounter(OperandVisitor):
+
+    def __init__(self) -> None:
+        self.result: int = 0
+
+    def visitastnode(self, node: ast.ASTNode) -> None:
+        self.result += 1
+
+
+class Optimizer(object):
+
+    # Tests in an if chain before it becomes a dispatch table
+    cases: int = 4
+
+    # Longest straight-line run searched for common subexpressions
+    window: int = 64
+
+    # Expressions shared in one run, each one rescans the run
+    rewrites: int = 8
+
+    # Expression nodes the common subexpression scans visit in a program,
+    # past it the rest of the program is left as it is
+    budget: int = 20000
+
+    def __init__(self) -> None:
+        self.__count: int = 0
+        self.__scanned: int = 0
+        self.__parameters: typing.FrozenSet[str] = None
+
+    def optimize(self, program: ast.Program) -> ast.Program:
+        if (program is None):
+            return program
+        self.__scanned = 0
+        self.__parameters = None
+        block: ast.Block = self.block(program.block, frozenset())
+        return ast.Program(block)
+
+    def local(self, identifier: str) -> bool:
+        # A callee writes any property it finds along its callers, even
+        # through the first assignment of a name in a body, so only the
+        # parameters and temporaries of a body are out of its reach, and
+        # every top level name, none of which is a property
+        return bool(
+            self.__parameters is None
+            or identifier in self.__parameters
+            or identifier.startswith('$')
+        )
+
+    def define(
+        self, definition: ast.Statement, properties: typing.FrozenSet[str]
+    ) -> ast.Statement:
+        parameters: typing.FrozenSet[str] = self.__parameters
+        self.__parameters = frozenset(list([
+            parameter.name.identifier for parameter in definition.parameters
+        ]))
+        try:
+            block: ast.Block = self.block(definition.block, properties)
+        finally:
+            self.__parameters = parameters
+        return type(definition)(
+            definition.name, definition.parameters, block,
+            **definition.kwargs
+        )
+
+    def temporary(self, prefix: str) -> ast.Name:
+        # Not a valid identifier in source, so it never clashes
+        identifier: str = f'${prefix}{self.__count}'
+        self.__count += 1
+        return ast.Name(identifier)
+
+    def block(
+        self, block: ast.Block, properties: typing.FrozenSet[str]
+    ) -> ast.Block:
+        statements: typing.List[ast.Statement] = \
+            self.statements(block.statements, properties)
+        statements = self.eliminate(statements, properties)
+        return ast.Block(statements)
+
+    def statements(
+        self, statements: typing.List[ast.Statement],
+        properties: typing.FrozenSet[str]
+    ) -> typing.List[ast.Statement]:
+        result: typing.List[ast.Statement] = list()
+        for statement in statements:
+            result.extend(self.statement(statement, properties))
+        return result
+
+    def statement(
+        self, statement: ast.Statement, properties: typing.FrozenSet[str]
+    ) -> typing.List[ast.Statement]:
+        if (isinstance(statement, (ast.Loop, ast.Iterate))):
+            return self.hoist(statement, properties)
+        elif (isinstance(statement, ast.If)):
+            elifs: typing.List[ast.Elif] = list([
+                ast.Elif(
+                    elifstatement.expression,
+                    self.block(elifstatement.block, properties),
+                    self.optional(elifstatement.elseblock, properties),
+                )
+                for elifstatement in statement.elifs
+            ])
+            return list([self.dispatch(ast.If(
+                statement.expression,
+                self.block(statement.block, properties),
+                elifs=elifs,
+                elseblock=self.optional(statement.elseblock, properties),
+            ))])
+        elif (isinstance(statement, DEFINITION) and deferred(statement)):
+            return list([statement])
+        elif (isinstance(statement, (ast.FunctionDef, ast.MethodDef))):
+            return list([self.define(statement, properties)])
+        elif (isinstance(statement, ast.ClassDef)):
+            # Any call may write a property, so they are never invariant
+            classproperties: typing.FrozenSet[str] = \
+                properties | frozenset(statement.properties)
+            statements: typing.List[ast.Statement] = list()
+            for classstatement in statement.block.statements:
+                statements.extend(
+                    self.statement(classstatement, classproperties)
+                )
+            return list([ast.ClassDef(
+                statement.name, ast.Block(statements), **statement.kwargs
+            )])
+        return list([statement])
+
+    def dispatch(self, statement: ast.If) -> ast.Statement:
+        # Only the last elif of a chain carries the else block
+        elseblock: ast.Block = statement.elseblock
+        tests: typing.List[typing.Tuple[ast.Expression, ast.Block]] = \
+            list([tuple((statement.expression, statement.block,))])
+        for index, elifstatement in enumerate(statement.elifs):
+            if (elifstatement.elseblock is not None):
+                if (elseblock is not None
+                        or index != len(statement.elifs) - 1):
+                    return statement
+                elseblock = elifstatement.elseblock
+            tests.append(
+                tuple((elifstatement.expression, elifstatement.block,))
+            )
+        if (len(tests) < self.cases):
+            return statement
+
+        # Every test compares the same name against a literal
+        name: ast.Name = None
+        cases: typing.Dict[builtins.Type, ast.Block] = dict()
+        for expression, block in tests:
+            if (not isinstance(expression, ast.EqEqual)):
+                return statement
+            operands: typing.List[ast.Expression] = \
+                list([expression.left, expression.right])
+            if (isinstance(operands[0], LITERAL)):
+                operands.reverse()
+            operand, literal = operands
+            if (not isinstance(operand, ast.Name)
+                    or not isinstance(literal, LITERAL)
+                    or isinstance(literal, ast.Null)):
+                return statement
+            elif (name is None):
+                name = operand
+            elif (name.identifier != operand.identifier):
+                return statement
+            # Equal literals, like 1 and 1.0, keep the first branch
+            if (literal.value not in cases):
+                cases[literal.value] = block
+        return ast.Switch(name, cases, elseblock=elseblock)
+
+    def optional(
+        self, block: ast.Block, properties: typing.FrozenSet[str]
+    ) -> ast.Block:
+        if (block is None):
+            return block
+        return self.block(block, properties)
+
+    def hoist(
+        self, loop: ast.Statement, properties: typing.FrozenSet[str]
+    ) -> typing.List[ast.Statement]:
+        # Inner loops first, their hoisted code is part of this body
+        statements: typing.List[ast.Statement] = \
+            self.statements(loop.block.statements, properties)
+        variant: typing.Set[str] = self.assigned(statements) | properties
+        if (isinstance(loop, ast.Iterate)):
+            variant.add(loop.variable.identifier)
+        scanned: typing.List[ast.ASTNode] = list(statements)
+        if (isinstance(loop, ast.Loop)):
+            scanned.append(loop.expression)
+        if (self.reaches(scanned)):
+            # Each iteration may write whatever a callee can reach
+            collector: NameCollector = NameCollector()
+            for node in scanned:
+                collector.traverse(node)
+            variant |= set(list([
+                identifier for identifier in collector.result
+                if (not self.local(identifier))
+            ]))
+        temps: typing.Dict[typing.Tuple, ast.Name] = dict()
+
+        # The condition is evaluated at least once, hoist before the loop
+        before: typing.List[ast.Statement] = list()
+        expression: ast.Expression = None
+        if (isinstance(loop, ast.Loop)):
+            expression = loop.expression
+            if (not self.effects(expression)):
+                expression = self.replace(expression, variant, temps, before)
+
+        # The body runs on entry up to its first branch or its first
+        # effect, an invariant that fails must not fail before either
+        preheader: typing.List[ast.Statement] = list()
+        body: typing.List[ast.Statement] = list()
+        for index, statement in enumerate(statements):
+            if (not isinstance(statement, STRAIGHT)
+                    or self.effects(statement)):
+                body.extend(statements[index:])
+                break
+            body.append(transform(
+                statement,
+                lambda child: self.replace(child, variant, temps, preheader),
+            ))
+            if (isinstance(statement, ast.Return)):
+                body.extend(statements[index + 1:])
+                break
+        body = self.eliminate(body, properties)
+
+        if (loop.preheader):
+            preheader = loop.preheader.statements + preheader
+        block: ast.Block = ast.Block(body)
+        preheaderblock: ast.Block = \
+            ast.Block(preheader) if (preheader) else None
+        if (isinstance(loop, ast.Loop)):
+            return before + list([
+                ast.Loop(expression, block, preheader=preheaderblock)
+            ])
+        return before + list([ast.Iterate(
+            loop.iterable, loop.variable, block, preheader=preheaderblock
+        )])
+
+    def replace(
+        self, expression: ast.Expression,
+        variant: typing.Set[str],
+        temps: typing.Dict[typing.Tuple, ast.Name],
+        hoisted: typing.List[ast.Statement]
+    ) -> ast.Expression:
+        if (self.invariant(expression, variant)):
+            key: typing.Tuple = self.key(expression)
+            if (key not in temps):
+                temps[key] = self.temporary('licm')
+                hoisted.append(ast.Assignment(temps[key], expression))
+            return temps[key]
+        return shallow(
+            expression,
+            lambda child: self.replace(child, variant, temps, hoisted),
+        )
+
+    def eliminate(
+        self, statements: typing.List[ast.Statement],
+        properties: typing.FrozenSet[str]
+    ) -> typing.List[ast.Statement]:
+        result: typing.List[ast.Statement] = list()
+        segment: typing.List[ast.Statement] = list()
+        for statement in statements:
+            if (isinstance(statement, STRAIGHT)):
+                segment.append(statement)
+                if (len(segment) == self.window):
+                    result.extend(self.share(segment, properties))
+                    segment = list()
+                continue
+            result.extend(self.share(segment, properties))
+            result.append(statement)
+            segment = list()
+        result.extend(self.share(segment, properties))
+        return result
+
+    def share(
+        self, segment: typing.List[ast.Statement],
+        properties: typing.FrozenSet[str]
+    ) -> typing.List[ast.Statement]:
+        # Statements outside a shared range are reused, so is their scan
+        cache: typing.Dict[ast.Statement, typing.Tuple] = dict()
+        for _ in range(self.rewrites):
+            if (self.__scanned > self.budget):
+                break
+            group: typing.List[typing.Any] = \
+                self.repeated(segment, properties, cache)
+            if (group is None):
+                return segment
+            expression, first, last = group
+            key: typing.Tuple = self.key(expression)
+            temp: ast.Name = self.temporary('cse')
+
+            # The scan found every occurrence, so they are matched by node
+            targets: typing.Set[int] = set(list([
+                id(occurrence)
+                for statement in segment[first:last + 1]
+                for occurrence, other, _ in cache[statement][0]
+                if (other == key)
+            ]))
+
+            def substitute(child: ast.Expression) -> ast.Expression:
+                if (id(child) in targets):
+                    return temp
+                return shallow(child, substitute)
+
+            # Only rebuild the statements the expression occurs in
+            statements: typing.List[ast.Statement] = list([
+                transform(statement, substitute)
+                if (any(key == other for _, other, _ in cache[statement][0]))
+                else statement
+                for statement in segment[first:last + 1]
+            ])
+            segment = segment[:first] \
+                + list([ast.Assignment(temp, expression)]) \
+                + statements + segment[last + 1:]
+        return segment
+
+    def repeated(
+        self, segment: typing.List[ast.Statement],
+        properties: typing.FrozenSet[str],
+        cache: typing.Dict[ast.Statement, typing.Tuple]
+    ) -> typing.List[typing.Any]:
+        # Occurrences are shared until one of their names is assigned
+        live: typing.Dict[typing.Tuple, typing.List[typing.Any]] = dict()
+        watched: typing.Dict[str, typing.Set[typing.Tuple]] = dict()
+        groups: typing.List[typing.List[typing.Any]] = list()
+        for index, statement in enumerate(segment):
+            if (statement not in cache):
+                cache[statement] = self.scan(statement)
+            occurrences, killed, effects = cache[statement]
+            if (effects):
+                # A callee or a property write may change any name that
+                # is not local, even before the rest of the statement runs
+                for key in list(live):
+                    if (not all(list([
+                        self.local(identifier) for identifier in live[key][4]
+                    ]))):
+                        groups.append(live.pop(key))
+            for expression, key, names in occurrences:
+                if (names & properties):
+                    continue
+                if (key in live):
+                    live[key][2] = index
+                    live[key][3] += 1
+                    continue
+                elif (effects):
+                    # The temporary would run before the effect does
+                    continue
+                live[key] = list([expression, index, index, 1, names])
+                for identifier in names:
+                    watched.setdefault(identifier, set()).add(key)
+            for identifier in killed:
+                for key in watched.pop(identifier, set()):
+                    if (key in live):
+                        groups.append(live.pop(key))
+        groups.extend(live.values())
+
+        best: typing.List[typing.Any] = None
+        for group in groups:
+            if (group[3] < 2):
+                continue
+            if (best is None or self.size(group[0]) > self.size(best[0])):
+                best = group
+        if (best is None):
+            return None
+        return best[:3]
+
+    def scan(self, statement: ast.Statement) -> typing.Tuple:
+        # A straight statement binds at most the name it assigns
+        occurrences, effects = self.subexpressions(statement)
+        killed: typing.Set[str] = set()
+        if (isinstance(statement, ast.Assignment)):
+            killed.add(statement.name.identifier)
+        return tuple((occurrences, killed, effects,))
+
+    def reaches(self, nodes: typing.List[ast.ASTNode]) -> bool:
+        finder: EffectFinder = EffectFinder()
+        for node in nodes:
+            finder.traverse(node)
+        return finder.result
+
+    def effects(self, statement: ast.Statement) -> bool:
+        # A call may print, a property write is seen by other code
+        expression: ast.Expression = statement
+        if (isinstance(statement, ast.DotAssignment)):
+            return True
+        elif (isinstance(statement, (ast.Assignment, ast.Return))):
+            expression = statement.expression
+        if (expression is None):
+            return False
+        collector: CallCollector = CallCollector()
+        collector.traverse(expression)
+        return bool(collector.result)
+
+    def subexpressions(self, statement: ast.Statement) -> typing.Tuple:
+        # Compound pure expressions outermost first, each with its key and
+        # names, built bottom up in a single walk that also finds effects
+        result: typing.List[typing.Tuple] = list()
+        effects: bool = isinstance(statement, ast.DotAssignment)
+
+        def collect(expression: ast.Expression) -> typing.Tuple:
+            self.__scanned += 1
+            kind: typing.Type = type(expression)
+            if (isinstance(expression, ast.Name)):
+                return tuple((
+                    tuple(('Name', expression.identifier,)),
+                    frozenset(list([expression.identifier])),
+                ))
+            elif (kind in LITERALTYPES):
+                return tuple((
+                    tuple((kind.__name__, expression.literal,)), frozenset(),
+                ))
+            elif (kind not in BINARYTYPES and kind not in UNARYTYPES):
+                nonlocal effects
+                effects = effects or issubclass(kind, (ast.Call, ast.Let))
+                # A let body reads names bound inside it, leave it alone
+                if (kind is ast.Let):
+                    operands: typing.List[ast.Expression] = list([
+                        value for _, value in expression.bindings
+                    ])
+                else:
+                    operands: typing.List[ast.Expression] = \
+                        OPERANDS.get(kind, lambda node: list())(expression)
+                for operand in operands:
+                    collect(operand)
+                return None
+            index: int = len(result)
+            result.append(None)
+            if (kind in BINARYTYPES):
+                left: typing.Tuple = collect(expression.left)
+                right: typing.Tuple = collect(expression.right)
+                if (left is None or right is None):
+                    return None
+                found: typing.Tuple = tuple((
+                    tuple((kind.__name__, left[0], right[0],)),
+                    left[1] | right[1],
+                ))
+            else:
+                right: typing.Tuple = collect(expression.right)
+                if (right is None):
+                    return None
+                found: typing.Tuple = tuple((
+                    tuple((kind.__name__, right[0],)), right[1],
+                ))
+            result[index] = tuple((expression, *found,))
+            return found
+
+        if (isinstance(statement, ast.DotAssignment)):
+            collect(statement.dotname.expression)
+            collect(statement.expression)
+        elif (isinstance(statement, (ast.Assignment, ast.Return))):
+            if (statement.expression is not None):
+                collect(statement.expression)
+        else:
+            collect(statement)
+        return tuple((
+            list([
+                occurrence for occurrence in result
+                if (occurrence is not None)
+            ]),
+            effects,
+        ))
+
+    def assigned(
+        self, statements: typing.List[ast.Statement]
+    ) -> typing.Set[str]:
+        return set([identifier for identifier, _ in assignments(statements)])
+
+    def compound(self, expression: ast.Expression) -> bool:
+        return bool(
+            type(expression) in BINARYTYPES or type(expression) in UNARYTYPES
+        )
+
+    def invariant(
+        self, expression: ast.Expression, variant: typing.Set[str]
+    ) -> bool:
+        return bool(
+            self.compound(expression) and pure(expression)
+            and not (self.names(expression) & variant)
+        )
+
+    def names(self, expression: ast.Expression) -> typing.Set[str]:
+        if (isinstance(expression, ast.Name)):
+            return set([expression.identifier])
+        elif (type(expression) in BINARYTYPES):
+            return self.names(expression.left) | self.names(expression.right)
+        elif (type(expression) in UNARYTYPES):
+            return self.names(expression.right)
+        return set()
+
+    def size(self, expression: ast.Expression) -> int:
+        if (type(expression) in BINARYTYPES):
+            return 1 + self.size(expression.left) + self.size(expression.right)
+        elif (type(expression) in UNARYTYPES):
+            return 1 + self.size(expression.right)
+        return 1
+
+    def key(self, expression: ast.Expression) -> typing.Tuple:
+        # Structural identity of a pure expression
+        if (isinstance(expression, ast.Name)):
+            return tuple(('Name', expression.identifier,))
+        elif (type(expression) in LITERALTYPES):
+            return tuple((type(expression).__name__, expression.literal,))
+        elif (type(expression) in BINARYTYPES):
+            return tuple((
+                type(expression).__name__,
+                self.key(expression.left), self.key(expression.right),
+            ))
+        return tuple((
+            type(expression).__name__, self.key(expression.right),
+        ))
+
+
+def optimize(program: ast.Program) -> ast.Program:
+    optimizer: Optimizer = Optimizer()
+    return optimizer.optimize(program)
+
+
+class Specializer(object):
+
+    def __init__(self) -> None:
+        self.__returns: typing.Dict[str, str] = dict()
+
+    def specialize(self, program: ast.Program) -> ast.Program:
+        if (program is None):
+            return program
+        statements: typing.List[ast.Statement] = program.block.statements
+        self.__returns = dict()
+        self.returns(statements)
+        statements = self.scope(statements, dict())
+        return ast.Program(ast.Block(statements))
+
+    def returns(self, statements: typing.List[ast.Statement]) -> None:
+        # Return annotation of every function and method, by name
+        for statement in statements:
+            if (isinstance(statement, (ast.FunctionDef, ast.MethodDef))):
+                identifier: str = statement.name.identifier
+                typename: str = self.typename(
+                    statement.kwargs.get('returntype')
+                )
+                self.__returns[identifier] = self.join(
+                    self.__returns.get(identifier, UNASSIGNED), typename
+                )
+            for block in blocks(statement):
+                self.returns(block.statements)
+
+    def scope(
+        self, statements: typing.List[ast.Statement],
+        annotations: typing.Dict[str, str]
+    ) -> typing.List[ast.Statement]:
+        # Join every assignment of a name until nothing changes
+        bindings: typing.List[typing.Tuple[str, ast.Expression]] = \
+            assignments(statements)
+        types: typing.Dict[str, str] = dict(annotations)
+        for identifier, _ in bindings:
+            types.setdefault(identifier, UNASSIGNED)
+        changed: bool = True
+        while (changed):
+            changed = False
+            for identifier, expression in bindings:
+                typename: str = UNKNOWN
+                if (expression is not None):
+                    typename = self.infer(expression, types)
+                joined: str = self.join(types[identifier], typename)
+                if (joined != types[identifier]):
+                    types[identifier] = joined
+                    changed = True
+        return self.rewrite(statements, types)
+
+    def rewrite(
+        self, statements: typing.List[ast.Statement],
+        types: typing.Dict[str, str]
+    ) -> typing.List[ast.Statement]:
+        result: typing.List[ast.Statement] = list()
+        for statement in statements:
+            result.append(self.statement(statement, types))
+        return result
+
+    def statement(
+        self, statement: ast.Statement, types: typing.Dict[str, str]
+    ) -> ast.Statement:
+        def function(expression: ast.Expression) -> ast.Expression:
+            return self.expression(expression, types)
+
+        if (isinstance(statement, ast.If)):
+            elifs: typing.List[ast.Elif] = list([
+                ast.Elif(
+                    function(elifstatement.expression),
+                    self.block(elifstatement.block, types),
+                    self.block(elifstatement.elseblock, types),
+                )
+                for elifstatement in statement.elifs
+            ])
+            return ast.If(
+                function(statement.expression),
+                self.block(statement.block, types),
+                elifs=elifs,
+                elseblock=self.block(statement.elseblock, types),
+            )
+        elif (isinstance(statement, ast.Switch)):
+            return ast.Switch(
+                statement.name,
+                dict({
+                    case: self.block(block, types)
+                    for case, block in statement.cases.items()
+                }),
+                elseblock=self.block(statement.elseblock, types),
+            )
+        elif (isinstance(statement, ast.Loop)):
+            return ast.Loop(
+                function(statement.expression),
+                self.block(statement.block, types),
+                preheader=self.block(statement.preheader, types),
+            )
+        elif (isinstance(statement, ast.Iterate)):
+            return ast.Iterate(
+                function(statement.iterable), statement.variable,
+                self.block(statement.block, types),
+                preheader=self.block(statement.preheader, types),
+            )
+        elif (isinstance(statement, (ast.FunctionDef, ast.MethodDef))):
+            return self.define(statement, dict())
+        elif (isinstance(statement, ast.ClassDef)):
+            # Properties take their annotation inside every method
+            properties: typing.Dict[str, str] = dict({
+                identifier: self.typename(property.typename)
+                for identifier, property in statement.properties.items()
+            })
+            statements: typing.List[ast.Statement] = list([
+                self.define(classstatement, properties)
+                if (isinstance(classstatement, ast.MethodDef))
+                else classstatement
+                for classstatement in statement.block.statements
+            ])
+            return ast.ClassDef(
+                statement.name, ast.Block(statements), **statement.kwargs
+            )
+        elif (isinstance(statement, STRAIGHT)):
+            return transform(statement, function)
+        return statement
+
+    def block(
+        self, block: ast.Block, types: typing.Dict[str, str]
+    ) -> ast.Block:
+        if (block is None):
+            return block
+        return ast.Block(self.rewrite(block.statements, types))
+
+    def define(
+        self, definition: ast.Statement, annotations: typing.Dict[str, str]
+    ) -> ast.Statement:
+        if (deferred(definition)):
+            return definition
+        annotations = dict(annotations)
+        for parameter in definition.parameters:
+            annotations[parameter.name.identifier] = \
+                self.typename(parameter.typename)
+        statements: typing.List[ast.Statement] = \
+            self.scope(definition.block.statements, annotations)
+        return type(definition)(
+            definition.name, definition.parameters, ast.Block(statements),
+            **definition.kwargs
+        )
+
+    def expression(
+        self, expression: ast.Expression, types: typing.Dict[str, str]
+    ) -> ast.Expression:
+        return self.typed(expression, types)[0]
+
+    def typed(
+        self, expression: ast.Expression, types: typing.Dict[str, str]
+    ) -> typing.Tuple[ast.Expression, str]:
+        # Rewritten bottom up with its type, so each operand is inferred once
+        kind: typing.Type = type(expression)
+        if (kind not in BINARYTYPES):
+            astnode: ast.Expression = rebuild(
+                expression, lambda child: self.expression(child, types)
+            )
+            return tuple((astnode, self.infer(astnode, types),))
+        left, lefttype = self.typed(expression.left, types)
+        right, righttype = self.typed(expression.right, types)
+        astnode: ast.Expression = \
+            REBUILD[kind](expression, list([left, right]))
+        if (not isinstance(astnode, ast.Specialized)):
+            specialized: typing.Type = \
+                SPECIALIZED.get(tuple((kind, lefttype,)))
+            if (lefttype == righttype and specialized is not None):
+                astnode = specialized(left, right)
+        return tuple((astnode, self.binary(kind, lefttype, righttype),))
+
+    def infer(
+        self, expression: ast.Expression, types: typing.Dict[str, str]
+    ) -> str:
+        # Operators first, they are most of any expression
+        if (type(expression) in BINARYTYPES):
+            return self.binary(
+                type(expression),
+                self.infer(expression.left, types),
+                self.infer(expression.right, types),
+            )
+        elif (isinstance(expression, ast.Name)):
+            return types.get(expression.identifier, UNKNOWN)
+        elif (isinstance(expression, ast.Null)):
+            return UNKNOWN
+        elif (type(expression) in LITERALTYPES):
+            return type(expression).__name__
+        elif (isinstance(expression, (ast.UPlus, ast.UMinus))):
+            right: str = self.infer(expression.right, types)
+            if (right in NUMBER or right == UNASSIGNED):
+                return right
+            return UNKNOWN
+        elif (isinstance(expression, ast.Not)):
+            return 'Boolean'
+        elif (isinstance(expression, ast.Call)):
+            # Trust the annotation, the specialized nodes are guarded
+            target: ast.Expression = expression.expression
+            if (isinstance(target, ast.DotName)):
+                target = target.name
+            if (isinstance(target, ast.Name)):
+                typename: str = self.__returns.get(target.identifier, UNKNOWN)
+                return UNKNOWN if (typename == UNASSIGNED) else typename
+        return UNKNOWN
+
+    def binary(self, kind: typing.Type, left: str, right: str) -> str:
+        if (UNASSIGNED in (left, right)):
+            return UNASSIGNED
+        generic: typing.Type = kind
+        if (issubclass(kind, ast.Specialized)):
+            generic = generic.__bases__[-1]
+        specialized: typing.Type = SPECIALIZED.get(tuple((generic, left,)))
+        if (left == right and specialized is not None):
+            return specialized.resulttype.__name__
+        elif (left in NUMBER and right in NUMBER):
+            if (issubclass(generic, COMPARISON)):
+                return 'Boolean'
+            elif (issubclass(generic, ARITHMETIC)):
+                return 'Float'
+        return UNKNOWN
+
+    def typename(self, annotation: ast.Expression) -> str:
+        if (isinstance(annotation, ast.Name)):
+            return annotation.identifier
+        return UNKNOWN
+
+    def join(self, left: str, right: str) -> str:
+        if (left == UNASSIGNED or left == right):
+            return right
+        elif (right == UNASSIGNED):
+            return left
+        return UNKNOWN
+
+
+def specialize(program: ast.Program) -> ast.Program:
+    specializer: Specializer = Specializer()
+    return specializer.specialize(program)
+
+
+class Inliner(object):
+
+    # Largest function body inlined, in expression nodes
+    budget: int = 16
+
+    # Expression nodes the whole pass may add to the program
+    growth: int = 1000
+
+    def __init__(self) -> None:
+        self.__count: int = 0
+        self.__growth: int = 0
+        self.__recursive: typing.Set[ast.Statement] = set()
+        self.__counts: typing.Dict[str, int] = dict()
+
+    def inline(self, program: ast.Program) -> ast.Program:
+        if (program is None):
+            return program
+        statements: typing.List[ast.Statement] = program.block.statements
+
+        # Functions bound once in the whole program, since any caller up
+        # the chain may rebind the name a callee calls
+        counts: typing.Dict[str, int] = bindings(statements)
+        if (None in counts):
+            return program
+        self.__counts = counts
+        functions: typing.Dict[str, ast.FunctionDef] = dict({
+            statement.name.identifier: statement
+            for statement in statements
+            if (isinstance(statement, ast.FunctionDef)
+                and counts[statement.name.identifier] == 1
+                and self.expressionof(statement) is not None)
+        })
+        self.__recursive = self.recursive(statements, functions)
+        callees: typing.Dict[str, typing.Tuple] = dict({
+            identifier: tuple((definition, frozenset(),))
+            for identifier, definition in functions.items()
+        })
+
+        # A top level call before the definition fails, so it stays a call
+        result: typing.List[ast.Statement] = list()
+        defined: typing.Dict[str, typing.Tuple] = dict()
+        for statement in statements:
+            result.append(self.statement(statement, defined, callees))
+            if (isinstance(statement, ast.FunctionDef)
+                    and statement.name.identifier in callees):
+                identifier: str = statement.name.identifier
+                defined[identifier] = callees[identifier]
+        return ast.Program(ast.Block(result))
+
+    def expressionof(self, definition: ast.Statement) -> ast.Expression:
+        if (deferred(definition)):
+            return None
+        statements: typing.List[ast.Statement] = definition.block.statements
+        if (len(statements) == 1 and isinstance(statements[0], ast.Return)):
+            return statements[0].expression
+        return None
+
+    def recursive(
+        self, statements: typing.List[ast.Statement],
+        functions: typing.Dict[str, ast.FunctionDef]
+    ) -> typing.Set[ast.Statement]:
+        # Call graph of every candidate body, by the definition called
+        graph: typing.Dict[ast.Statement, typing.List[ast.Statement]] = dict()
+        for definition in functions.values():
+            graph[definition] = list([
+                functions[identifier]
+                for identifier in self.calls(self.expressionof(definition))
+                if (identifier in functions)
+            ])
+        for statement in statements:
+            if (not isinstance(statement, ast.ClassDef)):
+                continue
+            for definition in self.methods(statement).values():
+                graph[definition] = list([
+                    statement.methods[identifier]
+                    if (identifier in statement.methods)
+                    else functions[identifier]
+                    for identifier in self.calls(self.expressionof(definition))
+                    if (identifier in statement.methods
+                        or identifier in functions)
+                ])
+
+        result: typing.Set[ast.Statement] = set()
+        for definition in graph:
+            visited: typing.Set[ast.Statement] = set()
+            pending: typing.List[ast.Statement] = list(graph[definition])
+            while (pending):
+                callee: ast.Statement = pending.pop()
+                if (callee is definition):
+                    result.add(definition)
+                    break
+                elif (callee in visited):
+                    continue
+                visited.add(callee)
+                pending.extend(graph.get(callee, list()))
+        return result
+
+    def methods(
+        self, classdef: ast.ClassDef
+    ) -> typing.Dict[str, ast.MethodDef]:
+        return dict({
+            identifier: definition
+            for identifier, definition in classdef.methods.items()
+            if (identifier != classdef.name.identifier
+                and self.__counts.get(identifier) == 1
+                and self.expressionof(definition) is not None)
+        })
+
+    def statement(
+        self, statement: ast.Statement,
+        callees: typing.Dict[str, typing.Tuple],
+        functions: typing.Dict[str, typing.Tuple]
+    ) -> ast.Statement:
+        def function(expression: ast.Expression) -> ast.Expression:
+            return self.expression(expression, callees)
+
+        if (isinstance(statement, STRAIGHT)):
+            return transform(statement, function)
+        elif (isinstance(statement, ast.If)):
+            elifs: typing.List[ast.Elif] = list([
+                ast.Elif(
+                    function(elifstatement.expression),
+                    self.block(elifstatement.block, callees, functions),
+                    self.block(elifstatement.elseblock, callees, functions),
+                )
+                for elifstatement in statement.elifs
+            ])
+            return ast.If(
+                function(statement.expression),
+                self.block(statement.block, callees, functions),
+                elifs=elifs,
+                elseblock=self.block(statement.elseblock, callees, functions),
+            )
+        elif (isinstance(statement, ast.Loop)):
+            return ast.Loop(
+                function(statement.expression),
+                self.block(statement.block, callees, functions),
+                preheader=self.block(statement.preheader, callees, functions),
+            )
+        elif (isinstance(statement, ast.Iterate)):
+            return ast.Iterate(
+                function(statement.iterable), statement.variable,
+                self.block(statement.block, callees, functions),
+                preheader=self.block(statement.preheader, callees, functions),
+            )
+        elif (isinstance(statement, DEFINITION) and deferred(statement)):
+            return statement
+        elif (isinstance(statement, (ast.FunctionDef, ast.MethodDef))):
+            # A body runs later, every top level function is defined by then
+            return self.define(
+                statement, self.enter(functions, statement, frozenset())
+            )
+        elif (isinstance(statement, ast.ClassDef)):
+            # Properties and methods come before the scope around the class
+            shadowed: typing.FrozenSet[str] = frozenset(
+                list(statement.properties) + list(statement.methods)
+            )
+            methods: typing.Dict[str, typing.Tuple] = dict({
+                identifier: tuple((definition, frozenset(),))
+                for identifier, definition in self.methods(statement).items()
+            })
+            statements: typing.List[ast.Statement] = list()
+            for classstatement in statement.block.statements:
+                if (isinstance(classstatement, ast.MethodDef)
+                        and not deferred(classstatement)):
+                    scope: typing.Dict[str, typing.Tuple] = \
+                        self.enter(functions, classstatement, shadowed)
+                    scope.update(
+                        self.enter(methods, classstatement, frozenset())
+                    )
+                    classstatement = self.define(classstatement, scope)
+                statements.append(classstatement)
+            return ast.ClassDef(
+                statement.name, ast.Block(statements), **statement.kwargs
+            )
+        return statement
+
+    def block(
+        self, block: ast.Block,
+        callees: typing.Dict[str, typing.Tuple],
+        functions: typing.Dict[str, typing.Tuple]
+    ) -> ast.Block:
+        if (block is None):
+            return block
+        return ast.Block(list([
+            self.statement(statement, callees, functions)
+            for statement in block.statements
+        ]))
+
+    def enter(
+        self, callees: typing.Dict[str, typing.Tuple],
+        definition: ast.Statement, shadowed: typing.FrozenSet[str]
+    ) -> typing.Dict[str, typing.Tuple]:
+        # Names bound in the body hide the scope a callee was defined in
+        local: typing.Set[str] = set([
+            identifier
+            for identifier, _ in assignments(definition.block.statements)
+        ])
+        local |= set([
+            parameter.name.identifier for parameter in definition.parameters
+        ])
+        local |= shadowed
+        return dict({
+            identifier: tuple((callee, hidden | local,))
+            for identifier, (callee, hidden) in callees.items()
+            if (identifier not in local)
+        })
+
+    def define(
+        self, definition: ast.Statement,
+        callees: typing.Dict[str, typing.Tuple]
+    ) -> ast.Statement:
+        statements: typing.List[ast.Statement] = list([
+            self.statement(statement, callees, callees)
+            for statement in definition.block.statements
+        ])
+        return type(definition)(
+            definition.name, definition.parameters, ast.Block(statements),
+            **definition.kwargs
+        )
+
+    def expression(
+        self, expression: ast.Expression,
+        callees: typing.Dict[str, typing.Tuple]
+    ) -> ast.Expression:
+        astnode: ast.Expression = rebuild(
+            expression, lambda child: self.expression(child, callees)
+        )
+        if (isinstance(astnode, ast.Call)
+                and isinstance(astnode.expression, ast.Name)
+                and astnode.expression.identifier in callees):
+            callee: typing.Tuple = callees[astnode.expression.identifier]
+            return self.substitute(astnode, callee, callees)
+        return astnode
+
+    def substitute(
+        self, call: ast.Call, callee: typing.Tuple,
+        callees: typing.Dict[str, typing.Tuple]
+    ) -> ast.Expression:
+        definition, shadowed = callee
+        if (definition in self.__recursive):
+            return call
+        parameters: typing.List[str] = list([
+            parameter.name.identifier for parameter in definition.parameters
+        ])
+        if (len(parameters) != len(call.arguments)):
+            return call
+        body: ast.Expression = self.expressionof(definition)
+        if (parameters and self.calls(body)):
+            # A function called from the body may read the parameters
+            return call
+        size: int = self.size(body)
+        if (size > self.budget or self.__growth + size > self.growth):
+            return call
+        if ((set(self.uses(body)) - set(parameters)) & shadowed):
+            return call
+        self.__growth += size
+
+        # Arguments are evaluated once and in order, unless they are plain
+        simple: bool = not (
+            self.calls(body)
+            or any(self.calls(argument) for argument in call.arguments)
+        )
+        uses: typing.Dict[str, int] = self.uses(body)
+        replacements: typing.Dict[str, ast.Expression] = dict()
+        bindings: typing.List[typing.Tuple[ast.Name, ast.Expression]] = list()
+        for identifier, argument in zip(parameters, call.arguments):
+            used: int = uses.get(identifier, 0)
+            if (isinstance(argument, LITERAL)
+                    or (simple and isinstance(argument, ast.Name) and used)
+                    or (simple and pure(argument) and used == 1)):
+                replacements[identifier] = argument
+                continue
+            temp: ast.Name = ast.Name(f'$inline{self.__count}')
+            self.__count += 1
+            replacements[identifier] = temp
+            bindings.append(tuple((temp, argument,)))
+        body = self.rename(body, replacements)
+
+        # Calls left in the body now resolve from the call site
+        body = self.expression(body, callees)
+        if (bindings):
+            return ast.Let(bindings, body)
+        return body
+
+    def rename(
+        self, expression: ast.Expression,
+        replacements: typing.Dict[str, ast.Expression]
+    ) -> ast.Expression:
+        if (isinstance(expression, ast.Name)):
+            return replacements.get(expression.identifier, expression)
+        return rebuild(
+            expression, lambda child: self.rename(child, replacements)
+        )
+
+    def uses(self, expression: ast.Expression) -> typing.Dict[str, int]:
+        counter: UseCounter = UseCounter()
+        counter.traverse(expression)
+        return counter.result
+
+    def calls(self, expression: ast.Expression) -> typing.List[str]:
+        # Names called directly, an empty list for a call free expression
+        collector: CallCollector = CallCollector()
+        collector.traverse(expression)
+        return collector.result
+
+    def size(self, expression: ast.Expression) -> int:
+        counter: SizeCounter = SizeCounter()
+        counter.traverse(expression)
+        return counter.result
+
+
+def inline(program: ast.Program) -> ast.Program:
+    inliner: Inliner = Inliner()
+    return inliner.inline(program)
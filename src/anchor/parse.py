@@ -7,7 +7,414 @@ import anchor.ast as ast
 import anchor.system as system
 
 
-__all__: typing.List[str] = list(['AnchorParser', ])
+__all__: typing.List[str] = list(['AnchorParser', 'StreamParser', ])
+
+
+class HashCons(object):
+
+    # Atoms keyed by their literal text
+    literals: typing.Tuple[typing.Type] = tuple((
+        ast.Boolean, ast.Null, ast.String, ast.Integer, ast.Float,
+        ast.Complex,
+    ))
+
+    def __init__(self) -> None:
+        self.nodes: typing.Dict[typing.Tuple, ast.Expression] = dict()
+        self.canonical: typing.Set[int] = set()
+
+    def share(self, node: ast.Expression) -> ast.Expression:
+        key: typing.Tuple = self.key(node)
+        if (key is None):
+            return node
+        shared: ast.Expression = self.nodes.get(key)
+        if (shared is not None):
+            ast.count(ast.STATISTICS['shared'], type(node).__name__)
+            return shared
+        self.nodes[key] = node
+        self.canonical.add(id(node))
+        return node
+
+    def key(self, node: ast.Expression) -> typing.Tuple:
+        # Operators quicken and dotted names cache per site, never shared
+        children: typing.List[ast.Expression] = None
+        if (isinstance(node, self.literals)):
+            return tuple((type(node), node.literal,))
+        elif (isinstance(node, ast.Name)):
+            return tuple((ast.Name, node.identifier,))
+        elif (isinstance(node, (ast.Tuple, ast.List))):
+            children = node.expressions
+        elif (isinstance(node, ast.Dict)):
+            children = list([
+                expression for kvpair in node.kvpairs for expression in kvpair
+            ])
+        elif (isinstance(node, (ast.UPlus, ast.UMinus, ast.Not))):
+            children = list([node.right])
+        elif (isinstance(node, (ast.Or, ast.And, ast.DoubleStar))):
+            children = list([node.left, node.right])
+        elif (isinstance(node, ast.Call)):
+            children = list([node.expression]) + node.arguments
+        else:
+            return None
+
+        # Canonical children make their identities a structural key
+        identities: typing.Tuple[int] = tuple([
+            id(child) for child in children
+        ])
+        for identity in identities:
+            if (identity not in self.canonical):
+                return None
+        return tuple((type(node),)) + identities
+
+
+class PrattParser(object):
+
+    # Binary operators by token, prefix operators by token and level
+    binary: typing.Dict[str, typing.Type] = dict({
+        token.OR: ast.Or, token.AND: ast.And,
+        token.EQEQUAL: ast.EqEqual, token.NOTEQUAL: ast.NotEqual,
+        token.LESS: ast.Less, token.LESSEQUAL: ast.LessEqual,
+        token.GREATER: ast.Greater, token.GREATEREQUAL: ast.GreaterEqual,
+        token.PLUS: ast.Plus, token.MINUS: ast.Minus, token.STAR: ast.Star,
+        token.DOUBLESTAR: ast.DoubleStar, token.SLASH: ast.Slash,
+        token.DOUBLESLASH: ast.DoubleSlash, token.PERCENT: ast.Percent,
+    })
+    prefix: typing.Dict[str, typing.Tuple[typing.Type, str]] = dict({
+        token.NOT: tuple((ast.Not, token.NOT,)),
+        token.PLUS: tuple((ast.UPlus, token.UPLUS,)),
+        token.MINUS: tuple((ast.UMinus, token.UMINUS,)),
+    })
+
+    def __init__(self, module: 'Parser') -> None:
+        self.module: Parser = module
+
+        # Levels from the precedence table, loosest binding first
+        self.levels: typing.Dict[str, typing.Tuple[int, str]] = dict()
+        for level, (associativity, *tokens) in enumerate(module.precedence):
+            for name in tokens:
+                self.levels[name] = tuple((level + 1, associativity,))
+        self.operators: typing.Dict[str, typing.Tuple] = dict({
+            name: self.levels[name] + tuple((cls,))
+            for name, cls in self.binary.items()
+        })
+
+    def parse(self, input: str = None, lexer: lex.LazyLexer = None):
+        # Same entry as the table parser, state lives in one descent
+        if (lexer is None):
+            lexer = self.module.lexer.lexer
+        if (input is not None):
+            lexer.input(input)
+        descent: Descent = Descent(self, lexer)
+        try:
+            return descent.program()
+        except SyntaxError:
+            self.module.p_error(descent.token)
+            return None
+
+
+class Descent(object):
+
+    # Tokens that close a block, None is the end of input
+    closers: typing.FrozenSet[str] = frozenset((
+        token.END, token.ELIF, token.ELSE, None,
+    ))
+
+    # Literal tokens by node type, read from their text
+    literals: typing.Dict[str, typing.Type] = dict({
+        token.NULL: ast.Null, 'INTEGER': ast.Integer, 'FLOAT': ast.Float,
+        'COMPLEX': ast.Complex, 'STRING': ast.String,
+    })
+
+    def __init__(self, backend: PrattParser, lexer: lex.LazyLexer) -> None:
+        self.backend: PrattParser = backend
+        self.module: Parser = backend.module
+        self.operators: typing.Dict[str, typing.Tuple] = backend.operators
+        self.lexer: lex.LazyLexer = lexer
+        self.token: lex.lex.LexToken = lexer.token()
+        self.kind: str = self.token.type if (self.token) else None
+        self.following: lex.lex.LexToken = None
+        self.previous: str = None
+
+    def advance(self) -> lex.lex.LexToken:
+        current: lex.lex.LexToken = self.token
+        self.previous = self.kind
+        if (self.following is not None):
+            self.token = self.following
+            self.following = None
+        else:
+            self.token = self.lexer.token()
+        self.kind = self.token.type if (self.token) else None
+        return current
+
+    def peek(self) -> str:
+        if (self.following is None):
+            self.following = self.lexer.token()
+        return self.following.type if (self.following) else None
+
+    def expect(self, kind: str) -> lex.lex.LexToken:
+        if (self.kind != kind):
+            raise SyntaxError(kind)
+        return self.advance()
+
+    def accept(self, kind: str) -> bool:
+        if (self.kind != kind):
+            return False
+        self.advance()
+        return True
+
+    def program(self) -> ast.ASTNode:
+        if (self.accept('LAZYBODY')):
+            block: ast.Block = self.block()
+            self.expect(None)
+            return block
+        elif (self.kind is None):
+            return None
+        statements: typing.List[ast.Statement] = list()
+        while (self.kind is not None):
+            self.module.toplevel(statements, self.statement())
+        return ast.Program(ast.Block(statements))
+
+    def block(self) -> ast.Block:
+        statements: typing.List[ast.Statement] = list([self.statement()])
+        while (self.kind not in self.closers):
+            statements.append(self.statement())
+        return ast.Block(statements)
+
+    def body(self) -> ast.Block:
+        if (self.kind == 'LAZYBODY'):
+            source, lineno = self.advance().value
+            return ast.LazyBlock(source, lineno, self.module.body)
+        return self.block()
+
+    def statement(self) -> ast.Statement:
+        kind: str = self.kind
+        if (kind == 'NAME' and self.peek() == token.EQUAL):
+            name: ast.Name = self.name()
+            self.advance()
+            expression: ast.Expression = self.expression(0)
+            self.expect(token.SEMI)
+            return ast.Assignment(name, expression)
+        elif (kind == token.IF):
+            return self.ifstatement()
+        elif (kind == token.ITERATE):
+            self.advance()
+            iterable: ast.Expression = self.expression(0)
+            self.expect(token.FOR)
+            variable: ast.Name = self.name()
+            self.expect(token.BEGIN)
+            block: ast.Block = self.block()
+            self.expect(token.END)
+            return ast.Iterate(iterable, variable, block)
+        elif (kind == token.LOOP):
+            self.advance()
+            expression: ast.Expression = self.expression(0)
+            self.expect(token.BEGIN)
+            block: ast.Block = self.block()
+            self.expect(token.END)
+            return ast.Loop(expression, block)
+        elif (kind == token.FUNCTION):
+            return self.definition(ast.FunctionDef)
+        elif (kind == token.METHOD):
+            return self.definition(ast.MethodDef)
+        elif (kind == token.CLASS):
+            self.advance()
+            name: ast.Name = self.name()
+            self.expect(token.BEGIN)
+            block: ast.Block = self.block()
+            self.expect(token.END)
+            return ast.ClassDef(name, block)
+        elif (kind == token.PROPERTY):
+            self.advance()
+            name: ast.Name = self.name()
+            if (self.accept(token.COLON)):
+                typename: ast.Name = self.name()
+                self.expect(token.SEMI)
+                return ast.Property(name, typename)
+            self.expect(token.SEMI)
+            return ast.Property(name)
+        elif (kind == token.BREAK):
+            literal: str = self.advance().value
+            self.expect(token.SEMI)
+            return ast.Break(literal=literal)
+        elif (kind == token.CONTINUE):
+            literal: str = self.advance().value
+            self.expect(token.SEMI)
+            return ast.Continue(literal=literal)
+        elif (kind == token.RETURN):
+            self.advance()
+            expression: ast.Expression = self.expression(0)
+            self.expect(token.SEMI)
+            return ast.Return(expression=expression)
+
+        # Only a trailing dot and name may be assigned to, never a group
+        expression: ast.Expression = self.expression(0)
+        if (self.kind == token.EQUAL and self.previous == 'NAME'
+                and isinstance(expression, ast.DotName)):
+            self.advance()
+            value: ast.Expression = self.expression(0)
+            self.expect(token.SEMI)
+            return ast.DotAssignment(expression, value)
+        self.expect(token.SEMI)
+        return expression
+
+    def ifstatement(self) -> ast.If:
+        self.advance()
+        expression: ast.Expression = self.expression(0)
+        self.expect(token.THEN)
+        block: ast.Block = self.block()
+        elifs: typing.List[ast.Elif] = list()
+        while (self.accept(token.ELIF)):
+            elifexpression: ast.Expression = self.expression(0)
+            self.expect(token.THEN)
+            elifblock: ast.Block = self.block()
+            elifs.append(ast.Elif(elifexpression, elifblock))
+        elseblock: ast.Block = None
+        if (self.accept(token.ELSE)):
+            elseblock = self.block()
+        self.expect(token.END)
+        if (elifs and elseblock):
+            return ast.If(expression, block, elifs=elifs, elseblock=elseblock)
+        elif (elifs):
+            return ast.If(expression, block, elifs=elifs)
+        elif (elseblock):
+            return ast.If(expression, block, elseblock=elseblock)
+        return ast.If(expression, block)
+
+    def definition(self, cls: typing.Type) -> ast.Statement:
+        self.advance()
+        name: ast.Name = self.name()
+        self.expect(token.LPAR)
+        parameters: typing.List[ast.Parameter] = list()
+        while (self.kind != token.RPAR):
+            parameter: ast.Name = self.name()
+            if (self.accept(token.COLON)):
+                parameters.append(ast.Parameter(parameter, self.name()))
+            else:
+                parameters.append(ast.Parameter(parameter))
+            if (not self.accept(token.COMMA)):
+                break
+        self.expect(token.RPAR)
+        self.expect(token.RARROW)
+        returntype: ast.Expression = self.expression(0)
+        self.expect(token.BEGIN)
+        body: ast.Block = self.body()
+        self.expect(token.END)
+        return cls(name, parameters, body, returntype=returntype)
+
+    def name(self) -> ast.Name:
+        identifier: str = self.expect('NAME').value
+        return self.module.share(ast.Name(identifier))
+
+    def expression(self, level: int) -> ast.Expression:
+        # Climb while the next operator binds tighter than the caller
+        left: ast.Expression = self.unary()
+        nonassoc: int = None
+        while (True):
+            operator: typing.Tuple = self.operators.get(self.kind)
+            if (operator is None):
+                return left
+            operatorlevel, associativity, cls = operator
+            if (operatorlevel <= level):
+                return left
+            elif (operatorlevel == nonassoc):
+                raise SyntaxError(self.kind)
+            self.advance()
+            if (associativity == 'right'):
+                right: ast.Expression = self.expression(operatorlevel - 1)
+            else:
+                right: ast.Expression = self.expression(operatorlevel)
+            left = self.module.share(cls(left, right))
+            nonassoc = None
+            if (associativity == 'nonassoc'):
+                nonassoc = operatorlevel
+
+    def unary(self) -> ast.Expression:
+        prefix: typing.Tuple[typing.Type, str] = \
+            self.backend.prefix.get(self.kind)
+        if (prefix is not None):
+            cls, name = prefix
+            self.advance()
+            right: ast.Expression = self.expression(
+                self.backend.levels[name][0]
+            )
+            return self.module.share(cls(right))
+
+        # Attributes and calls bind tightest, straight after the atom
+        expression: ast.Expression = self.atom()
+        while (True):
+            kind: str = self.kind
+            if (kind == token.DOT):
+                self.advance()
+                expression = ast.DotName(expression, self.name())
+            elif (kind == token.LPAR):
+                self.advance()
+                arguments: typing.List[ast.Expression] = list()
+                if (self.kind != token.RPAR):
+                    arguments = self.expressions(token.RPAR)
+                self.expect(token.RPAR)
+                expression = self.module.share(
+                    ast.Call(expression, arguments)
+                )
+            else:
+                return expression
+
+    def atom(self) -> ast.Expression:
+        kind: str = self.kind
+        if (kind == 'NAME'):
+            return self.name()
+        elif (kind in self.literals):
+            literal: str = self.advance().value
+            return self.module.share(self.literals[kind](literal=literal))
+        elif (kind == token.TRUE or kind == token.FALSE):
+            self.advance()
+            return self.module.share(ast.Boolean(value=kind == token.TRUE))
+        elif (kind == token.LPAR):
+            return self.group()
+        elif (kind == token.LSQB):
+            self.advance()
+            expressions: typing.List[ast.Expression] = list()
+            if (self.kind != token.RSQB):
+                expressions = self.expressions(token.RSQB)
+            self.expect(token.RSQB)
+            return self.module.share(ast.List(expressions=expressions))
+        elif (kind == token.LBRACE):
+            self.advance()
+            kvpairs: typing.List[typing.Tuple[ast.Expression,
+                                              ast.Expression]] = list()
+            while (self.kind != token.RBRACE):
+                key: ast.Expression = self.expression(0)
+                self.expect(token.COLON)
+                value: ast.Expression = self.expression(0)
+                kvpairs.append(tuple((key, value,)))
+                if (not self.accept(token.COMMA)):
+                    break
+            self.expect(token.RBRACE)
+            return self.module.share(ast.Dict(kvpairs=kvpairs))
+        raise SyntaxError(kind)
+
+    def group(self) -> ast.Expression:
+        # A comma makes a tuple, otherwise the parentheses only group
+        self.advance()
+        if (self.accept(token.RPAR)):
+            return self.module.share(ast.Tuple(expressions=list()))
+        expression: ast.Expression = self.expression(0)
+        if (not self.accept(token.COMMA)):
+            self.expect(token.RPAR)
+            return expression
+        expressions: typing.List[ast.Expression] = list()
+        if (self.kind != token.RPAR):
+            expressions = self.expressions(token.RPAR)
+        self.expect(token.RPAR)
+        expressions.insert(0, expression)
+        return self.module.share(ast.Tuple(expressions=expressions))
+
+    def expressions(self, closer: str) -> typing.List[ast.Expression]:
+        # Comma separated, a trailing comma before the closer is allowed
+        expressions: typing.List[ast.Expression] = list([
+            self.expression(0)
+        ])
+        while (self.accept(token.COMMA) and self.kind != closer):
+            expressions.append(self.expression(0))
+        return expressions
 
 
 class Parser(abc.ABC):
@@ -19,6 +426,11 @@ class Parser(abc.ABC):
         self.debuglex: bool = kwargs.get('debuglex', False)
         self.debugyacc: bool = kwargs.get('debugyacc', False)
         self.debuglog: bool = kwargs.get('debuglog', None)
+        self.lazy: bool = kwargs.get('lazy', False)
+        self.hashcons: bool = kwargs.get('hashcons', False)
+        self.backend: str = kwargs.get('backend', 'lalr')
+        self.jobs: int = kwargs.get('jobs', 0)
+        self.table: HashCons = HashCons()
 
         # Build the lexer and parser
         self.lexer: lex.AnchorLexer = lex.AnchorLexer()
@@ -26,16 +438,41 @@ class Parser(abc.ABC):
             debug=self.debuglex,
             debuglog=self.debuglog if self.debuglex else None,
         )
-        self.parser = yacc.yacc(
-            module=self,
-            debug=self.debugyacc,
-            debuglog=self.debuglog if self.debugyacc else None,
-        )
+        if (self.backend == 'pratt'):
+            # Hand-written, needs no tables
+            self.parser = PrattParser(self)
+        else:
+            self.parser = yacc.yacc(
+                module=self,
+                debug=self.debugyacc,
+                debuglog=self.debuglog if self.debugyacc else None,
+            )
 
     def parse(self, data: str) -> ast.ASTNode:
         if (self.debuglex):
             self.lexer.debug(data)
-        return self.parser.parse(data)
+        self.table = HashCons()
+        if (not self.lazy and not self.jobs):
+            return self.parser.parse(data)
+        lexer: lex.lex.Lexer = self.lexer.lexer
+        if (self.jobs):
+            # Large sources are tokenized by worker processes
+            lexer = lex.ChunkedLexer(lexer, self.jobs)
+        if (self.lazy):
+            lexer = lex.LazyLexer(lexer)
+        lexer.input(data)
+        return self.parser.parse(lexer=lexer)
+
+    def share(self, node: ast.Expression) -> ast.Expression:
+        if (not self.hashcons):
+            return node
+        return self.table.share(node)
+
+    def body(self, source: str, lineno: int) -> ast.Block:
+        # Own lexer, a body may load while the program is still parsing
+        lexer: lex.LazyLexer = lex.LazyLexer(self.lexer.lexer.clone())
+        lexer.fragment(source, lineno)
+        return self.parser.parse(lexer=lexer)
 
 
 class AnchorParser(Parser):
@@ -54,15 +491,36 @@ class AnchorParser(Parser):
         ('left', token.STAR, token.SLASH, token.DOUBLESLASH, token.PERCENT,),
         ('right', token.UPLUS, token.UMINUS,),
         ('left', token.DOUBLESTAR,),
-        ('left', token.LPAR, token.RPAR,),
+        ('left', token.DOT, token.LPAR, token.RPAR,),
     ))
 
+    def toplevel(
+        self, statements: typing.List[ast.Statement], statement: ast.Statement
+    ) -> None:
+        statements.append(statement)
+
     def p_program(self, p: yacc.YaccProduction) -> None:
-        '''program : block
+        '''program : toplevel
                    | empty'''
-        if (p[1]):
-            block: ast.Block = p[1]
-            p[0] = ast.Program(block)
+        if (p[1] is not None):
+            statements: typing.List[ast.Statement] = p[1]
+            p[0] = ast.Program(ast.Block(statements))
+
+    def p_program_lazybody(self, p: yacc.YaccProduction) -> None:
+        '''program : LAZYBODY block'''
+        block: ast.Block = p[2]
+        p[0] = block
+
+    def p_toplevel(self, p: yacc.YaccProduction) -> None:
+        '''toplevel : toplevel statement
+                    | statement'''
+        statements: typing.List[ast.Statement] = list()
+        if (len(p) == 3):
+            statements = p[1]
+        statement: ast.Statement = p[len(p) - 1]
+        if (statement):
+            self.toplevel(statements, statement)
+        p[0] = statements
 
     def p_block(self, p: yacc.YaccProduction) -> None:
         '''block : statements'''
@@ -88,12 +546,26 @@ class AnchorParser(Parser):
         expression: ast.Expression = p[3]
         p[0] = ast.Assignment(name, expression)
 
+    def p_statement_dotassignment(self, p: yacc.YaccProduction) -> None:
+        '''statement : expression DOT name EQUAL expression SEMI'''
+        dotname: ast.DotName = ast.DotName(p[1], p[3])
+        expression: ast.Expression = p[5]
+        p[0] = ast.DotAssignment(dotname, expression)
+
     def p_statement_if(self, p: yacc.YaccProduction) -> None:
-        '''statement : IF expression THEN block elifs END'''
-        expression: ast.Expression = p[2]
-        block: ast.Block = p[4]
-        elifs: typing.List[ast.Elif] = p[5]
-        p[0] = ast.If(expression, block, elifs=elifs)
+        '''statement : IF expression THEN block elifs elseblock END
+                     | IF expression THEN block elifs END'''
+        if (len(p) == 8):
+            expression: ast.Expression = p[2]
+            block: ast.Block = p[4]
+            elifs: typing.List[ast.Elif] = p[5]
+            elseblock: ast.Block = p[6]
+            p[0] = ast.If(expression, block, elifs=elifs, elseblock=elseblock)
+        elif (len(p) == 7):
+            expression: ast.Expression = p[2]
+            block: ast.Block = p[4]
+            elifs: typing.List[ast.Elif] = p[5]
+            p[0] = ast.If(expression, block, elifs=elifs)
 
     def p_statement_ifelse(self, p: yacc.YaccProduction) -> None:
         '''statement : IF expression THEN block elseblock END
@@ -109,20 +581,15 @@ class AnchorParser(Parser):
             p[0] = ast.If(expression, block)
 
     def p_elifs(self, p: yacc.YaccProduction) -> None:
-        '''elifs : ELIF expression THEN block elifs'''
-        expression: ast.Expression = p[2]
-        block: ast.Block = p[4]
-        elifs: typing.List[ast.Elif] = p[5]
-        p[0] = list([ast.Elif(expression, block)]) + elifs
-
-    def p_elifs_else(self, p: yacc.YaccProduction) -> None:
-        '''elifs : ELIF expression THEN block elseblock
+        '''elifs : elifs ELIF expression THEN block
                  | ELIF expression THEN block'''
+        # Left recursion appends in place, the parser stack stays shallow
         if (len(p) == 6):
-            expression: ast.Expression = p[2]
-            block: ast.Block = p[4]
-            elseblock: ast.Block = p[5]
-            p[0] = list([ast.Elif(expression, block, elseblock)])
+            elifs: typing.List[ast.Elif] = p[1]
+            expression: ast.Expression = p[3]
+            block: ast.Block = p[5]
+            elifs.append(ast.Elif(expression, block))
+            p[0] = elifs
         elif (len(p) == 5):
             expression: ast.Expression = p[2]
             block: ast.Block = p[4]
@@ -148,9 +615,9 @@ class AnchorParser(Parser):
 
     def p_statement_functiondef(self, p: yacc.YaccProduction) -> None:
         '''statement : FUNCTION name LPAR parameters RPAR \
-                       RARROW expression BEGIN block END
+                       RARROW expression BEGIN body END
                      | FUNCTION name LPAR RPAR \
-                       RARROW expression BEGIN block END'''
+                       RARROW expression BEGIN body END'''
         if (len(p) == 11):
             name: ast.Name = p[2]
             parameters: typing.List[ast.Parameter] = p[4]
@@ -162,12 +629,22 @@ class AnchorParser(Parser):
         elif (len(p) == 10):
             name: ast.Name = p[2]
             parameters: typing.List[ast.Parameter] = list()
-            returntype: ast.Expression = p[7]
+            returntype: ast.Expression = p[6]
             body: ast.Block = p[8]
             p[0] = ast.FunctionDef(
                 name, parameters, body, returntype=returntype
             )
 
+    def p_body(self, p: yacc.YaccProduction) -> None:
+        '''body : block
+                | LAZYBODY'''
+        if (p.slice[1].type == 'LAZYBODY'):
+            source, lineno = p[1]
+            p[0] = ast.LazyBlock(source, lineno, self.body)
+        else:
+            block: ast.Block = p[1]
+            p[0] = block
+
     def p_statement_classdef(self, p: yacc.YaccProduction) -> None:
         '''statement : CLASS name BEGIN block END'''
         name: ast.Name = p[2]
@@ -175,15 +652,21 @@ class AnchorParser(Parser):
         p[0] = ast.ClassDef(name, block)
 
     def p_statement_property(self, p: yacc.YaccProduction) -> None:
-        '''statement : PROPERTY name SEMI'''
-        name: ast.Name = p[2]
-        p[0] = ast.Property(name)
+        '''statement : PROPERTY name COLON name SEMI
+                     | PROPERTY name SEMI'''
+        if (len(p) == 6):
+            name: ast.Name = p[2]
+            typename: ast.Name = p[4]
+            p[0] = ast.Property(name, typename)
+        elif (len(p) == 4):
+            name: ast.Name = p[2]
+            p[0] = ast.Property(name)
 
     def p_statement_methoddef(self, p: yacc.YaccProduction) -> None:
         '''statement : METHOD name LPAR parameters RPAR \
-                       RARROW expression BEGIN block END
+                       RARROW expression BEGIN body END
                      | METHOD name LPAR RPAR \
-                       RARROW expression BEGIN block END'''
+                       RARROW expression BEGIN body END'''
         if (len(p) == 11):
             name: ast.Name = p[2]
             parameters: typing.List[ast.Parameter] = p[4]
@@ -249,15 +732,15 @@ class AnchorParser(Parser):
 
     def p_expression_or(self, p: yacc.YaccProduction) -> None:
         '''expression : expression OR expression'''
-        p[0] = ast.Or(p[1], p[3])
+        p[0] = self.share(ast.Or(p[1], p[3]))
 
     def p_expression_and(self, p: yacc.YaccProduction) -> None:
         '''expression : expression AND expression'''
-        p[0] = ast.And(p[1], p[3])
+        p[0] = self.share(ast.And(p[1], p[3]))
 
     def p_exrepssion_not(self, p: yacc.YaccProduction) -> None:
         '''expression : NOT expression'''
-        p[0] = ast.Not(p[2])
+        p[0] = self.share(ast.Not(p[2]))
 
     def p_expression_relationalop(self, p: yacc.YaccProduction) -> None:
         '''expression : expression EQEQUAL expression
@@ -300,7 +783,7 @@ class AnchorParser(Parser):
         elif (operator == token.STAR):
             p[0] = ast.Star(left, right)
         elif (operator == token.DOUBLESTAR):
-            p[0] = ast.DoubleStar(left, right)
+            p[0] = self.share(ast.DoubleStar(left, right))
         elif (operator == token.SLASH):
             p[0] = ast.Slash(left, right)
         elif (operator == token.DOUBLESLASH):
@@ -314,9 +797,9 @@ class AnchorParser(Parser):
         right: ast.Expression = p[2]
         operator: str = token.NAME[p[1]]
         if (operator == token.PLUS):
-            p[0] = ast.UPlus(right)
+            p[0] = self.share(ast.UPlus(right))
         elif (operator == token.MINUS):
-            p[0] = ast.UMinus(right)
+            p[0] = self.share(ast.UMinus(right))
 
     def p_expression_group(self, p: yacc.YaccProduction) -> None:
         '''expression : LPAR expression RPAR'''
@@ -334,11 +817,11 @@ class AnchorParser(Parser):
         if (len(p) == 5):
             expression: ast.Expression = p[1]
             arguments: typing.List[ast.Expression] = p[3]
-            p[0] = ast.Call(expression, arguments)
+            p[0] = self.share(ast.Call(expression, arguments))
         elif (len(p) == 4):
             expression: ast.Expression = p[1]
             arguments: typing.List[ast.Expression] = []
-            p[0] = ast.Call(expression, arguments)
+            p[0] = self.share(ast.Call(expression, arguments))
 
     def p_arguments(self, p: yacc.YaccProduction) -> None:
         '''arguments : args COMMA
@@ -374,35 +857,35 @@ class AnchorParser(Parser):
 
     def p_name(self, p: yacc.YaccProduction) -> None:
         '''name : NAME'''
-        p[0] = ast.Name(p[1])
+        p[0] = self.share(ast.Name(p[1]))
 
     def p_true(self, p: yacc.YaccProduction) -> None:
         '''true : TRUE'''
-        p[0] = ast.Boolean(value=True)
+        p[0] = self.share(ast.Boolean(value=True))
 
     def p_false(self, p: yacc.YaccProduction) -> None:
         '''false : FALSE'''
-        p[0] = ast.Boolean(value=False)
+        p[0] = self.share(ast.Boolean(value=False))
 
     def p_null(self, p: yacc.YaccProduction) -> None:
         '''null : NULL'''
-        p[0] = ast.Null(literal=p[1])
+        p[0] = self.share(ast.Null(literal=p[1]))
 
     def p_integer(self, p: yacc.YaccProduction) -> None:
         '''integer : INTEGER'''
-        p[0] = ast.Integer(literal=p[1])
+        p[0] = self.share(ast.Integer(literal=p[1]))
 
     def p_float(self, p: yacc.YaccProduction) -> None:
         '''float : FLOAT'''
-        p[0] = ast.Float(literal=p[1])
+        p[0] = self.share(ast.Float(literal=p[1]))
 
     def p_complex(self, p: yacc.YaccProduction) -> None:
         '''complex : COMPLEX'''
-        p[0] = ast.Complex(literal=p[1])
+        p[0] = self.share(ast.Complex(literal=p[1]))
 
     def p_string(self, p: yacc.YaccProduction) -> None:
         '''string : STRING'''
-        p[0] = ast.String(literal=p[1])
+        p[0] = self.share(ast.String(literal=p[1]))
 
     def p_tuple(self, p: yacc.YaccProduction) -> None:
         '''tuple : LPAR expression COMMA expressions RPAR
@@ -411,21 +894,22 @@ class AnchorParser(Parser):
         if (len(p) == 6):
             expression: ast.Expression = p[2]
             expressions: typing.List[ast.Expression] = p[4]
-            p[0] = ast.Tuple(expressions=list([expression] + expressions))
+            expressions.insert(0, expression)
+            p[0] = self.share(ast.Tuple(expressions=expressions))
         elif (len(p) == 5):
             expression: ast.Expression = p[2]
-            p[0] = ast.Tuple(expressions=list([expression]))
+            p[0] = self.share(ast.Tuple(expressions=list([expression])))
         elif (len(p) == 3):
-            p[0] = ast.Tuple(expressions=list())
+            p[0] = self.share(ast.Tuple(expressions=list()))
 
     def p_list(self, p: yacc.YaccProduction) -> None:
         '''list : LSQB expressions RSQB
                 | LSQB RSQB'''
         if (len(p) == 4):
             expressions: typing.List[ast.Expression] = p[2]
-            p[0] = ast.List(expressions=expressions)
+            p[0] = self.share(ast.List(expressions=expressions))
         elif (len(p) == 3):
-            p[0] = ast.List(expressions=list())
+            p[0] = self.share(ast.List(expressions=list()))
 
     def p_dict(self, p: yacc.YaccProduction) -> None:
         '''dict : LBRACE kvpairs RBRACE
@@ -433,9 +917,9 @@ class AnchorParser(Parser):
         if (len(p) == 4):
             kvpairs: typing.List[typing.Tuple[ast.Expression,
                                               ast.Expression]] = p[2]
-            p[0] = ast.Dict(kvpairs=kvpairs)
+            p[0] = self.share(ast.Dict(kvpairs=kvpairs))
         elif (len(p) == 3):
-            p[0] = ast.Dict(kvpairs=list())
+            p[0] = self.share(ast.Dict(kvpairs=list()))
 
     def p_expressions(self, p: yacc.YaccProduction) -> None:
         '''expressions : expressions_ COMMA
@@ -488,3 +972,18 @@ class AnchorParser(Parser):
     def p_error(self, p: yacc.YaccProduction) -> None:
         system.GLOBAL.logger.debug(f'Error: {p}')
         pass
+
+
+class StreamParser(AnchorParser):
+
+    def __init__(
+        self, consumer: typing.Callable[[ast.Statement], None], **kwargs
+    ) -> None:
+        self.consumer: typing.Callable[[ast.Statement], None] = consumer
+        super().__init__(**kwargs)
+
+    def toplevel(
+        self, statements: typing.List[ast.Statement], statement: ast.Statement
+    ) -> None:
+        # Hand each top-level statement over once reduced, then drop it
+        self.consumer(statement)
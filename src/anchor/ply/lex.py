@@ -39,6 +39,7 @@ import types
 import copy
 import os
 import inspect
+import hashlib
 
 # This tuple contains acceptable string types
 StringTypes = (str, bytes)
@@ -55,6 +56,9 @@ class LexError(Exception):
 
 # Token class.  This class is used to represent the tokens produced.
 class LexToken(object):
+    # Slots keep a token small and its fields fast, one is made per match
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
     def __repr__(self):
         return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
 
@@ -709,13 +713,88 @@ class LexerReflect(object):
                     self.error = True
             linen += 1
 
+# -----------------------------------------------------------------------------
+#                        === Lexer specification cache ===
+#
+# Validating the rules and compiling the master regular expressions is the
+# bulk of lex().  With lex(cache=True) the validated specification (master
+# regexes, group to rule maps, ignore sets, error and eof rules) is kept,
+# in memory for the life of the process, keyed by a hash of the token rules.
+# Nothing is written to disk.  A later lex() call with the same rules
+# rebuilds the Lexer straight from it.  Rule functions are stored by name
+# and looked up again on the new module.
+# -----------------------------------------------------------------------------
+
+_lexspecs = {}
+
+def _lexspec_key(ldict, reflags):
+    rules = [reflags]
+    for name in sorted(ldict):
+        value = ldict[name]
+        if name in ('tokens', 'literals', 'states'):
+            rules.append((name, value))
+        elif name.startswith('t_'):
+            if isinstance(value, StringTypes):
+                rules.append((name, value))
+            elif hasattr(value, '__code__'):
+                # Function rules are ordered by line number
+                rules.append((name, _get_regex(value), value.__code__.co_firstlineno))
+    return hashlib.sha1(repr(rules).encode('utf-8')).hexdigest()
+
+def _lexspec_name(f):
+    return f.__name__ if f else None
+
+def _lexspec_dump(lexobj):
+    statere = {}
+    for state, ritem in lexobj.lexstatere.items():
+        statere[state] = []
+        for cre, findex in ritem:
+            names = [(f[0].__name__, f[1]) if f and f[0] else f for f in findex]
+            statere[state].append((cre, names))
+    return {
+        'tokens': lexobj.lextokens,
+        'literals': lexobj.lexliterals,
+        'stateinfo': lexobj.lexstateinfo,
+        'statere': statere,
+        'stateretext': lexobj.lexstateretext,
+        'staterenames': lexobj.lexstaterenames,
+        'stateignore': lexobj.lexstateignore,
+        'stateerrorf': {s: _lexspec_name(f) for s, f in lexobj.lexstateerrorf.items()},
+        'stateeoff': {s: _lexspec_name(f) for s, f in lexobj.lexstateeoff.items()},
+        'reflags': lexobj.lexreflags,
+    }
+
+def _lexspec_lexer(spec, ldict):
+    lexobj = Lexer()
+    lexobj.lextokens = set(spec['tokens'])
+    lexobj.lexliterals = spec['literals']
+    lexobj.lextokens_all = lexobj.lextokens | set(lexobj.lexliterals)
+    for state, ritem in spec['statere'].items():
+        lexobj.lexstatere[state] = []
+        for cre, names in ritem:
+            findex = [(ldict[f[0]], f[1]) if f and f[0] else f for f in names]
+            lexobj.lexstatere[state].append((cre, findex))
+    lexobj.lexstateretext = {s: list(t) for s, t in spec['stateretext'].items()}
+    lexobj.lexstaterenames = {s: list(n) for s, n in spec['staterenames'].items()}
+    lexobj.lexstateinfo = dict(spec['stateinfo'])
+    lexobj.lexre = lexobj.lexstatere['INITIAL']
+    lexobj.lexretext = lexobj.lexstateretext['INITIAL']
+    lexobj.lexreflags = spec['reflags']
+    lexobj.lexstateignore = dict(spec['stateignore'])
+    lexobj.lexignore = lexobj.lexstateignore.get('INITIAL', '')
+    lexobj.lexstateerrorf = {s: ldict[f] if f else None for s, f in spec['stateerrorf'].items()}
+    lexobj.lexerrorf = lexobj.lexstateerrorf.get('INITIAL', None)
+    lexobj.lexstateeoff = {s: ldict[f] if f else None for s, f in spec['stateeoff'].items()}
+    lexobj.lexeoff = lexobj.lexstateeoff.get('INITIAL', None)
+    return lexobj
+
 # -----------------------------------------------------------------------------
 # lex(module)
 #
 # Build all of the regular expression rules from definitions in the supplied module
 # -----------------------------------------------------------------------------
 def lex(*, module=None, object=None, debug=False, 
-        reflags=int(re.VERBOSE), debuglog=None, errorlog=None):
+        reflags=int(re.VERBOSE), debuglog=None, errorlog=None, cache=False):
 
     global lexer
 
@@ -745,6 +824,17 @@ def lex(*, module=None, object=None, debug=False,
     else:
         ldict = get_caller_module_dict(2)
 
+    # Rebuild from a cached specification of the same rules
+    if cache and not debug:
+        key = _lexspec_key(ldict, reflags)
+        spec = _lexspecs.get(key)
+        if spec is not None:
+            lexobj = _lexspec_lexer(spec, ldict)
+            token = lexobj.token
+            input = lexobj.input
+            lexer = lexobj
+            return lexobj
+
     # Collect parser information from the dictionary
     linfo = LexerReflect(ldict, log=errorlog, reflags=reflags)
     linfo.get_all()
@@ -845,6 +935,9 @@ def lex(*, module=None, object=None, debug=False,
             if s not in linfo.ignore:
                 linfo.ignore[s] = linfo.ignore.get('INITIAL', '')
 
+    if cache and not debug:
+        _lexspecs[key] = _lexspec_dump(lexobj)
+
     # Create global versions of the token() and input() functions
     token = lexobj.token
     input = lexobj.input
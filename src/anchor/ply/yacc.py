@@ -154,6 +154,10 @@ def format_stack_entry(r):
 #        .endlexpos  = Ending lex position (optional, set automatically)
 
 class YaccSymbol:
+    # Slots keep a symbol small and its fields fast, one is made per reduction
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno', 'endlexpos',
+                 'lexer')
+
     def __str__(self):
         return self.type
 
@@ -170,6 +174,8 @@ class YaccSymbol:
 # representing the range of positional information for a symbol.
 
 class YaccProduction:
+    __slots__ = ('slice', 'stack', 'lexer', 'parser')
+
     def __init__(self, s, stack=None):
         self.slice = s
         self.stack = stack
@@ -177,12 +183,14 @@ class YaccProduction:
         self.parser = None
 
     def __getitem__(self, n):
-        if isinstance(n, slice):
+        # Integer indexes are the common case, a slice fails the comparison
+        try:
+            if n >= 0:
+                return self.slice[n].value
+            else:
+                return self.stack[n].value
+        except TypeError:
             return [s.value for s in self.slice[n]]
-        elif n >= 0:
-            return self.slice[n].value
-        else:
-            return self.stack[n].value
 
     def __setitem__(self, n, v):
         self.slice[n].value = v
@@ -271,6 +279,16 @@ class LRParser:
     # character index.
 
     def parse(self, input=None, lexer=None, debug=False, tracking=False):
+        if debug or tracking:
+            return self.parsedebug(input, lexer, debug, tracking)
+        return self.parseopt_notrack(input, lexer)
+
+    # parsedebug().
+    #
+    # The general parsing engine, with the debugging and position tracking
+    # branches in its inner loop.
+
+    def parsedebug(self, input=None, lexer=None, debug=False, tracking=False):
         # If debugging has been specified as a flag, turn it into a logging object
         if isinstance(debug, int) and debug:
             debug = PlyLogger(sys.stderr)
@@ -580,6 +598,253 @@ class LRParser:
             # If we'r here, something really bad happened
             raise RuntimeError('yacc: internal parser error!!!\n')
 
+    # parseopt_notrack().
+    #
+    # Optimized version of parsedebug() used when neither debugging nor
+    # position tracking is requested.  The debug and tracking branches are
+    # removed from the inner loop and each production's name, length and
+    # function are looked up once per parse instead of once per reduction.
+    # Error recovery is unchanged.  Make sure changes to parsedebug() are
+    # made here as well.
+
+    def parseopt_notrack(self, input=None, lexer=None):
+        lookahead = None                         # Current lookahead symbol
+        lookaheadstack = []                      # Stack of lookahead symbols
+        actions = self.action                    # Local reference to action table (to avoid lookup on self.)
+        goto    = self.goto                      # Local reference to goto table (to avoid lookup on self.)
+        prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
+        defaulted_states = self.defaulted_states # Local reference to defaulted states
+        pslice  = YaccProduction(None)           # Production object passed to grammar rules
+        errorcount = 0                           # Used during error recovery
+        symbol  = YaccSymbol                     # Local reference to the symbol class
+
+        # Name, length and function of each production, by number
+        rules = [(p.name, p.len, p.callable) for p in prod]
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+            lexer = lex.lexer
+
+        # Set up the lexer and parser objects on pslice
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        # Set the token function
+        get_token = self.token = lexer.token
+
+        # Set up the state and symbol stacks
+        statestack = self.statestack = []   # Stack of parsing states
+        symstack = self.symstack = []       # Stack of grammar symbols
+        pslice.stack = symstack             # Put in the production
+        errtoken   = None                   # Err token
+
+        # The start state is assumed to be (0,$end)
+
+        statestack.append(0)
+        sym = symbol()
+        sym.type = '$end'
+        symstack.append(sym)
+        state = 0
+        while True:
+            # Get the next symbol on the input.  If a lookahead symbol
+            # is already set, we just use that. Otherwise, we'll pull
+            # the next token off of the lookaheadstack or from the lexer
+
+            if state not in defaulted_states:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()     # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = symbol()
+                        lookahead.type = '$end'
+
+                # Check the action table
+                t = actions[state].get(lookahead.type)
+            else:
+                t = defaulted_states[state]
+
+            if t is not None:
+                if t > 0:
+                    # shift a symbol on the stack
+                    statestack.append(t)
+                    state = t
+                    symstack.append(lookahead)
+                    lookahead = None
+
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                    continue
+
+                if t < 0:
+                    # reduce a symbol on the stack, emit a production
+                    pname, plen, callable = rules[-t]
+
+                    # Get production function
+                    sym = symbol()
+                    sym.type = pname       # Production name
+                    sym.value = None
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            del symstack[-plen:]
+                            self.state = state
+                            callable(pslice)
+                            del statestack[-plen:]
+                            symstack.append(sym)
+                            state = goto[statestack[-1]][pname]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            symstack.extend(targ[1:-1])         # Put the production slice back on the stack
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+
+                        continue
+
+                    else:
+                        targ = [sym]
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            self.state = state
+                            callable(pslice)
+                            symstack.append(sym)
+                            state = goto[statestack[-1]][pname]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+
+                        continue
+
+                if t == 0:
+                    n = symstack[-1]
+                    result = getattr(n, 'value', None)
+                    return result
+
+            if t is None:
+
+                # We have some kind of parsing error here.  To handle
+                # this, we are going to push the current token onto
+                # the tokenstack and replace it with an 'error' token.
+                # If there are any synchronization rules, they may
+                # catch it.
+                #
+                # In addition to pushing the error token, we call call
+                # the user defined p_error() function if this is the
+                # first syntax error.  This function is only called if
+                # errorcount == 0.
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == '$end':
+                        errtoken = None               # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, 'lexer'):
+                            errtoken.lexer = lexer
+                        self.state = state
+                        tok = self.errorfunc(errtoken)
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, 'lineno'):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                            else:
+                                sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                        else:
+                            sys.stderr.write('yacc: Parse error in input. EOF\n')
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # case 1:  the statestack only has 1 entry on it.  If we're in this state, the
+                # entire parse has been rolled back and we're completely hosed.   The token is
+                # discarded and we just keep going.
+
+                if len(statestack) <= 1 and lookahead.type != '$end':
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    # Nuke the pushback stack
+                    del lookaheadstack[:]
+                    continue
+
+                # case 2: the statestack has a couple of entries on it, but we're
+                # at the end of the file. nuke the top entry and generate an error token
+
+                # Start nuking entries on the stack
+                if lookahead.type == '$end':
+                    # Whoa. We're really hosed here. Bail out
+                    return
+
+                if lookahead.type != 'error':
+                    sym = symstack[-1]
+                    if sym.type == 'error':
+                        # Hmmm. Error is on top of stack, we'll just nuke input
+                        # symbol and continue
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol for the first time and make it the new lookahead symbol
+                    t = symbol()
+                    t.type = 'error'
+
+                    if hasattr(lookahead, 'lineno'):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, 'lexpos'):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                else:
+                    sym = symstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # If we'r here, something really bad happened
+            raise RuntimeError('yacc: internal parser error!!!\n')
+
 # -----------------------------------------------------------------------------
 #                          === Grammar Representation ===
 #
@@ -1261,6 +1526,8 @@ class Grammar(object):
 # Inputs:  X    - An input set
 #          R    - A relation
 #          FP   - Set-valued function
+#
+# Sets are integer bitsets over the terminals, so each union is a single '|'.
 # ------------------------------------------------------------------------------
 
 def digraph(X, R, FP):
@@ -1285,9 +1552,7 @@ def traverse(x, N, stack, F, X, R, FP):
         if N[y] == 0:
             traverse(y, N, stack, F, X, R, FP)
         N[x] = min(N[x], N[y])
-        for a in F.get(y, []):
-            if a not in F[x]:
-                F[x].append(a)
+        F[x] |= F.get(y, 0)
     if N[x] == d:
         N[stack[-1]] = MAXINT
         F[stack[-1]] = F[x]
@@ -1321,8 +1586,9 @@ class LRTable:
         self.lr_action     = {}        # Action table
         self.lr_goto       = {}        # Goto table
         self.lr_productions  = grammar.Productions    # Copy of grammar Production array
-        self.lr_goto_cache = {}        # Cache of computed gotos
-        self.lr0_cidhash   = {}        # Cache of closures
+        self.lr0_kernels   = {}        # Kernel item tuple -> state number
+        self.lr0_gotos     = []        # Per state, symbol -> state number
+        self.lr_terminals  = {}        # Terminal -> lookahead bit
 
         self._add_count    = 0         # Internal counter used to detect cycles
 
@@ -1366,54 +1632,21 @@ class LRTable:
 
         return J
 
-    # Compute the LR(0) goto function goto(I,X) where I is a set
-    # of LR(0) items and X is a grammar symbol.   This function is written
-    # in a way that guarantees uniqueness of the generated goto sets
-    # (i.e. the same goto set will never be returned as two different Python
-    # objects).  With uniqueness, we can later do fast set comparisons using
-    # id(obj) instead of element-wise comparison.
+    # Compute the LR(0) goto function goto(I,X) where I is the number of a state
+    # and X is a grammar symbol.  All transitions are built once by lr0_items(),
+    # so this is a table lookup.  -1 means there is no transition on X.
 
     def lr0_goto(self, I, x):
-        # First we look for a previously cached entry
-        g = self.lr_goto_cache.get((id(I), x))
-        if g:
-            return g
-
-        # Now we generate the goto set in a way that guarantees uniqueness
-        # of the result
-
-        s = self.lr_goto_cache.get(x)
-        if not s:
-            s = {}
-            self.lr_goto_cache[x] = s
-
-        gs = []
-        for p in I:
-            n = p.lr_next
-            if n and n.lr_before == x:
-                s1 = s.get(id(n))
-                if not s1:
-                    s1 = {}
-                    s[id(n)] = s1
-                gs.append(n)
-                s = s1
-        g = s.get('$end')
-        if not g:
-            if gs:
-                g = self.lr0_closure(gs)
-                s['$end'] = g
-            else:
-                s['$end'] = gs
-        self.lr_goto_cache[(id(I), x)] = g
-        return g
+        return self.lr0_gotos[I].get(x, -1)
+
+    # Compute the LR(0) sets of item function.  States are numbered in the
+    # order they are found.  A goto set is identified by its kernel (the items
+    # advanced over X, in order), so each closure is computed only once.
 
-    # Compute the LR(0) sets of item function
     def lr0_items(self):
         C = [self.lr0_closure([self.grammar.Productions[0].lr_next])]
-        i = 0
-        for I in C:
-            self.lr0_cidhash[id(I)] = i
-            i += 1
+        kernels = self.lr0_kernels
+        gotos = self.lr0_gotos
 
         # Loop over the items in C and each grammar symbols
         i = 0
@@ -1421,18 +1654,35 @@ class LRTable:
             I = C[i]
             i += 1
 
+            # Group the items that advance over each symbol
+            advance = {}
+            for p in I:
+                n = p.lr_next
+                if n:
+                    kernel = advance.get(n.lr_before)
+                    if kernel is None:
+                        advance[n.lr_before] = [n]
+                    else:
+                        kernel.append(n)
+
             # Collect all of the symbols that could possibly be in the goto(I,X) sets
             asyms = {}
             for ii in I:
                 for s in ii.usyms:
                     asyms[s] = None
 
+            row = {}
             for x in asyms:
-                g = self.lr0_goto(I, x)
-                if not g or id(g) in self.lr0_cidhash:
+                kernel = advance.get(x)
+                if not kernel:
                     continue
-                self.lr0_cidhash[id(g)] = len(C)
-                C.append(g)
+                key = tuple(kernel)
+                j = kernels.get(key)
+                if j is None:
+                    j = kernels[key] = len(C)
+                    C.append(self.lr0_closure(kernel))
+                row[x] = j
+            gotos.append(row)
 
         return C
 
@@ -1495,12 +1745,14 @@ class LRTable:
 
     def find_nonterminal_transitions(self, C):
         trans = []
+        seen = set()
         for stateno, state in enumerate(C):
             for p in state:
                 if p.lr_index < p.len - 1:
                     t = (stateno, p.prod[p.lr_index+1])
                     if t[1] in self.grammar.Nonterminals:
-                        if t not in trans:
+                        if t not in seen:
+                            seen.add(t)
                             trans.append(t)
         return trans
 
@@ -1510,24 +1762,24 @@ class LRTable:
     # Computes the DR(p,A) relationships for non-terminal transitions.  The input
     # is a tuple (state,N) where state is a number and N is a nonterminal symbol.
     #
-    # Returns a list of terminals.
+    # Returns a bitset of terminals.
     # -----------------------------------------------------------------------------
 
     def dr_relation(self, C, trans, nullable):
         state, N = trans
-        terms = []
+        terms = 0
+        bits = self.lr_terminals
 
-        g = self.lr0_goto(C[state], N)
+        g = C[self.lr0_goto(state, N)]
         for p in g:
             if p.lr_index < p.len - 1:
                 a = p.prod[p.lr_index+1]
-                if a in self.grammar.Terminals:
-                    if a not in terms:
-                        terms.append(a)
+                if a in bits:
+                    terms |= bits[a]
 
         # This extra bit is to handle the start state
         if state == 0 and N == self.grammar.Productions[0].prod[0]:
-            terms.append('$end')
+            terms |= bits['$end']
 
         return terms
 
@@ -1542,9 +1794,8 @@ class LRTable:
         rel = []
         state, N = trans
 
-        g = self.lr0_goto(C[state], N)
-        j = self.lr0_cidhash.get(id(g), -1)
-        for p in g:
+        j = self.lr0_goto(state, N)
+        for p in C[j]:
             if p.lr_index < p.len - 1:
                 a = p.prod[p.lr_index + 1]
                 if a in empty:
@@ -1584,10 +1835,9 @@ class LRTable:
         lookdict = {}          # Dictionary of lookback relations
         includedict = {}       # Dictionary of include relations
 
-        # Make a dictionary of non-terminal transitions
-        dtrans = {}
-        for t in trans:
-            dtrans[t] = 1
+        # Make a set of non-terminal transitions
+        dtrans = set(trans)
+        terminals = self.grammar.Terminals
 
         # Loop over all transitions and compute lookbacks and includes
         for state, N in trans:
@@ -1614,7 +1864,7 @@ class LRTable:
 
                         li = lr_index + 1
                         while li < p.len:
-                            if p.prod[li] in self.grammar.Terminals:
+                            if p.prod[li] in terminals:
                                 break      # No forget it
                             if p.prod[li] not in nullable:
                                 break
@@ -1623,8 +1873,7 @@ class LRTable:
                             # Appears to be a relation between (j,t) and (state,N)
                             includes.append((j, t))
 
-                    g = self.lr0_goto(C[j], t)               # Go to next set
-                    j = self.lr0_cidhash.get(id(g), -1)      # Go to next state
+                    j = self.lr0_goto(j, t)                  # Go to next state
 
                 # When we get here, j is the final state, now we have to locate the production
                 for r in C[j]:
@@ -1683,7 +1932,7 @@ class LRTable:
     # -----------------------------------------------------------------------------
 
     def compute_follow_sets(self, ntrans, readsets, inclsets):
-        FP = lambda x: readsets[x]
+        FP = readsets.__getitem__
         R  = lambda x: inclsets.get(x, [])
         F = digraph(ntrans, R, FP)
         return F
@@ -1697,19 +1946,30 @@ class LRTable:
     #            followset         -  Computed follow set
     #
     # This function directly attaches the lookaheads to productions contained
-    # in the lookbacks set
+    # in the lookbacks set.  The bitsets are unioned first and expanded into
+    # lists of terminals once, in terminal order.
     # -----------------------------------------------------------------------------
 
     def add_lookaheads(self, lookbacks, followset):
+        lookaheads = {}
         for trans, lb in lookbacks.items():
+            f = followset.get(trans, 0)
             # Loop over productions in lookback
             for state, p in lb:
-                if state not in p.lookaheads:
-                    p.lookaheads[state] = []
-                f = followset.get(trans, [])
-                for a in f:
-                    if a not in p.lookaheads[state]:
-                        p.lookaheads[state].append(a)
+                key = (id(p), state)
+                if key in lookaheads:
+                    lookaheads[key][2] |= f
+                else:
+                    lookaheads[key] = [p, state, f]
+
+        terminals = list(self.lr_terminals)
+        for p, state, f in lookaheads.values():
+            las = []
+            while f:
+                bit = f & -f
+                las.append(terminals[bit.bit_length() - 1])
+                f ^= bit
+            p.lookaheads[state] = las
 
     # -----------------------------------------------------------------------------
     # add_lalr_lookaheads()
@@ -1719,6 +1979,10 @@ class LRTable:
     # -----------------------------------------------------------------------------
 
     def add_lalr_lookaheads(self, C):
+        # Number the terminals for the lookahead bitsets
+        for i, t in enumerate(list(self.grammar.Terminals) + ['$end']):
+            self.lr_terminals[t] = 1 << i
+
         # Determine all of the nullable nonterminals
         nullable = self.compute_nullable_nonterminals()
 
@@ -1838,8 +2102,7 @@ class LRTable:
                         i = p.lr_index
                         a = p.prod[i+1]       # Get symbol right after the "."
                         if a in self.grammar.Terminals:
-                            g = self.lr0_goto(I, a)
-                            j = self.lr0_cidhash.get(id(g), -1)
+                            j = self.lr0_goto(st, a)
                             if j >= 0:
                                 # We are in a shift state
                                 actlist.append((a, p, 'shift and go to state %d' % j))
@@ -1911,8 +2174,7 @@ class LRTable:
                     if s in self.grammar.Nonterminals:
                         nkeys[s] = None
             for n in nkeys:
-                g = self.lr0_goto(I, n)
-                j = self.lr0_cidhash.get(id(g), -1)
+                j = self.lr0_goto(st, n)
                 if j >= 0:
                     st_goto[n] = j
                     log.info('    %-30s shift and go to state %d', n, j)
@@ -0,0 +1,208 @@
+import json
+import typing
+import hashlib
+import anchor.ast as ast
+import anchor.symtable as symtable
+import anchor.visitor as visitor
+
+
+__all__: typing.List[str] = list([
+    'Recorder', 'Replayer', 'fingerprint', 'load',
+])
+
+
+# Layout of a profile file, bumped when a field changes meaning
+FORMAT: int = 2
+
+# Operand type of a specialized operator, by the name a profile stores
+OPERANDTYPES: typing.Dict[str, typing.Type] = dict({
+    operandtype.__name__: operandtype
+    for _, operandtype in ast.SPECIALIZED
+})
+
+
+def fingerprint(data: str, *flags: typing.Any) -> str:
+    # Sites are numbered on the loaded tree, which the flags also shape
+    return hashlib.sha1(
+        data.encode('utf-8') + repr(flags).encode('utf-8')
+    ).hexdigest()
+
+
+def load(stream: typing.TextIO, fingerprint: str) -> typing.Dict:
+    profile: typing.Dict = json.load(stream)
+    if (not isinstance(profile, dict) or profile.get('format') != FORMAT):
+        raise ValueError('profile format not understood')
+    elif (profile.get('fingerprint') != fingerprint):
+        raise ValueError('profile is of another program')
+    return profile
+
+
+class Taken(ast.Expression):
+
+    # A test of a profiled if, moving its count off none of them each time
+    # it holds, so the first test to hold is the one taken
+
+    def __init__(
+        self, expression: ast.Expression, counts: typing.List[int],
+        index: int
+    ) -> None:
+        self.expression: ast.Expression = expression
+        self.counts: typing.List[int] = counts
+        self.index: int = index
+
+    def evaluate(self, st: symtable.SymbolTable) -> ast.ASTNode:
+        condition: ast.Atom = self.expression.evaluate(st)
+        if (condition.value):
+            self.counts[self.index] += 1
+            self.counts[-1] -= 1
+        return condition
+
+
+class ProfiledIf(ast.If):
+
+    # Times each test was taken, the last count for none of them
+    counts: typing.List[int] = None
+
+    def evaluate(self, st: symtable.SymbolTable) -> ast.ASTNode:
+        self.counts[-1] += 1
+        return super().evaluate(st)
+
+
+class Sites(visitor.Transformer):
+
+    # Numbers profiled sites in post-order, the same way on a recording
+    # run and on a replaying run of the same loaded tree
+
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    def site(self) -> str:
+        site: str = str(self.count)
+        self.count += 1
+        return site
+
+
+class Recorder(Sites):
+
+    def __init__(self, fingerprint: str) -> None:
+        super().__init__()
+        self.fingerprint: str = fingerprint
+        self.operators: typing.Dict[str, ast.Adaptive] = dict()
+        self.branches: typing.Dict[str, ProfiledIf] = dict()
+
+    def visitadaptive(self, node: ast.Adaptive) -> ast.ASTNode:
+        self.operators[self.site()] = node
+        return node
+
+    def visitif(self, node: ast.If) -> ast.ASTNode:
+        # Rebuilt around counting tests, the blocks are shared
+        counts: typing.List[int] = list([0]) * (len(node.elifs) + 2)
+        profiled: ProfiledIf = ProfiledIf(
+            Taken(node.expression, counts, 0), node.block,
+            elifs=list([
+                ast.Elif(
+                    Taken(elifstatement.expression, counts, index),
+                    elifstatement.block, elseblock=elifstatement.elseblock,
+                )
+                for index, elifstatement in enumerate(node.elifs, 1)
+            ]),
+            elseblock=node.elseblock,
+        )
+        profiled.counts = counts
+        self.branches[self.site()] = profiled
+        return profiled
+
+    def dump(self, stream: typing.TextIO) -> None:
+        # An operator still quickened at exit kept its operand type
+        profile: typing.Dict = dict({
+            'format': FORMAT,
+            'fingerprint': self.fingerprint,
+            'sites': self.count,
+            'operators': dict({
+                site: type(node).operandtype.__name__
+                for site, node in self.operators.items()
+                if (isinstance(node, ast.Specialized))
+            }),
+            'branches': dict({
+                site: node.counts for site, node in self.branches.items()
+                if (any(node.counts))
+            }),
+        })
+        json.dump(profile, stream, indent=1, sort_keys=True)
+        stream.write('\n')
+
+
+class Replayer(Sites):
+
+    def __init__(self, profile: typing.Dict) -> None:
+        super().__init__()
+        self.operators: typing.Dict[str, str] = profile.get('operators', {})
+        self.branches: typing.Dict[str, typing.List[int]] = \
+            profile.get('branches', {})
+
+    def visitadaptive(self, node: ast.Adaptive) -> ast.ASTNode:
+        # Quickened before its first evaluation, the guard still holds
+        operandtype: typing.Type = \
+            OPERANDTYPES.get(self.operators.get(self.site()))
+        if (operandtype is not None
+                and not isinstance(node, ast.Specialized)):
+            node.quicken(operandtype)
+        return node
+
+    def visitif(self, node: ast.If) -> ast.ASTNode:
+        counts: typing.List[int] = self.branches.get(self.site())
+        if (counts is None or len(counts) != len(node.elifs) + 2):
+            return node
+        return reorder(node, counts)
+
+
+def reorder(statement: ast.If, counts: typing.List[int]) -> ast.Statement:
+    # Only the last elif of a chain carries the else block
+    elseblock: ast.Block = statement.elseblock
+    tests: typing.List[typing.Tuple[ast.Expression, ast.Block]] = \
+        list([tuple((statement.expression, statement.block,))])
+    for index, elifstatement in enumerate(statement.elifs):
+        if (elifstatement.elseblock is not None):
+            if (elseblock is not None
+                    or index != len(statement.elifs) - 1):
+                return statement
+            elseblock = elifstatement.elseblock
+        tests.append(tuple((elifstatement.expression, elifstatement.block,)))
+
+    # Tests may swap only if at most one holds, the same name against
+    # distinct literals, and each is free of side effects
+    name: ast.Name = None
+    literals: typing.Set = set()
+    for expression, _ in tests:
+        if (not isinstance(expression, ast.EqEqual)):
+            return statement
+        operands: typing.List[ast.Expression] = \
+            list([expression.left, expression.right])
+        if (isinstance(operands[0], visitor.LITERAL)):
+            operands.reverse()
+        operand, literal = operands
+        if (not isinstance(operand, ast.Name)
+                or not isinstance(literal, visitor.LITERAL)
+                or isinstance(literal, ast.Null)
+                or literal.value in literals):
+            return statement
+        elif (name is None):
+            name = operand
+        elif (name.identifier != operand.identifier):
+            return statement
+        literals.add(literal.value)
+
+    # Most taken test first, ties keep their source order
+    order: typing.List[int] = sorted(
+        range(len(tests)), key=lambda index: -counts[index]
+    )
+    if (order == list(range(len(tests)))):
+        return statement
+    expression, block = tests[order[0]]
+    return ast.If(
+        expression, block,
+        elifs=list([
+            ast.Elif(*tests[index]) for index in order[1:]
+        ]),
+        elseblock=elseblock,
+    )
@@ -8,10 +8,15 @@ import anchor.factory as factory
 
 
 __all__: typing.List[str] = list([
-    'Type', 'SymbolTable', 'Class', 'Function', 'Symbol',
+    'THIS', 'Type', 'SymbolTable', 'Class', 'Instance', 'Function', 'Frame',
+    'Symbol',
 ])
 
 
+# Name an instance is bound to inside its own methods
+THIS: typing.Literal = 'this'
+
+
 class Symbol(object):
 
     def __init__(
@@ -50,11 +55,16 @@ class Symbol(object):
 class Type(object):
     MAIN = 'MAIN'
     CLASS = 'CLASS'
+    INSTANCE = 'INSTANCE'
     FUNCTION = 'FUNCTION'
 
 
 class SymbolTable(object):
 
+    __slots__: typing.Tuple[str] = tuple((
+        '_identifier', '_type', '_symbols', '_parent',
+    ))
+
     def __init__(self, identifier: str, parent=None) -> None:
         self._identifier: str = identifier
         self._type: Type = Type.MAIN
@@ -76,17 +86,11 @@ class SymbolTable(object):
     def insert(
         self, identifier: str, astnodes: typing.List[ast.ASTNode], **kwargs
     ) -> None:
-        symbol: Symbol = self.lookup(identifier)
-        if (identifier in self.symbols):
-            oldsymbol = self.symbols[identifier]
-            symbol = Symbol(
-                identifier, oldsymbol.astnodes + astnodes, self,
-                **(oldsymbol.kwargs | kwargs)
-            )
-        else:
-            symbol = Symbol(identifier, astnodes, self, **kwargs)
-        assert (symbol is not None)
-        self.symbols[identifier] = symbol
+        # A new binding replaces the old nodes, only the flags are kept
+        oldsymbol: Symbol = self.symbols.get(identifier)
+        if (oldsymbol is not None and oldsymbol.kwargs):
+            kwargs = oldsymbol.kwargs | kwargs
+        self.symbols[identifier] = Symbol(identifier, astnodes, self, **kwargs)
 
     def lookup(self, identifier: str) -> Symbol:
         if (identifier in self.symbols):
@@ -96,6 +100,32 @@ class SymbolTable(object):
         else:
             return None
 
+    def resolve(self, identifier: str) -> ast.ASTNode:
+        if (identifier in self._symbols):
+            return self._symbols[identifier].astnode
+        return self._parent.resolve(identifier)
+
+    def assign(self, identifier: str, astnode: ast.ASTNode) -> None:
+        if (identifier not in self.symbols and self._parent
+                and self._parent.setproperty(identifier, astnode)):
+            return
+        self.insert(identifier, list([astnode]))
+
+    def setproperty(self, identifier: str, astnode: ast.ASTNode) -> bool:
+        symbol: Symbol = self.symbols.get(identifier)
+        if (symbol is None):
+            return bool(
+                self._parent and self._parent.setproperty(identifier, astnode)
+            )
+        elif (symbol.kwargs.get('isproperty', False)):
+            self.insert(identifier, list([astnode]))
+            return True
+        return False
+
+    def retain(self) -> None:
+        if (self._parent):
+            self._parent.retain()
+
 
 class Class(SymbolTable):
 
@@ -110,6 +140,88 @@ class Class(SymbolTable):
         return self.__methods
 
 
+class Instance(SymbolTable):
+
+    __slots__: typing.Tuple[str] = tuple((
+        '_layout', '_values',
+    ))
+
+    def __init__(
+        self, identifier: str, layout: typing.Dict[str, int],
+        values: typing.List[ast.ASTNode], parent: Class = None
+    ) -> None:
+        self._identifier: str = identifier
+        self._type: Type = Type.INSTANCE
+        self._symbols: typing.Dict[str, Symbol] = None
+        self._parent: Class = parent
+        self._layout: typing.Dict[str, int] = layout
+        self._values: typing.List[ast.ASTNode] = values
+
+    @property
+    def symbols(self) -> typing.Dict[str, Symbol]:
+        if (self._symbols is None):
+            self._symbols = dict()
+        return self._symbols
+
+    @property
+    def layout(self) -> typing.Dict[str, int]:
+        return self._layout
+
+    @property
+    def values(self) -> typing.List[ast.ASTNode]:
+        return self._values
+
+    def insert(
+        self, identifier: str, astnodes: typing.List[ast.ASTNode], **kwargs
+    ) -> None:
+        index: int = self._layout.get(identifier)
+        if (index is None):
+            super().insert(identifier, astnodes, **kwargs)
+        else:
+            self._values[index] = astnodes[-1]
+
+    def lookup(self, identifier: str) -> Symbol:
+        index: int = self._layout.get(identifier)
+        if (index is not None):
+            astnodes: typing.List[ast.ASTNode] = list([self._values[index]])
+            return Symbol(identifier, astnodes, self, isproperty=True)
+        elif (identifier == THIS):
+            return Symbol(identifier, list([self]), self)
+        elif (self._symbols and identifier in self._symbols):
+            return self._symbols[identifier]
+        elif (self._parent):
+            return self._parent.lookup(identifier)
+        else:
+            return None
+
+    def resolve(self, identifier: str) -> ast.ASTNode:
+        index: int = self._layout.get(identifier)
+        if (index is not None):
+            return self._values[index]
+        elif (identifier == THIS):
+            return self
+        elif (self._symbols and identifier in self._symbols):
+            return self._symbols[identifier].astnode
+        return self._parent.resolve(identifier)
+
+    def assign(self, identifier: str, astnode: ast.ASTNode) -> None:
+        if (not self.setproperty(identifier, astnode)):
+            super().insert(identifier, list([astnode]))
+
+    def setproperty(self, identifier: str, astnode: ast.ASTNode) -> bool:
+        index: int = self._layout.get(identifier)
+        if (index is not None):
+            self._values[index] = astnode
+            return True
+        elif (identifier == THIS):
+            return False
+        elif (self._symbols and identifier in self._symbols):
+            return super().setproperty(identifier, astnode)
+        return bool(
+            self._parent and self._parent.setproperty(identifier, astnode)
+        )
+
+
 class Function(SymbolTable):
 
     __parameters: typing.List[Symbol] = None
@@ -123,8 +235,121 @@ class Function(SymbolTable):
         return self.__parameters
 
 
+class Frame(SymbolTable):
+
+    __slots__: typing.Tuple[str] = tuple((
+        '_layout', '_values', '_retained',
+    ))
+
+    # Released frames waiting to be reused by the next call
+    __free: typing.List[Frame] = list()
+    __maxfree: int = 256
+
+    def __init__(
+        self, identifier: str, layout: typing.Dict[str, int],
+        values: typing.List[ast.ASTNode], parent: SymbolTable = None
+    ) -> None:
+        self._identifier: str = identifier
+        self._type: Type = Type.FUNCTION
+        self._symbols: typing.Dict[str, Symbol] = None
+        self._parent: SymbolTable = parent
+        self._layout: typing.Dict[str, int] = layout
+        self._values: typing.List[ast.ASTNode] = values
+        self._retained: bool = False
+
+    @classmethod
+    def new(
+        cls, identifier: str, layout: typing.Dict[str, int],
+        values: typing.List[ast.ASTNode], parent: SymbolTable = None
+    ) -> Frame:
+        try:
+            frame: Frame = Frame.__free.pop()
+        except IndexError:
+            return Frame(identifier, layout, values, parent=parent)
+        frame._identifier = identifier
+        frame._parent = parent
+        frame._layout = layout
+        frame._values = values
+        return frame
+
+    @property
+    def symbols(self) -> typing.Dict[str, Symbol]:
+        if (self._symbols is None):
+            self._symbols = dict()
+        return self._symbols
+
+    @property
+    def retained(self) -> bool:
+        return self._retained
+
+    def insert(
+        self, identifier: str, astnodes: typing.List[ast.ASTNode], **kwargs
+    ) -> None:
+        index: int = self._layout.get(identifier)
+        if (index is None):
+            super().insert(identifier, astnodes, **kwargs)
+        else:
+            self._values[index] = astnodes[-1]
+
+    def lookup(self, identifier: str) -> Symbol:
+        index: int = self._layout.get(identifier)
+        if (index is not None):
+            astnodes: typing.List[ast.ASTNode] = list([self._values[index]])
+            return Symbol(identifier, astnodes, self, isparameter=True)
+        elif (self._symbols and identifier in self._symbols):
+            return self._symbols[identifier]
+        elif (self._parent):
+            return self._parent.lookup(identifier)
+        else:
+            return None
+
+    def resolve(self, identifier: str) -> ast.ASTNode:
+        index: int = self._layout.get(identifier)
+        if (index is not None):
+            return self._values[index]
+        elif (self._symbols and identifier in self._symbols):
+            return self._symbols[identifier].astnode
+        return self._parent.resolve(identifier)
+
+    def assign(self, identifier: str, astnode: ast.ASTNode) -> None:
+        index: int = self._layout.get(identifier)
+        if (index is not None):
+            self._values[index] = astnode
+        elif (self._symbols and identifier in self._symbols):
+            super().insert(identifier, list([astnode]))
+        elif (not (self._parent
+                   and self._parent.setproperty(identifier, astnode))):
+            super().insert(identifier, list([astnode]))
+
+    def setproperty(self, identifier: str, astnode: ast.ASTNode) -> bool:
+        if (identifier in self._layout):
+            return False
+        elif (self._symbols and identifier in self._symbols):
+            return super().setproperty(identifier, astnode)
+        return bool(
+            self._parent and self._parent.setproperty(identifier, astnode)
+        )
+
+    def retain(self) -> None:
+        # Something outlives the call and still refers to this frame
+        if (not self._retained):
+            self._retained = True
+            super().retain()
+
+    def release(self) -> None:
+        if (self._retained):
+            return
+        self._symbols = None
+        self._parent = None
+        self._layout = None
+        self._values = None
+        if (len(Frame.__free) < Frame.__maxfree):
+            Frame.__free.append(self)
+
+
 factory.SYMTABLE = factory.SymbolTableFactory(declarations=list([
     (Type.MAIN, SymbolTable,),
     (Type.CLASS, Class,),
+    (Type.INSTANCE, Instance,),
     (Type.FUNCTION, Function,),
 ]))
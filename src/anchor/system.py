@@ -14,6 +14,17 @@ class Global(object):
             self.__debug: bool = False
             self.__debuglex: bool = False
             self.__debugyacc: bool = False
+            self.__optimize: bool = True
+            self.__stats: bool = False
+            self.__stream: bool = False
+            self.__lazy: bool = False
+            self.__hashcons: bool = False
+            self.__flat: bool = False
+            self.__backend: str = 'lalr'
+            self.__jobs: int = 0
+            self.__profilein: str = None
+            self.__profileout: str = None
+            self.__check: bool = False
             self.__inputstream: typing.TextIO = sys.stdin
             self.__outputstream: typing.TextIO = sys.stdout
             self.__errorstream: typing.TextIO = sys.stderr
@@ -44,6 +55,94 @@ class Global(object):
         def debugyacc(self, other: bool):
             self.__debugyacc = other
 
+        @property
+        def optimize(self) -> bool:
+            return self.__optimize
+
+        @optimize.setter
+        def optimize(self, other: bool):
+            self.__optimize = other
+
+        @property
+        def stats(self) -> bool:
+            return self.__stats
+
+        @stats.setter
+        def stats(self, other: bool):
+            self.__stats = other
+
+        @property
+        def stream(self) -> bool:
+            return self.__stream
+
+        @stream.setter
+        def stream(self, other: bool):
+            self.__stream = other
+
+        @property
+        def lazy(self) -> bool:
+            return self.__lazy
+
+        @lazy.setter
+        def lazy(self, other: bool):
+            self.__lazy = other
+
+        @property
+        def hashcons(self) -> bool:
+            return self.__hashcons
+
+        @hashcons.setter
+        def hashcons(self, other: bool):
+            self.__hashcons = other
+
+        @property
+        def flat(self) -> bool:
+            return self.__flat
+
+        @flat.setter
+        def flat(self, other: bool):
+            self.__flat = other
+
+        @property
+        def backend(self) -> str:
+            return self.__backend
+
+        @backend.setter
+        def backend(self, other: str):
+            self.__backend = other
+
+        @property
+        def jobs(self) -> int:
+            return self.__jobs
+
+        @jobs.setter
+        def jobs(self, other: int):
+            self.__jobs = other
+
+        @property
+        def profilein(self) -> str:
+            return self.__profilein
+
+        @profilein.setter
+        def profilein(self, other: str):
+            self.__profilein = other
+
+        @property
+        def profileout(self) -> str:
+            return self.__profileout
+
+        @profileout.setter
+        def profileout(self, other: str):
+            self.__profileout = other
+
+        @property
+        def check(self) -> bool:
+            return self.__check
+
+        @check.setter
+        def check(self, other: bool):
+            self.__check = other
+
         @property
         def inputstream(self) -> typing.TextIO:
             return self.__inputstream
@@ -115,6 +214,94 @@ class Global(object):
     def debugyacc(self, other: bool):
         self.__instance.debugyacc = other
 
+    @property
+    def optimize(self) -> bool:
+        return self.__instance.optimize
+
+    @optimize.setter
+    def optimize(self, other: bool):
+        self.__instance.optimize = other
+
+    @property
+    def stats(self) -> bool:
+        return self.__instance.stats
+
+    @stats.setter
+    def stats(self, other: bool):
+        self.__instance.stats = other
+
+    @property
+    def stream(self) -> bool:
+        return self.__instance.stream
+
+    @stream.setter
+    def stream(self, other: bool):
+        self.__instance.stream = other
+
+    @property
+    def lazy(self) -> bool:
+        return self.__instance.lazy
+
+    @lazy.setter
+    def lazy(self, other: bool):
+        self.__instance.lazy = other
+
+    @property
+    def hashcons(self) -> bool:
+        return self.__instance.hashcons
+
+    @hashcons.setter
+    def hashcons(self, other: bool):
+        self.__instance.hashcons = other
+
+    @property
+    def flat(self) -> bool:
+        return self.__instance.flat
+
+    @flat.setter
+    def flat(self, other: bool):
+        self.__instance.flat = other
+
+    @property
+    def backend(self) -> str:
+        return self.__instance.backend
+
+    @backend.setter
+    def backend(self, other: str):
+        self.__instance.backend = other
+
+    @property
+    def jobs(self) -> int:
+        return self.__instance.jobs
+
+    @jobs.setter
+    def jobs(self, other: int):
+        self.__instance.jobs = other
+
+    @property
+    def profilein(self) -> str:
+        return self.__instance.profilein
+
+    @profilein.setter
+    def profilein(self, other: str):
+        self.__instance.profilein = other
+
+    @property
+    def profileout(self) -> str:
+        return self.__instance.profileout
+
+    @profileout.setter
+    def profileout(self, other: str):
+        self.__instance.profileout = other
+
+    @property
+    def check(self) -> bool:
+        return self.__instance.check
+
+    @check.setter
+    def check(self, other: bool):
+        self.__instance.check = other
+
     @property
     def inputstream(self) -> typing.TextIO:
         return self.__instance.inputstream
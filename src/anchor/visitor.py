@@ -0,0 +1,284 @@
+import typing
+import anchor.ast as ast
+
+
+__all__: typing.List[str] = list([
+    'Visitor', 'Transformer', 'children', 'rebuild',
+])
+
+
+# Operator classes by the fields that hold their operands, a specialized
+# operator has the fields of its generic one
+BINARY: typing.Tuple[typing.Type] = tuple((
+    ast.Or, ast.And, ast.EqEqual, ast.NotEqual, ast.Less, ast.LessEqual,
+    ast.Greater, ast.GreaterEqual, ast.Plus, ast.Minus, ast.Star,
+    ast.DoubleStar, ast.Slash, ast.DoubleSlash, ast.Percent,
+))
+
+SPECIALIZED: typing.Tuple[typing.Type] = tuple(ast.SPECIALIZED.values())
+
+UNARY: typing.Tuple[typing.Type] = tuple((
+    ast.Not, ast.UPlus, ast.UMinus,
+))
+
+LITERAL: typing.Tuple[typing.Type] = tuple((
+    ast.Boolean, ast.Null, ast.Integer, ast.Float, ast.Complex, ast.String,
+))
+
+Children = typing.Callable[[ast.ASTNode], typing.List[ast.ASTNode]]
+Rebuild = typing.Callable[
+    [ast.ASTNode, typing.List[ast.ASTNode]], ast.ASTNode
+]
+
+# Children of every source node class, an absent optional child is None
+CHILDREN: typing.Dict[typing.Type, Children] = dict({
+    ast.Program: lambda node: list([node.block]),
+    ast.Block: lambda node: list(node.statements),
+    # A deferred body stays unparsed until it runs
+    ast.LazyBlock: lambda node: list(),
+    ast.Name: lambda node: list(),
+    ast.Assignment: lambda node: list([node.name, node.expression]),
+    ast.DotAssignment: lambda node: list([node.dotname, node.expression]),
+    ast.Break: lambda node: list(),
+    ast.Continue: lambda node: list(),
+    ast.Return: lambda node: list([node.expression]),
+    ast.Elif: lambda node: list([
+        node.expression, node.block, node.elseblock,
+    ]),
+    ast.If: lambda node: list([
+        node.expression, node.block, node.elseblock,
+    ]) + list(node.elifs),
+    ast.Switch: lambda node: list([
+        node.name, node.elseblock,
+    ]) + list(node.cases.values()),
+    ast.Iterate: lambda node: list([
+        node.iterable, node.variable, node.block, node.preheader,
+    ]),
+    ast.Loop: lambda node: list([
+        node.expression, node.block, node.preheader,
+    ]),
+    ast.Parameter: lambda node: list([node.name, node.typename]),
+    ast.Property: lambda node: list([node.name, node.typename]),
+    ast.FunctionDef: lambda node: list([
+        node.name, node.block, node.kwargs.get('returntype'),
+    ]) + list(node.parameters),
+    ast.MethodDef: lambda node: list([
+        node.name, node.block, node.kwargs.get('returntype'),
+    ]) + list(node.parameters),
+    ast.ClassDef: lambda node: list([node.name, node.block]),
+    ast.Tuple: lambda node: list(node.expressions or list()),
+    ast.List: lambda node: list(node.expressions or list()),
+    ast.Dict: lambda node: list([
+        expression for kvpair in node.kvpairs or list()
+        for expression in kvpair
+    ]),
+    ast.DotName: lambda node: list([node.expression, node.name]),
+    ast.Call: lambda node: list([node.expression]) + list(node.arguments),
+    ast.Let: lambda node: list([node.expression]) + list([
+        field for binding in node.bindings for field in binding
+    ]),
+})
+CHILDREN.update(dict({
+    kind: lambda node: list([node.left, node.right])
+    for kind in BINARY + SPECIALIZED
+}))
+CHILDREN.update(dict({
+    kind: lambda node: list([node.right]) for kind in UNARY
+}))
+CHILDREN.update(dict({
+    kind: lambda node: list() for kind in LITERAL
+}))
+
+# New node of the same class from an old node and its new children
+REBUILD: typing.Dict[typing.Type, Rebuild] = dict({
+    ast.Program: lambda node, children: ast.Program(children[0]),
+    ast.Block: lambda node, children: ast.Block(children),
+    ast.Assignment: lambda node, children: ast.Assignment(*children),
+    ast.DotAssignment: lambda node, children: ast.DotAssignment(*children),
+    ast.Return: lambda node, children: ast.Return(expression=children[0]),
+    ast.Elif: lambda node, children: ast.Elif(
+        children[0], children[1], elseblock=children[2],
+    ),
+    ast.If: lambda node, children: ast.If(
+        children[0], children[1],
+        elifs=children[3:], elseblock=children[2],
+    ),
+    ast.Switch: lambda node, children: ast.Switch(
+        children[0], dict(zip(node.cases, children[2:])),
+        elseblock=children[1],
+    ),
+    ast.Iterate: lambda node, children: ast.Iterate(
+        children[0], children[1], children[2], preheader=children[3],
+    ),
+    ast.Loop: lambda node, children: ast.Loop(
+        children[0], children[1], preheader=children[2],
+    ),
+    ast.Parameter: lambda node, children: ast.Parameter(*children),
+    ast.Property: lambda node, children: ast.Property(*children),
+    ast.FunctionDef: lambda node, children: ast.FunctionDef(
+        children[0], children[3:], children[1],
+        **dict(node.kwargs, returntype=children[2]),
+    ),
+    ast.MethodDef: lambda node, children: ast.MethodDef(
+        children[0], children[3:], children[1],
+        **dict(node.kwargs, returntype=children[2]),
+    ),
+    ast.ClassDef: lambda node, children: ast.ClassDef(
+        children[0], children[1], **node.kwargs,
+    ),
+    ast.Tuple: lambda node, children: ast.Tuple(expressions=children),
+    ast.List: lambda node, children: ast.List(expressions=children),
+    ast.Dict: lambda node, children: ast.Dict(
+        kvpairs=list(zip(children[0::2], children[1::2])),
+    ),
+    ast.DotName: lambda node, children: ast.DotName(*children),
+    ast.Call: lambda node, children: ast.Call(children[0], children[1:]),
+    ast.Let: lambda node, children: ast.Let(
+        list(zip(children[1::2], children[2::2])), children[0],
+    ),
+})
+REBUILD.update(dict({
+    kind: lambda node, children: type(node)(*children)
+    for kind in BINARY + SPECIALIZED
+}))
+REBUILD.update(dict({
+    kind: lambda node, children: type(node)(*children) for kind in UNARY
+}))
+
+
+def inherited(
+    table: typing.Dict[typing.Type, typing.Callable], kind: typing.Type
+) -> typing.Callable:
+    # A variant swapped in at run time has the fields of its source class
+    for base in kind.__mro__:
+        if (base in table):
+            table[kind] = table[base]
+            return table[kind]
+    return None
+
+
+def children(node: ast.ASTNode) -> typing.List[ast.ASTNode]:
+    function: Children = CHILDREN.get(type(node))
+    if (function is None):
+        function = inherited(CHILDREN, type(node))
+    if (function is None):
+        # Runtime values have no source form
+        raise TypeError(type(node).__name__)
+    return function(node)
+
+
+def rebuild(
+    node: ast.ASTNode, old: typing.List[ast.ASTNode],
+    new: typing.List[ast.ASTNode]
+) -> ast.ASTNode:
+    # An unchanged node is kept, so sharing survives a pass
+    if (all(child is previous for child, previous in zip(new, old))):
+        return node
+    function: Rebuild = REBUILD.get(type(node))
+    if (function is None):
+        function = inherited(REBUILD, type(node))
+    return function(node, new)
+
+
+class Visitor(object):
+
+    # Handler of each node class, per visitor class, found once
+    __tables: typing.Dict[
+        typing.Type, typing.Dict[typing.Type, typing.Callable]
+    ] = dict()
+
+    def handler(self, kind: typing.Type) -> typing.Callable:
+        table: typing.Dict[typing.Type, typing.Callable] = \
+            Visitor.__tables.setdefault(type(self), dict())
+        if (kind not in table):
+            # visit<name> of the nearest class along the resolution order
+            table[kind] = None
+            for base in kind.__mro__:
+                function: typing.Callable = getattr(
+                    type(self), 'visit' + base.__name__.lower(), None
+                )
+                if (function is not None):
+                    table[kind] = function
+                    break
+        return table[kind]
+
+    def children(self, node: ast.ASTNode) -> typing.List[ast.ASTNode]:
+        return children(node)
+
+    def visit(self, node: ast.ASTNode) -> typing.Any:
+        handler: typing.Callable = self.handler(type(node))
+        if (handler is None):
+            return self.generic(node)
+        return handler(self, node)
+
+    def generic(self, node: ast.ASTNode) -> typing.Any:
+        for child in self.children(node):
+            if (child is not None):
+                self.visit(child)
+        return None
+
+    def traverse(self, root: ast.ASTNode) -> None:
+        # Pre-order without recursion, a handler returns False to prune
+        handlers: typing.Dict[typing.Type, typing.Callable] = dict()
+        pending: typing.List[ast.ASTNode] = list([root])
+        while (pending):
+            node: ast.ASTNode = pending.pop()
+            if (node is None):
+                continue
+            kind: typing.Type = type(node)
+            if (kind not in handlers):
+                handlers[kind] = self.handler(kind)
+            handler: typing.Callable = handlers[kind]
+            if (handler is not None and handler(self, node) is False):
+                continue
+            nodes: typing.List[ast.ASTNode] = self.children(node)
+            nodes.reverse()
+            pending.extend(nodes)
+
+
+class Transformer(Visitor):
+
+    # Handlers get the node rebuilt from its transformed children, all of
+    # them, since the rebuild follows the layout of CHILDREN
+
+    def generic(self, node: ast.ASTNode) -> ast.ASTNode:
+        nodes: typing.List[ast.ASTNode] = children(node)
+        return rebuild(node, nodes, list([
+            self.visit(child) if (child is not None) else None
+            for child in nodes
+        ]))
+
+    def visit(self, node: ast.ASTNode) -> ast.ASTNode:
+        node = self.generic(node)
+        handler: typing.Callable = self.handler(type(node))
+        if (handler is None):
+            return node
+        return handler(self, node)
+
+    def transform(self, root: ast.ASTNode) -> ast.ASTNode:
+        # Post-order without recursion, a shared node is transformed once
+        handlers: typing.Dict[typing.Type, typing.Callable] = dict()
+        results: typing.Dict[int, ast.ASTNode] = dict()
+        pending: typing.List[typing.Tuple] = list([tuple((root, None,))])
+        while (pending):
+            node, nodes = pending.pop()
+            if (node is None or (nodes is None and id(node) in results)):
+                continue
+            if (nodes is None):
+                nodes = children(node)
+                pending.append(tuple((node, nodes,)))
+                pending.extend(list([
+                    tuple((child, None,)) for child in reversed(nodes)
+                ]))
+                continue
+            astnode: ast.ASTNode = rebuild(node, nodes, list([
+                results[id(child)] if (child is not None) else None
+                for child in nodes
+            ]))
+            kind: typing.Type = type(astnode)
+            if (kind not in handlers):
+                handlers[kind] = self.handler(kind)
+            if (handlers[kind] is not None):
+                astnode = handlers[kind](self, astnode)
+            results[id(node)] = astnode
+        return results.get(id(root)) if (root is not None) else None
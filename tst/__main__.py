@@ -0,0 +1,91 @@
+import os
+import sys
+import typing
+import difflib
+import subprocess
+
+import tst.tables as tables
+import tst.memory as memory
+
+
+__all__: typing.List[str] = list(['main',])
+
+
+DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+INPUT: str = os.path.join(DIRECTORY, 'data', 'input')
+EXPECTED: str = os.path.join(DIRECTORY, 'data', 'expected')
+SOURCE: str = os.path.join(os.path.dirname(DIRECTORY), 'src')
+
+# Every program must print the same in each way the tree can be loaded
+MODES: typing.List[typing.Tuple[str, ...]] = list([
+    tuple(),
+    tuple(('--no-optimize',)),
+    tuple(('--lazy',)),
+    tuple(('--hashcons',)),
+    tuple(('--flat',)),
+    tuple(('--backend', 'pratt',)),
+    tuple(('--stream',)),
+    tuple(('--check',)),
+])
+
+
+def run(path: str, mode: typing.Tuple[str, ...]) -> str:
+    # Only the output stream is compared, a program may end in an error
+    environment: typing.Dict[str, str] = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(list([
+        SOURCE, environment.get('PYTHONPATH', ''),
+    ]))
+    process: subprocess.CompletedProcess = subprocess.run(
+        list([sys.executable, '-m', 'anchor', *mode, path]),
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        env=environment, encoding='utf-8',
+    )
+    return process.stdout
+
+
+def test(name: str) -> typing.List[str]:
+    with open(os.path.join(EXPECTED, f'{name}.out'), 'r') as file:
+        expected: str = file.read()
+    failures: typing.List[str] = list()
+    for mode in MODES:
+        output: str = run(os.path.join(INPUT, f'{name}.an'), mode)
+        if (output == expected):
+            continue
+        failures.append(f'FAIL {name} {" ".join(mode)}'.rstrip())
+        failures.extend(list(difflib.unified_diff(
+            expected.splitlines(), output.splitlines(),
+            'expected', 'output', lineterm='', n=1,
+        ))[:20])
+    return failures
+
+
+def main() -> int:
+    names: typing.List[str] = sorted(list([
+        os.path.splitext(file)[0]
+        for file in os.listdir(INPUT) if (file.endswith('.an'))
+    ]))
+    failed: int = 0
+    for name in names:
+        failures: typing.List[str] = test(name)
+        if (failures):
+            failed += 1
+            print('\n'.join(failures))
+        else:
+            print(f'PASS {name}')
+    # The parse tables must match those of the original generator, and
+    # live frames may not grow with the instances a program keeps
+    checks: typing.List[typing.Tuple[str, typing.Callable]] = list([
+        tuple(('tables', tables.test,)), tuple(('memory', memory.test,)),
+    ])
+    for name, check in checks:
+        failures = check()
+        if (failures):
+            failed += 1
+            print('\n'.join(failures))
+        else:
+            print(f'PASS {name}')
+    print(f'{len(names) + len(checks) - failed} passed, {failed} failed')
+    return 1 if (failed) else 0
+
+
+sys.exit(main())
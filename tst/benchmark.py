@@ -0,0 +1,187 @@
+import os
+import sys
+import time
+import typing
+
+
+DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+SOURCE: str = os.path.join(os.path.dirname(DIRECTORY), 'src')
+sys.path.insert(0, SOURCE)
+
+import anchor.compile as compile
+import anchor.parse as parse
+import anchor.system as system
+import anchor.ply.yacc as yacc
+import tst.tables as grammars
+
+
+__all__: typing.List[str] = list(['BENCHMARKS', 'main',])
+
+
+# Runs of each measurement, the fastest is reported
+REPEAT: int = 3
+
+
+def best(function: typing.Callable[[], typing.Any]) -> float:
+    timings: typing.List[float] = list()
+    for _ in range(REPEAT):
+        start: float = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def evaluation(data: str) -> float:
+    # Parsed and optimized once, only the evaluation is timed
+    abstractsyntaxtree = compile.load(data)
+    return best(lambda: compile.run(abstractsyntaxtree))
+
+
+def parsing(data: str) -> float:
+    # Tables are built once, only the parse is timed
+    parser: parse.AnchorParser = parse.AnchorParser()
+    return best(lambda: parser.parse(data))
+
+
+def instances() -> typing.List[str]:
+    methods: str = ''.join(list([
+        f'    method m{index}(n) -> Integer\n'
+        f'    begin\n'
+        f'        return n + {index};\n'
+        f'    end\n'
+        for index in range(8)
+    ]))
+    lines: typing.List[str] = list()
+    for count in list([500, 2000, 8000]):
+        data: str = (
+            'class Point\n'
+            'begin\n'
+            '    property x;\n'
+            '    property y;\n'
+            '    method Point(a, b) -> Null\n'
+            '    begin\n'
+            '        x = a;\n'
+            '        y = b;\n'
+            '    end\n'
+            f'{methods}'
+            'end\n'
+            'i = 0;\n'
+            f'loop (i < {count})\n'
+            'begin\n'
+            '    p = Point(i, i);\n'
+            '    i = i + 1;\n'
+            'end\n'
+        )
+        lines.append(f'instances {count:>6} {evaluation(data):8.3f}s')
+    return lines
+
+
+def elifs() -> typing.List[str]:
+    lines: typing.List[str] = list()
+    for count in list([2500, 10000, 20000]):
+        branches: str = ''.join(list([
+            f'elif (x == {index}) then\n    y = {index};\n'
+            for index in range(1, count)
+        ]))
+        data: str = (
+            f'x = {count - 1};\n'
+            'if (x == 0) then\n'
+            '    y = 0;\n'
+            f'{branches}'
+            'else\n'
+            '    y = -1;\n'
+            'end\n'
+        )
+        lines.append(f'elifs {count:>10} {parsing(data):8.3f}s')
+    return lines
+
+
+def literals() -> typing.List[str]:
+    lines: typing.List[str] = list()
+    for count in list([25000, 100000]):
+        items: str = ', '.join(list([str(index) for index in range(count)]))
+        pairs: str = ', '.join(list([
+            f'{index}: {index}' for index in range(count)
+        ]))
+        for kind, data in list([
+            tuple(('list', f'x = [{items}];\n',)),
+            tuple(('tuple', f'x = ({items});\n',)),
+            tuple(('dict', f'x = {{{pairs}}};\n',)),
+        ]):
+            lines.append(f'{kind:<5} {count:>10} {parsing(data):8.3f}s')
+    return lines
+
+
+def tables() -> typing.List[str]:
+    lines: typing.List[str] = list()
+    for copies in list([0, 3, 10, 25]):
+        # Building the tables fills in the grammar, so each run gets its own
+        timings: typing.List[float] = list()
+        for _ in range(REPEAT):
+            grammar: yacc.Grammar = grammars.grammar(copies)
+            start: float = time.perf_counter()
+            table: yacc.LRTable = yacc.LRTable(grammar, yacc.NullLogger())
+            timings.append(time.perf_counter() - start)
+        states: int = len(table.lr_action)
+        lines.append(f'tables {states:>9} {min(timings):8.3f}s')
+    return lines
+
+
+def startup() -> typing.List[str]:
+    # Parse and every pass, with and without the passes, on many functions
+    lines: typing.List[str] = list()
+    for count in list([150, 300, 600]):
+        functions: typing.List[str] = list()
+        for index in range(count):
+            statements: str = ''.join(list([
+                f'    x{step} = x{step - 1} * {step} + a * b'
+                f' - (a + b) / {step + 1};\n'
+                for step in range(1, 19)
+            ]))
+            functions.append(
+                f'function f{index}(a, b) -> Integer\n'
+                'begin\n'
+                '    x0 = a + b;\n'
+                f'{statements}'
+                '    return x18;\n'
+                'end\n'
+            )
+        data: str = ''.join(functions) + 'print(f0(1, 2));\n'
+        timings: typing.List[float] = list()
+        for optimize in list([True, False]):
+            system.GLOBAL.optimize = optimize
+            try:
+                timings.append(best(lambda: compile.load(data)))
+            finally:
+                system.GLOBAL.optimize = True
+        lines.append(
+            f'startup {count:>8} {timings[0]:8.3f}s'
+            f' {timings[1]:8.3f}s unoptimized'
+        )
+    return lines
+
+
+# Each benchmark returns one line per measured size
+BENCHMARKS: typing.Dict[str, typing.Callable[[], typing.List[str]]] = dict({
+    'instances': instances,
+    'elifs': elifs,
+    'literals': literals,
+    'tables': tables,
+    'startup': startup,
+})
+
+
+def main(argv: typing.List[str]) -> int:
+    names: typing.List[str] = argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if (name not in BENCHMARKS):
+            print(f'unknown benchmark {name}, one of {", ".join(BENCHMARKS)}')
+            return 1
+    for name in names:
+        for line in BENCHMARKS[name]():
+            print(line, flush=True)
+    return 0
+
+
+if (__name__ == '__main__'):
+    sys.exit(main(sys.argv))
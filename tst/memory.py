@@ -0,0 +1,96 @@
+import gc
+import os
+import sys
+import typing
+
+
+DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+SOURCE: str = os.path.join(os.path.dirname(DIRECTORY), 'src')
+sys.path.insert(0, SOURCE)
+
+import anchor.ast as ast
+import anchor.compile as compile
+import anchor.symtable as symtable
+
+
+__all__: typing.List[str] = list(['live', 'measure', 'test',])
+
+
+# Instances kept alive by a run, far more frames than the pool holds
+SIZES: typing.List[int] = list([100, 400])
+
+# Each instance is made a few calls deep and stays reachable from the top
+PROGRAM: str = (
+    'class Node\n'
+    'begin\n'
+    '    property rest;\n'
+    '    method Node(tail) -> Null\n'
+    '    begin\n'
+    '        rest = tail;\n'
+    '    end\n'
+    'end\n'
+    'function grow(tail, depth) -> Node\n'
+    'begin\n'
+    '    if (depth > 0) then\n'
+    '        return grow(tail, depth - 1);\n'
+    '    end\n'
+    '    return Node(tail);\n'
+    'end\n'
+    'head = Null;\n'
+    'i = 0;\n'
+    'loop (i < COUNT)\n'
+    'begin\n'
+    '    head = grow(head, 5);\n'
+    '    i = i + 1;\n'
+    'end\n'
+)
+
+
+def live() -> typing.Dict[str, int]:
+    # Symbol tables by kind, instances apart since the program keeps them
+    gc.collect()
+    counts: typing.Dict[str, int] = dict({
+        'Frame': 0, 'SymbolTable': 0, 'Instance': 0,
+    })
+    for instance in gc.get_objects():
+        if (isinstance(instance, symtable.Frame)):
+            counts['Frame'] += 1
+        elif (isinstance(instance, ast.Instance)):
+            counts['Instance'] += 1
+        elif (isinstance(instance, symtable.SymbolTable)):
+            counts['SymbolTable'] += 1
+    return counts
+
+
+def measure(count: int) -> typing.Dict[str, int]:
+    # Counted while the main table, and every instance, is still alive
+    abstractsyntaxtree: ast.ASTNode = \
+        compile.load(PROGRAM.replace('COUNT', str(count)))
+    symboltable: symtable.SymbolTable = compile.main()
+    abstractsyntaxtree.evaluate(symboltable)
+    counts: typing.Dict[str, int] = live()
+    del symboltable
+    return counts
+
+
+def test() -> typing.List[str]:
+    failures: typing.List[str] = list()
+    results: typing.List[typing.Dict[str, int]] = list([
+        measure(count) for count in SIZES
+    ])
+    for count, counts in zip(SIZES, results):
+        if (counts['Instance'] < count):
+            failures.append(
+                f'  {counts["Instance"]} instances alive after {count}'
+            )
+    # Frames and tables may not grow with the instances that are alive
+    for kind in list(['Frame', 'SymbolTable']):
+        counts: typing.List[int] = list([result[kind] for result in results])
+        if (counts[-1] > counts[0]):
+            failures.append(f'  {kind} ' + ', '.join(list([
+                f'{number} with {count} instances'
+                for number, count in zip(counts, SIZES)
+            ])))
+    if (failures):
+        return list(['FAIL memory', *failures])
+    return list()
@@ -0,0 +1,120 @@
+import os
+import sys
+import types
+import typing
+import difflib
+import hashlib
+
+
+DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+SOURCE: str = os.path.join(os.path.dirname(DIRECTORY), 'src')
+sys.path.insert(0, SOURCE)
+
+import anchor.ply.yacc as yacc
+import anchor.parse as parse
+
+
+__all__: typing.List[str] = list(['grammar', 'dump', 'render', 'test',])
+
+
+# Generated with the table builder the grammar shipped with
+EXPECTED: str = os.path.join(DIRECTORY, 'data', 'tables.out')
+
+# Sizes of the enlarged grammars checked by digest only
+COPIES: typing.List[int] = list([3, 10])
+
+
+def grammar(copies: int = 0,
+            module: types.ModuleType = yacc) -> typing.Any:
+    # The grammar of the parser, with each copy renaming every nonterminal
+    # and reached from the start through a terminal of its own
+    parser: parse.AnchorParser = parse.AnchorParser(backend='pratt')
+    pdict: typing.Dict[str, typing.Any] = dict(list([
+        tuple((key, getattr(parser, key),)) for key in dir(parser)
+    ]))
+    pdict['__file__'] = parse.__file__
+    pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    pinfo.get_all()
+    pinfo.validate_all()
+    prefixes: typing.List[str] = list([
+        f'COPY{copy}' for copy in range(1, copies + 1)
+    ])
+    result = module.Grammar(list([*pinfo.tokens, *prefixes]))
+    for term, assoc, level in pinfo.preclist:
+        result.set_precedence(term, assoc, level)
+    names: typing.Set[str] = set(list([
+        gram[2] for _, gram in pinfo.grammar
+    ]))
+    start: str = pinfo.start or pinfo.grammar[0][1][2]
+    for copy in range(copies + 1):
+        for funcname, gram in pinfo.grammar:
+            file, line, prodname, syms = gram
+            if (copy):
+                prodname = f'{prodname}_{copy}'
+                syms = list([
+                    f'{symbol}_{copy}' if (symbol in names) else symbol
+                    for symbol in syms
+                ])
+            result.add_production(prodname, syms, funcname, file, line)
+    if (not copies):
+        result.set_start(start)
+        return result
+    result.add_production('tables', list([start]), 'p_tables', '', 0)
+    for copy, prefix in enumerate(prefixes, 1):
+        result.add_production(
+            'tables', list([prefix, f'{start}_{copy}']),
+            'p_tables', '', 0,
+        )
+    result.set_start('tables')
+    return result
+
+
+def dump(table: typing.Any) -> typing.List[str]:
+    # Negative actions reduce, positive ones shift and zero accepts
+    lines: typing.List[str] = list()
+    for number, production in enumerate(table.lr_productions):
+        lines.append(f'rule {number} {production}')
+    for state in sorted(table.lr_action):
+        actions: str = ' '.join(list([
+            f'{name}={action}'
+            for name, action in sorted(table.lr_action[state].items())
+        ]))
+        gotos: str = ' '.join(list([
+            f'{name}={target}'
+            for name, target in sorted(table.lr_goto.get(state, {}).items())
+        ]))
+        lines.append(f'state {state} {actions} | {gotos}'.rstrip())
+    for conflict in sorted(list([
+        ' '.join(list([str(part) for part in conflict]))
+        for conflict in table.sr_conflicts + table.rr_conflicts
+    ])):
+        lines.append(f'conflict {conflict}')
+    return lines
+
+
+def render(module: types.ModuleType = yacc) -> str:
+    lines: typing.List[str] = dump(
+        module.LRTable(grammar(0, module), module.NullLogger())
+    )
+    for copies in COPIES:
+        text: str = '\n'.join(dump(
+            module.LRTable(grammar(copies, module), module.NullLogger())
+        ))
+        digest: str = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        lines.append(f'copies {copies} {digest}')
+    return '\n'.join(lines) + '\n'
+
+
+def test() -> typing.List[str]:
+    with open(EXPECTED, 'r') as file:
+        expected: str = file.read()
+    output: str = render()
+    if (output == expected):
+        return list()
+    return list([
+        'FAIL tables',
+        *list(difflib.unified_diff(
+            expected.splitlines(), output.splitlines(),
+            'expected', 'output', lineterm='', n=1,
+        ))[:20],
+    ])